@@ -0,0 +1,4 @@
+"""Headless benchmarks for the simulation engine.
+
+Run ``python -m benchmarks.run`` from the repository root.
+"""
@@ -0,0 +1,100 @@
+"""Measure event dispatch: the handler table against the old if/elif chain.
+
+Example::
+
+    python -m benchmarks.event_dispatch --rounds 20000
+
+The lookup benchmark resolves event types that came last in the old chain,
+once by emulating its string comparisons and once through a dict. The
+throughput benchmark runs ``Simulator.handle_event`` on a generated world,
+narration included, for a mix of talk, wait and rest events.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from engine.events import Event
+from engine.simulator import Simulator
+from benchmarks.worldgen import default_tools, generate_world
+
+
+# Order of the branches in the old if/elif chain of Simulator.handle_event
+LEGACY_ORDER = [
+    "describe_location", "move", "grab", "drop", "eat", "attack_attempt",
+    "attack_hit", "attack_missed", "damage_applied", "talk", "talk_loud",
+    "scream", "inventory", "stats", "equip", "unequip", "analyze", "give",
+    "toggle_starvation", "open_connection", "close_connection", "npc_died",
+    "wait", "rest",
+]
+LATE_TYPES = ["npc_died", "wait", "rest"]
+
+
+def legacy_dispatch(event_type: str) -> int:
+    """Emulate the string comparisons the old chain made before matching."""
+    for index, candidate in enumerate(LEGACY_ORDER):
+        if event_type == candidate:
+            return index
+    return -1
+
+
+def bench_lookup(event_types: List[str], rounds: int) -> Tuple[float, float]:
+    """Lookups per second through the chain and through a dict."""
+    table = {name: i for i, name in enumerate(LEGACY_ORDER)}
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for event_type in event_types:
+            legacy_dispatch(event_type)
+    legacy = rounds * len(event_types) / (time.perf_counter() - start)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for event_type in event_types:
+            table.get(event_type, -1)
+    return legacy, rounds * len(event_types) / (time.perf_counter() - start)
+
+
+def bench_handle_event(rounds: int, seed: int) -> float:
+    """``handle_event`` calls per second."""
+    world = generate_world(10, 20, 0, seed=seed)
+    # Narration is rendered and thrown away, as a console would print it
+    sim = Simulator(world, player_id="npc_0", output=lambda text: None, seed=seed)
+    for tool in default_tools():
+        sim.register_tool(tool)
+    events = [
+        Event(event_type="talk", tick=0, actor_id="npc_0", payload={"content": "hi"}),
+        Event(event_type="wait", tick=0, actor_id="npc_0", payload={"ticks": 1}),
+        Event(event_type="rest", tick=0, actor_id="npc_1", payload={"ticks": 1, "healed": 0}),
+    ]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for event in events:
+            sim.handle_event(event)
+    return rounds * len(events) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    legacy, table = bench_lookup(LATE_TYPES, args.rounds)
+    handled = bench_handle_event(args.rounds, args.seed)
+    print(f"dispatch lookup (late event types): chain {legacy:,.0f}/s, table {table:,.0f}/s")
+    print(f"handle_event throughput: {handled:,.0f} events/s")
+    if args.output:
+        results: Dict[str, float] = {
+            "chain_lookups_per_s": round(legacy),
+            "table_lookups_per_s": round(table),
+            "handle_event_per_s": round(handled),
+        }
+        with open(args.output, "w") as f:
+            json.dump({"rounds": args.rounds, "seed": args.seed, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Compare world load time from the JSON directory and from a binary snapshot.
+
+The JSON directory is loaded sequentially, with a reader thread pool and
+with parsing in a process pool as well.
+
+Example::
+
+    python -m benchmarks.load --entities 1000 10000 100000 --output load.json
+
+Each size is a total entity count split between locations, NPCs and items
+in the 1:2:4 ratio ``benchmarks.run`` uses by default.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from engine.world_state import WorldState
+from engine.snapshot import save_snapshot, load_snapshot
+from benchmarks.worldgen import generate_world
+
+
+def split(entities: int) -> List[int]:
+    locations = max(1, entities // 7)
+    npcs = locations * 2
+    return [locations, npcs, entities - locations - npcs]
+
+
+def best_of(repeats: int, func) -> float:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+        # Free the loaded world outside the timed region
+        del result
+    return min(times)
+
+
+def load_json(data_dir: Path, workers: int = 0, processes: int = 0) -> WorldState:
+    world = WorldState(data_dir)
+    world.load(workers=workers, processes=processes)
+    return world
+
+
+def run_size(entities: int, repeats: int, seed: int, workers: int, processes: int) -> Dict[str, float]:
+    num_locations, num_npcs, num_items = split(entities)
+    world = generate_world(num_locations, num_npcs, num_items, seed=seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp) / "data"
+        snapshot = Path(tmp) / "world.snap"
+        world.write_json(data_dir)
+        save_seconds = best_of(1, lambda: save_snapshot(world, snapshot))
+        json_seconds = best_of(repeats, lambda: load_json(data_dir))
+        stages = load_json(data_dir).load_timings
+        threaded_seconds = best_of(repeats, lambda: load_json(data_dir, workers=workers))
+        process_seconds = best_of(repeats, lambda: load_json(data_dir, workers=workers, processes=processes))
+        snapshot_seconds = best_of(repeats, lambda: load_snapshot(snapshot))
+        snapshot_bytes = snapshot.stat().st_size
+    return {
+        "entities": entities,
+        "locations": num_locations,
+        "npcs": num_npcs,
+        "items": num_items,
+        "json_load_seconds": round(json_seconds, 4),
+        "json_stage_seconds": {stage: round(seconds, 4) for stage, seconds in stages.items()},
+        "json_threaded_load_seconds": round(threaded_seconds, 4),
+        "json_process_load_seconds": round(process_seconds, 4),
+        "snapshot_load_seconds": round(snapshot_seconds, 4),
+        "snapshot_save_seconds": round(save_seconds, 4),
+        "snapshot_bytes": snapshot_bytes,
+        "speedup": round(json_seconds / snapshot_seconds, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entities", nargs="+", type=int, default=[1000, 10000, 100000])
+    parser.add_argument("--repeats", type=int, default=3, help="Loads per format; the fastest is reported")
+    parser.add_argument("--workers", type=int, default=8, help="Reader threads for the parallel JSON loads")
+    parser.add_argument("--processes", type=int, default=4, help="Parser processes for the process-pool load")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = []
+    print(
+        f"{'entities':>9} {'json s':>8} {'threads s':>10} {'procs s':>8} "
+        f"{'snapshot s':>11} {'speedup':>8} {'snap MB':>8}"
+    )
+    for entities in args.entities:
+        result = run_size(entities, args.repeats, args.seed, args.workers, args.processes)
+        results.append(result)
+        print(
+            f"{entities:>9} {result['json_load_seconds']:>8.3f} {result['json_threaded_load_seconds']:>10.3f} "
+            f"{result['json_process_load_seconds']:>8.3f} {result['snapshot_load_seconds']:>11.3f} "
+            f"{result['speedup']:>7.1f}x {result['snapshot_bytes'] / 1e6:>8.2f}"
+        )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"seed": args.seed, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
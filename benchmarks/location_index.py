@@ -0,0 +1,71 @@
+"""Compare the NPC location index with a linear scan of every location.
+
+Example::
+
+    python -m benchmarks.location_index --locations 10 100 1000 5000
+
+Each map places two NPCs per location on average; ``--lookups`` random
+NPCs are located through ``WorldState.find_npc_location`` and, on a
+sample that shrinks as the map grows, by scanning every location's
+occupants the way lookups worked before the index.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from engine.world_state import WorldState
+from benchmarks.worldgen import generate_world
+
+
+def linear_find(world: WorldState, npc_id: str) -> Optional[str]:
+    for loc_id, loc in world.locations_state.items():
+        if npc_id in loc.occupants:
+            return loc_id
+    return None
+
+
+def per_lookup_ns(find, npc_ids) -> float:
+    start = time.perf_counter()
+    for npc_id in npc_ids:
+        find(npc_id)
+    return (time.perf_counter() - start) / len(npc_ids) * 1e9
+
+
+def run_size(num_locations: int, lookups: int, seed: int) -> Dict[str, float]:
+    world = generate_world(num_locations, 2 * num_locations, 0, seed=seed)
+    assert not world.check_location_index()
+    rng = random.Random(seed)
+    all_ids = list(world.npcs)
+    npc_ids = [rng.choice(all_ids) for _ in range(lookups)]
+    indexed = per_lookup_ns(world.find_npc_location, npc_ids)
+    # The linear scan grows with the map, so sample fewer lookups for it
+    linear = per_lookup_ns(lambda npc_id: linear_find(world, npc_id), npc_ids[: max(lookups // num_locations, 20)])
+    return {"locations": num_locations, "indexed_ns": round(indexed, 1), "linear_ns": round(linear, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--locations", nargs="+", type=int, default=[10, 100, 1000, 5000])
+    parser.add_argument("--lookups", type=int, default=20000, help="Indexed lookups per size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results: List[Dict[str, float]] = []
+    print(f"{'locations':>10} {'indexed ns':>12} {'linear ns':>12}")
+    for num_locations in args.locations:
+        result = run_size(num_locations, args.lookups, args.seed)
+        results.append(result)
+        print(f"{num_locations:>10} {result['indexed_ns']:>12.1f} {result['linear_ns']:>12.1f}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"seed": args.seed, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Measure memory per entity for the engine's data models.
+
+Example::
+
+    python -m benchmarks.memory --count 20000
+
+Each model is rebuilt ``count`` times from plain JSON data while tracemalloc
+is running, three ways:
+
+* ``slotted``: the engine's classes;
+* ``unslotted``: a plain ``__dict__`` dataclass with the same fields that
+  runs the model's ``__post_init__``, so it holds the same containers
+  (ordered sets, fixed-schema mappings) and isolates the cost of slots;
+* ``plain``: the same dataclass without ``__post_init__``, holding the
+  ordinary lists and dicts the models had before they were slotted.
+
+Both savings columns compare with ``slotted``; a negative figure is a
+regression and is reported as such.
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from engine.data_models import NPC, LocationState, ItemInstance, to_dict
+from engine.events import Event
+from benchmarks.worldgen import generate_world
+
+
+def _legacy(cls: type, same_containers: bool) -> type:
+    """Plain ``__dict__`` dataclass with the same fields as ``cls``.
+
+    With ``same_containers`` it also runs ``cls.__post_init__``, which
+    converts the fields to the containers the engine uses.
+    """
+    specs = []
+    for f in dataclasses.fields(cls):
+        if not f.init:
+            continue
+        if f.default_factory is not dataclasses.MISSING:
+            spec = dataclasses.field(default_factory=f.default_factory)
+        elif f.default is not dataclasses.MISSING:
+            spec = dataclasses.field(default=f.default)
+        else:
+            spec = dataclasses.field()
+        specs.append((f.name, f.type, spec))
+    namespace = {}
+    if same_containers and hasattr(cls, "__post_init__"):
+        namespace["__post_init__"] = cls.__post_init__
+    return dataclasses.make_dataclass(f"Legacy{cls.__name__}", specs, namespace=namespace)
+
+
+def bytes_per_entity(build: Callable[[Dict[str, Any]], Any], samples: List[Dict[str, Any]], count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    # Keep everything alive until the measurement is taken
+    kept = [build(samples[i % len(samples)]) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding the entities is not part of their cost
+    overhead = kept.__sizeof__()
+    del kept
+    return (after - before - overhead) / count
+
+
+def _plain(data: Dict[str, Any]) -> Dict[str, Any]:
+    # Fresh nested containers per entity, as loading from disk would produce
+    return json.loads(json.dumps(data))
+
+
+def _event_samples(world) -> List[Dict[str, Any]]:
+    samples = []
+    for npc_id in list(world.npcs)[:100]:
+        samples.append({"event_type": "move", "tick": 1, "actor_id": npc_id, "target_ids": [], "payload": {"to_loc": "loc_0"}})
+        samples.append({"event_type": "talk", "tick": 2, "actor_id": npc_id, "target_ids": [], "payload": {"content": "hi"}})
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=20000, help="Entities built per model")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    world = generate_world(200, 400, 800, seed=args.seed)
+    models = [
+        (NPC, [to_dict(npc) for npc in world.npcs.values()]),
+        (LocationState, [to_dict(loc) for loc in world.locations_state.values()]),
+        (ItemInstance, [to_dict(item) for item in world.item_instances.values()]),
+        (Event, _event_samples(world)),
+    ]
+
+    results = []
+    print(f"{'model':<16} {'slotted B':>10} {'unslotted B':>12} {'saved':>7} {'plain B':>10} {'saved':>7}")
+    for cls, samples in models:
+        row: Dict[str, Any] = {"model": cls.__name__}
+        for name, build in (
+            ("slotted", cls),
+            ("unslotted", _legacy(cls, same_containers=True)),
+            ("plain", _legacy(cls, same_containers=False)),
+        ):
+            row[f"{name}_bytes"] = round(bytes_per_entity(lambda data: build(**_plain(data)), samples, args.count), 1)
+        for baseline in ("unslotted", "plain"):
+            row[f"saved_vs_{baseline}"] = round(1 - row["slotted_bytes"] / row[f"{baseline}_bytes"], 3)
+        results.append(row)
+        regressions = [baseline for baseline in ("unslotted", "plain") if row[f"saved_vs_{baseline}"] < 0]
+        print(
+            f"{cls.__name__:<16} {row['slotted_bytes']:>10.0f} {row['unslotted_bytes']:>12.0f} "
+            f"{row['saved_vs_unslotted']:>6.0%} {row['plain_bytes']:>10.0f} {row['saved_vs_plain']:>6.0%}"
+            + (f"  REGRESSION vs {', '.join(regressions)}" if regressions else "")
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"count": args.count, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
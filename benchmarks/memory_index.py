@@ -0,0 +1,99 @@
+"""Compare BM25 memory search with a linear scan of the memory list.
+
+Example::
+
+    python -m benchmarks.memory_index --memories 100 1000 10000 50000
+
+One generated NPC is given ``memories`` long-term memories through
+``WorldState.add_memory``. The table shows the indexed query time, a scan
+that counts shared words in every memory, the time to build the index from
+scratch and the time to load the world back with its saved index.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from engine.memory_index import memory_text, tokenize
+from engine.world_state import WorldState
+from benchmarks.worldgen import generate_memories, generate_queries, generate_world
+
+
+def linear_search(memories: Sequence[dict], query: str, n: int = 5):
+    # Count shared words, the obvious scan without an index
+    terms = set(tokenize(query))
+    scored = []
+    for position, memory in enumerate(memories):
+        hits = sum(1 for token in tokenize(memory_text(memory)) if token in terms)
+        if hits:
+            scored.append((hits, position))
+    scored.sort(reverse=True)
+    return scored[:n]
+
+
+def per_query_us(search, queries) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        search(query)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def run_size(size: int, num_queries: int, seed: int) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        world = generate_world(1, 1, 0, seed=seed, data_dir=Path(tmp))
+        for memory in generate_memories(size, seed):
+            world.add_memory("npc_0", **memory)
+        memories = world.npcs["npc_0"].memories
+        queries = generate_queries(num_queries, seed)
+        start = time.perf_counter()
+        world.memory_indexes.clear()
+        world.memory_index("npc_0")
+        build = (time.perf_counter() - start) * 1e3
+        indexed = per_query_us(lambda query: world.search_memories("npc_0", query, now=size), queries)
+        linear = per_query_us(lambda query: linear_search(memories, query), queries[:20])
+        world.write_json()
+        start = time.perf_counter()
+        loaded = WorldState(Path(tmp))
+        loaded.load()
+        loaded.memory_index("npc_0")
+        load = (time.perf_counter() - start) * 1e3
+        assert loaded.search_memories("npc_0", queries[0], now=size) == world.search_memories(
+            "npc_0", queries[0], now=size
+        )
+    return {
+        "memories": size,
+        "indexed_us": round(indexed, 1),
+        "linear_us": round(linear, 1),
+        "build_ms": round(build, 1),
+        "load_ms": round(load, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--memories", nargs="+", type=int, default=[100, 1000, 10000, 50000])
+    parser.add_argument("--queries", type=int, default=200, help="Indexed queries per size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results: List[Dict[str, float]] = []
+    print(f"{'memories':>9} {'indexed us':>11} {'linear us':>11} {'build ms':>9} {'load ms':>8}")
+    for size in args.memories:
+        row = run_size(size, args.queries, args.seed)
+        results.append(row)
+        print(
+            f"{size:>9} {row['indexed_us']:>11.1f} {row['linear_us']:>11.1f} "
+            f"{row['build_ms']:>9.1f} {row['load_ms']:>8.1f}"
+        )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"seed": args.seed, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
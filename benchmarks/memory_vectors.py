@@ -0,0 +1,88 @@
+"""Measure semantic memory search on both ``MemoryVectors`` backends.
+
+Example::
+
+    python -m benchmarks.memory_vectors --memories 1000 10000 50000
+
+For every bank size the table shows the time to embed the memories, the
+time per query, the time to open the saved ``.npy`` bank memory-mapped and
+the time per query on the mapped bank. The NumPy backend is skipped when
+NumPy is not installed.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from engine.memory_vectors import MemoryVectors, np
+from benchmarks.worldgen import generate_memories, generate_queries
+
+
+def per_query_ms(bank: MemoryVectors, queries) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        bank.search(query, 5)
+    return (time.perf_counter() - start) / len(queries) * 1e3
+
+
+def run_size(size: int, num_queries: int, seed: int) -> List[Dict[str, object]]:
+    memories = generate_memories(size, seed)
+    queries = generate_queries(num_queries, seed)
+    rows = []
+    for use_numpy in [False, True] if np is not None else [False]:
+        # The pure Python scan is slow on large banks; sample fewer queries for it
+        sample = queries if use_numpy else queries[: max(2, num_queries * 1000 // size)]
+        start = time.perf_counter()
+        bank = MemoryVectors.build(memories, use_numpy=use_numpy)
+        embed = (time.perf_counter() - start) * 1e3
+        query = per_query_ms(bank, sample)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bank.npy"
+            path.write_bytes(bank.to_npy())
+            start = time.perf_counter()
+            mapped = MemoryVectors.open(path, bank.meta(), use_mmap=True, use_numpy=use_numpy)
+            opened = (time.perf_counter() - start) * 1e3
+            mapped_query = per_query_ms(mapped, sample)
+            assert mapped.search(queries[0]) == bank.search(queries[0])
+            del mapped
+        rows.append(
+            {
+                "memories": size,
+                "backend": "numpy" if use_numpy else "python",
+                "embed_ms": round(embed, 1),
+                "query_ms": round(query, 3),
+                "open_ms": round(opened, 3),
+                "mapped_query_ms": round(mapped_query, 3),
+            }
+        )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--memories", nargs="+", type=int, default=[1000, 10000, 50000])
+    parser.add_argument("--queries", type=int, default=50, help="Queries per size on the NumPy backend")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results: List[Dict[str, object]] = []
+    print(f"{'memories':>9} {'backend':>8} {'embed ms':>9} {'query ms':>9} {'open ms':>8} {'mapped q ms':>12}")
+    for size in args.memories:
+        for row in run_size(size, args.queries, args.seed):
+            results.append(row)
+            print(
+                f"{size:>9} {row['backend']:>8} {row['embed_ms']:>9.1f} {row['query_ms']:>9.3f} "
+                f"{row['open_ms']:>8.3f} {row['mapped_query_ms']:>12.3f}"
+            )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"seed": args.seed, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
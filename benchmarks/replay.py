@@ -0,0 +1,97 @@
+"""Compare a journalled live run with replaying its journal.
+
+Example::
+
+    python -m benchmarks.replay --scale 1000:2000:4000 --ticks 500 --output replay.json
+
+The live run ticks a generated world with the journal enabled; replay then
+rebuilds the final tick from the nearest snapshot and from the first one,
+and both worlds are checked against the live world.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from engine.data_models import to_dict
+from engine.journal import SNAPSHOT, Replayer
+from engine.simulator import Simulator
+from engine.world_state import WorldState
+from benchmarks.run import parse_scale
+from benchmarks.worldgen import generate_world, default_tools
+
+_SECTIONS = ("npcs", "locations_static", "locations_state", "item_blueprints", "item_instances")
+
+
+def world_dump(world: WorldState) -> Dict[str, Any]:
+    return {attr: {key: to_dict(value) for key, value in getattr(world, attr).items()} for attr in _SECTIONS}
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def run(scale, ticks: int, snapshot_interval: int, seed: int) -> Dict[str, Any]:
+    num_locations, num_npcs, num_items = scale
+    world = generate_world(num_locations, num_npcs, num_items, seed=seed)
+    sim = Simulator(world, output=None, seed=seed)
+    for tool in default_tools():
+        sim.register_tool(tool)
+    with tempfile.TemporaryDirectory() as tmp:
+        sim.enable_journal(Path(tmp), snapshot_interval=snapshot_interval)
+        start = time.perf_counter()
+        for _ in range(ticks):
+            sim.tick()
+        live_seconds = time.perf_counter() - start
+        sim.disable_journal()
+        expected = world_dump(world)
+
+        replayer = Replayer(Path(tmp))
+        nearest, nearest_seconds = timed(lambda: replayer.world_at(ticks))
+        # Replaying the whole run from the first snapshot needs a journal without later ones
+        replayer.records = [r for i, r in enumerate(replayer.records) if i == 0 or r[0] != SNAPSHOT]
+        full, full_seconds = timed(lambda: replayer.world_at(ticks))
+        journal_bytes = sum(path.stat().st_size for path in Path(tmp).iterdir())
+    return {
+        "locations": num_locations,
+        "npcs": num_npcs,
+        "items": num_items,
+        "ticks": ticks,
+        "events": sim.events_handled,
+        "live_seconds": round(live_seconds, 4),
+        "replay_nearest_seconds": round(nearest_seconds, 4),
+        "replay_full_seconds": round(full_seconds, 4),
+        "full_speedup": round(live_seconds / full_seconds, 1),
+        "journal_bytes": journal_bytes,
+        "identical": world_dump(nearest) == expected and world_dump(full) == expected,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=parse_scale, default=parse_scale("1000:2000:4000"))
+    parser.add_argument("--ticks", type=int, default=300)
+    parser.add_argument("--snapshot-interval", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write the result as JSON to this file")
+    args = parser.parse_args()
+
+    result = run(args.scale, args.ticks, args.snapshot_interval, args.seed)
+    print(
+        f"live {result['live_seconds']:.3f}s  replay from nearest snapshot {result['replay_nearest_seconds']:.3f}s  "
+        f"full replay {result['replay_full_seconds']:.3f}s ({result['full_speedup']}x)  "
+        f"{result['events']} events  identical={result['identical']}"
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Run the simulator headless on generated worlds of several sizes.
+
+Example::
+
+    python -m benchmarks.run --scales 100:200:400 1000:2000:4000 --ticks 200 --output bench.json
+
+Each scale is ``locations:npcs:items``. One child process generates the
+world and writes it to a temporary directory; a freshly spawned process
+then loads and ticks it. Peak RSS is read in that second process, so it
+covers the interpreter, loading and ticking but not world generation.
+``base MB`` is its peak before loading started.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+from engine.world_state import WorldState
+from engine.simulator import Simulator
+from benchmarks.worldgen import generate_world, write_world, default_tools
+
+
+DEFAULT_SCALES = ["100:200:400", "1000:2000:4000", "5000:10000:20000"]
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def write_scale(num_locations: int, num_npcs: int, num_items: int, seed: int, data_dir: Path):
+    write_world(generate_world(num_locations, num_npcs, num_items, seed=seed), data_dir)
+
+
+def run_scale(data_dir: Path, ticks: int, seed: int, vitals: bool = False) -> Dict[str, float]:
+    """Load the world written to ``data_dir`` and tick it; meant for a fresh process."""
+    base_rss = peak_rss_mb()
+    start = time.perf_counter()
+    world = WorldState(data_dir)
+    world.load()
+    if vitals:
+        world.enable_vitals()
+    load_seconds = time.perf_counter() - start
+
+    sim = Simulator(world, output=None, seed=seed)
+    for tool in default_tools():
+        sim.register_tool(tool)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        sim.tick()
+    elapsed = time.perf_counter() - start
+    return {
+        "ticks": ticks,
+        "vitals": vitals,
+        "load_seconds": round(load_seconds, 4),
+        "ticks_per_sec": round(ticks / elapsed, 2),
+        "events_per_sec": round(sim.events_handled / elapsed, 2),
+        "events": sim.events_handled,
+        "base_rss_mb": round(base_rss, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def parse_scale(text: str) -> List[int]:
+    parts = [int(part) for part in text.split(":")]
+    if len(parts) != 3:
+        raise argparse.ArgumentTypeError(f"expected locations:npcs:items, got {text!r}")
+    return parts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", nargs="+", type=parse_scale, default=[parse_scale(s) for s in DEFAULT_SCALES])
+    parser.add_argument("--ticks", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--vitals", action="store_true", help="Keep NPC vitals in a WorldState.vitals table")
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = []
+    print(
+        f"{'locations':>10} {'npcs':>8} {'items':>8} {'load s':>8} {'ticks/s':>10} {'events/s':>12} "
+        f"{'base MB':>8} {'rss MB':>8}"
+    )
+    # Spawned rather than forked, so no memory is inherited from this process
+    spawn = multiprocessing.get_context("spawn")
+    for num_locations, num_npcs, num_items in args.scales:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = Path(tmp)
+            with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as pool:
+                pool.submit(write_scale, num_locations, num_npcs, num_items, args.seed, data_dir).result()
+            with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as pool:
+                measured = pool.submit(run_scale, data_dir, args.ticks, args.seed, args.vitals).result()
+        result = {"locations": num_locations, "npcs": num_npcs, "items": num_items, **measured}
+        results.append(result)
+        print(
+            f"{result['locations']:>10} {result['npcs']:>8} {result['items']:>8} "
+            f"{result['load_seconds']:>8.3f} {result['ticks_per_sec']:>10.1f} "
+            f"{result['events_per_sec']:>12.1f} {result['base_rss_mb']:>8.1f} {result['peak_rss_mb']:>8.1f}"
+        )
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Measure sound propagation cost against map size.
+
+Example::
+
+    python -m benchmarks.sound --locations 1000 10000 100000 --output sound.json
+
+For every map size and noise level, ``--sources`` random locations make a
+sound on a cold cache, again on the warm cache, and once more after a door
+near each source has been toggled. The bounded search visits about the
+same number of locations at every size; what growth remains in the cold
+cost comes from memory locality, not from the search.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from engine.data_models import ConnectionState
+from engine.sound import NOISE_LEVELS
+from benchmarks.worldgen import generate_world
+
+
+def per_call_us(func, args_list) -> float:
+    start = time.perf_counter()
+    for args in args_list:
+        func(*args)
+    return (time.perf_counter() - start) / len(args_list) * 1e6
+
+
+def run_size(num_locations: int, sources: int, seed: int, closed_door_ratio: float) -> Dict[str, object]:
+    world = generate_world(num_locations, 0, 0, seed=seed, closed_door_ratio=closed_door_ratio)
+    rng = random.Random(seed)
+    loc_ids = list(world.locations_state)
+    picks = [rng.choice(loc_ids) for _ in range(sources)]
+    # Settle the collector so building the map is not billed to the first level
+    gc.collect()
+    result: Dict[str, object] = {"locations": num_locations}
+    for level, intensity in NOISE_LEVELS.items():
+        world.sound.clear()
+        calls = [(loc_id, intensity) for loc_id in picks]
+        cold = per_call_us(world.sound.propagate, calls)
+        warm = per_call_us(world.sound.propagate, calls)
+        reached = sum(len(world.sound.propagate(*call)) for call in calls) / len(calls)
+        # Toggle one connection next to every source, as open/close_connection do
+        for loc_id in picks:
+            neighbours = list(world.locations_static[loc_id].hex_connections.values())
+            if not neighbours:
+                continue
+            neighbour = neighbours[0]
+            status = world.locations_state[loc_id].connections_state.get(neighbour, {}).get("status", "open")
+            status = "closed" if status == "open" else "open"
+            world.locations_state[loc_id].connections_state.setdefault(neighbour, ConnectionState())["status"] = status
+            world.locations_state[neighbour].connections_state.setdefault(loc_id, ConnectionState())["status"] = status
+            world.sound.invalidate(loc_id, neighbour)
+        after_door = per_call_us(world.sound.propagate, calls)
+        result[level] = {
+            "cold_us": round(cold, 2),
+            "warm_us": round(warm, 2),
+            "after_door_us": round(after_door, 2),
+            "locations_reached": round(reached, 2),
+        }
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--locations", nargs="+", type=int, default=[1000, 10000, 100000])
+    parser.add_argument("--sources", type=int, default=2000, help="Sound sources sampled per size")
+    parser.add_argument("--closed-door-ratio", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results: List[Dict[str, object]] = []
+    print(f"{'locations':>10} {'level':>7} {'cold us':>9} {'warm us':>9} {'door us':>9} {'reached':>8}")
+    for num_locations in args.locations:
+        result = run_size(num_locations, args.sources, args.seed, args.closed_door_ratio)
+        results.append(result)
+        for level in NOISE_LEVELS:
+            row = result[level]
+            print(
+                f"{num_locations:>10} {level:>7} {row['cold_us']:>9.2f} {row['warm_us']:>9.2f} "
+                f"{row['after_door_us']:>9.2f} {row['locations_reached']:>8.2f}"
+            )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"seed": args.seed, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
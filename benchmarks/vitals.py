@@ -0,0 +1,89 @@
+"""Compare the NPC vitals backends: plain objects, array columns and NumPy.
+
+Example::
+
+    python -m benchmarks.vitals --npcs 1000 10000 50000
+
+For every population the same world answers ``hunger_sweep``,
+``ready_actors`` and a bulk damage pass on each backend; the answers are
+checked against the object backend before anything is timed. The NumPy
+row is skipped when NumPy is not installed.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.worldgen import generate_world
+
+
+def per_call_ms(func, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def run_size(num_npcs: int, repeats: int, seed: int) -> List[Dict[str, object]]:
+    world = generate_world(max(num_npcs // 10, 1), num_npcs, 0, seed=seed)
+    rng = random.Random(seed)
+    for npc in world.npcs.values():
+        npc.next_available_tick = rng.randint(0, 10)
+    npc_ids = list(world.npcs)
+    expected = (world.hunger_sweep(30), world.ready_actors(5))
+    rows = []
+    for label, use_numpy in (("objects", None), ("array", False), ("numpy", True)):
+        world.disable_vitals()
+        if use_numpy is not None:
+            vitals = world.enable_vitals(use_numpy=use_numpy)
+            if use_numpy and not vitals.use_numpy:
+                continue
+        assert (world.hunger_sweep(30), world.ready_actors(5)) == expected
+        sweep = per_call_ms(lambda: world.hunger_sweep(30), repeats)
+        ready = per_call_ms(lambda: world.ready_actors(5), repeats)
+        if world.vitals is not None:
+            damage = per_call_ms(lambda: world.vitals.apply_damage(npc_ids, [0] * num_npcs), repeats)
+        else:
+            npcs = list(world.npcs.values())
+            damage = per_call_ms(lambda: [setattr(npc, "hp", max(npc.hp - 0, 0)) for npc in npcs], repeats)
+        rows.append(
+            {
+                "npcs": num_npcs,
+                "backend": label,
+                "sweep_ms": round(sweep, 3),
+                "ready_ms": round(ready, 3),
+                "damage_ms": round(damage, 3),
+            }
+        )
+    world.disable_vitals()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--npcs", nargs="+", type=int, default=[1000, 10000, 50000])
+    parser.add_argument("--repeats", type=int, default=20, help="Calls timed per query")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results: List[Dict[str, object]] = []
+    print(f"{'npcs':>8} {'backend':>8} {'sweep ms':>10} {'ready ms':>10} {'damage ms':>10}")
+    for num_npcs in args.npcs:
+        for row in run_size(num_npcs, args.repeats, args.seed):
+            results.append(row)
+            print(
+                f"{num_npcs:>8} {row['backend']:>8} {row['sweep_ms']:>10.2f} "
+                f"{row['ready_ms']:>10.2f} {row['damage_ms']:>10.2f}"
+            )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"seed": args.seed, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
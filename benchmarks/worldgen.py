@@ -0,0 +1,175 @@
+"""Procedurally generated worlds of arbitrary size for benchmarking."""
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import List
+
+from engine.world_state import WorldState
+from engine.data_models import (
+    NPC,
+    ConnectionState,
+    LocationStatic,
+    LocationState,
+    ItemBlueprint,
+    ItemInstance,
+)
+from engine.tools import __all__ as _TOOL_NAMES
+from engine import tools as _tools
+from engine.tools.open_door import OpenDoorTool
+from engine.tools.close_door import CloseDoorTool
+from engine.tools.base import Tool
+
+
+# Hex neighbours on an odd-r offset grid, keyed by direction name
+_EVEN_ROW = {
+    "east": (1, 0), "west": (-1, 0),
+    "north_east": (0, -1), "north_west": (-1, -1),
+    "south_east": (0, 1), "south_west": (-1, 1),
+}
+_ODD_ROW = {
+    "east": (1, 0), "west": (-1, 0),
+    "north_east": (1, -1), "north_west": (0, -1),
+    "south_east": (1, 1), "south_west": (0, 1),
+}
+_OPPOSITE = {
+    "east": "west", "west": "east",
+    "north_east": "south_west", "south_west": "north_east",
+    "north_west": "south_east", "south_east": "north_west",
+}
+_SLOTS = ["main_hand", "off_hand", "head", "torso", "legs"]
+_PLACES = ["square", "alley", "market", "garden", "yard", "hall", "bridge", "dock"]
+# Memory words fall off like natural language: a few common words, a long tail
+_WORDS = [f"word{i}" for i in range(5000)]
+_WORD_WEIGHTS = [1 / (i + 1) for i in range(len(_WORDS))]
+
+
+def _catalog(rng: random.Random) -> List[ItemBlueprint]:
+    blueprints = []
+    for i in range(8):
+        blueprints.append(
+            ItemBlueprint(
+                id=f"weapon_{i}",
+                name=f"Weapon {i}",
+                weight=rng.randint(1, 6),
+                damage_dice=rng.choice(["1d4", "1d6", "1d8", "2d4"]),
+                damage_type=rng.choice(["slashing", "piercing", "bludgeoning"]),
+                skill_tag="skill_swords",
+                properties=rng.choice([[], ["finesse"]]),
+            )
+        )
+    for i in range(4):
+        blueprints.append(
+            ItemBlueprint(id=f"armour_{i}", name=f"Armour {i}", weight=5, armour_rating=i + 1)
+        )
+    for i in range(4):
+        blueprints.append(
+            ItemBlueprint(id=f"food_{i}", name=f"Food {i}", weight=1, damage_dice="1d1", properties=["food"])
+        )
+    return blueprints
+
+
+def generate_world(
+    num_locations: int,
+    num_npcs: int,
+    num_items: int,
+    seed: int = 0,
+    closed_door_ratio: float = 0.1,
+    data_dir: Path = Path("data"),
+) -> WorldState:
+    """Build a hex-grid world in memory.
+
+    Locations form a roughly square grid where each cell links to up to six
+    neighbours; ``closed_door_ratio`` of the links start closed. NPCs and
+    items are scattered at random, and some items start in NPC inventories.
+    """
+    rng = random.Random(seed)
+    world = WorldState(data_dir)
+    width = max(1, int(num_locations ** 0.5))
+    loc_ids = [f"loc_{i}" for i in range(num_locations)]
+    for i, loc_id in enumerate(loc_ids):
+        world.locations_static[loc_id] = LocationStatic(
+            id=loc_id, description=f"A {rng.choice(_PLACES)} numbered {i}."
+        )
+        world.locations_state[loc_id] = LocationState(id=loc_id)
+    for i, loc_id in enumerate(loc_ids):
+        col, row = i % width, i // width
+        offsets = _ODD_ROW if row % 2 else _EVEN_ROW
+        for direction, (dc, dr) in offsets.items():
+            n_col, n_row = col + dc, row + dr
+            n_index = n_row * width + n_col
+            if not (0 <= n_col < width and 0 <= n_index < num_locations) or n_index <= i:
+                continue
+            neighbour = loc_ids[n_index]
+            world.locations_static[loc_id].hex_connections[direction] = neighbour
+            world.locations_static[neighbour].hex_connections[_OPPOSITE[direction]] = loc_id
+            if rng.random() < closed_door_ratio:
+                world.locations_state[loc_id].connections_state[neighbour] = ConnectionState(status="closed")
+                world.locations_state[neighbour].connections_state[loc_id] = ConnectionState(status="closed")
+
+    for blueprint in _catalog(rng):
+        world.item_blueprints[blueprint.id] = blueprint
+    blueprint_ids = list(world.item_blueprints)
+
+    for i in range(num_npcs):
+        attributes = {
+            "strength": rng.randint(8, 16),
+            "dexterity": rng.randint(8, 16),
+            "constitution": rng.randint(8, 16),
+        }
+        npc = NPC(
+            id=f"npc_{i}",
+            name=f"Villager {i}",
+            slots={slot: None for slot in _SLOTS},
+            hp=attributes["constitution"],
+            attributes=attributes,
+            skills={"skill_swords": rng.choice(["novice", "proficient", "expert"])},
+            last_meal_tick=-rng.randint(0, 30),
+        )
+        world.npcs[npc.id] = npc
+        world.locations_state[rng.choice(loc_ids)].occupants.append(npc.id)
+
+    npc_ids = list(world.npcs)
+    for i in range(num_items):
+        item = ItemInstance(id=f"item_{i}", blueprint_id=rng.choice(blueprint_ids))
+        world.item_instances[item.id] = item
+        if npc_ids and rng.random() < 0.3:
+            owner = world.npcs[rng.choice(npc_ids)]
+            owner.inventory.append(item.id)
+            item.owner_id = owner.id
+        else:
+            loc_id = rng.choice(loc_ids)
+            world.locations_state[loc_id].items.append(item.id)
+            item.current_location = loc_id
+    world.register_ids()
+    world.rebuild_location_index()
+    return world
+
+
+def generate_memories(count: int, seed: int = 0) -> List[dict]:
+    """``count`` long-term memories of 6 to 16 words, one per tick from tick 0."""
+    rng = random.Random(seed)
+    return [
+        {
+            "text": " ".join(rng.choices(_WORDS, _WORD_WEIGHTS, k=rng.randint(6, 16))),
+            "tick": tick,
+            "priority": rng.choice(["low", "normal", "high"]),
+        }
+        for tick in range(count)
+    ]
+
+
+def generate_queries(count: int, seed: int = 0, words: int = 3) -> List[str]:
+    """Search queries drawn from the same word distribution as ``generate_memories``."""
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(_WORDS, _WORD_WEIGHTS, k=words)) for _ in range(count)]
+
+
+def write_world(world: WorldState, data_dir: Path):
+    """Write ``world`` using the same file layout as the ``data/`` directory."""
+    world.write_json(data_dir)
+
+
+def default_tools() -> List[Tool]:
+    """One instance of every tool shipped with the engine."""
+    return [getattr(_tools, name)() for name in _TOOL_NAMES] + [OpenDoorTool(), CloseDoorTool()]
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+from .data_models import NPC
+from .tools.base import Param, Tool
+from .world_state import WorldState
+
+
+_TRUE_WORDS = {"on", "true", "yes", "enable", "enabled"}
+_FALSE_WORDS = {"off", "false", "no", "disable", "disabled"}
+
+
+def _norm(text: str) -> str:
+    return "_".join(text.casefold().replace("_", " ").split())
+
+
+class CommandParser:
+    """Deterministic parser for input that names a tool and its arguments.
+
+    The grammar is compiled from the registered tools' names, ``aliases`` and
+    ``params`` schemas. Entity arguments are matched against ids and display
+    names in the world; anything ambiguous or unrecognised yields ``None`` so
+    the caller can fall back to the LLM.
+    """
+
+    def __init__(self, tools: Dict[str, Tool]):
+        self.verbs: Dict[str, Tool] = {}
+        for tool in tools.values():
+            for verb in (tool.name, *tool.aliases):
+                self.verbs[verb.casefold()] = tool
+        # Longest verbs first so "pick up" wins over a hypothetical "pick"
+        alternatives = "|".join(
+            re.escape(verb).replace(r"\ ", r"\s+") for verb in sorted(self.verbs, key=len, reverse=True)
+        )
+        self.pattern = re.compile(rf"^({alternatives})(?:\s+(.*))?$", re.IGNORECASE | re.DOTALL)
+        self.parsed = 0
+        self.unparsed = 0
+
+    @property
+    def local_fraction(self) -> float:
+        """Fraction of inputs handled without falling back."""
+        total = self.parsed + self.unparsed
+        return self.parsed / total if total else 0.0
+
+    def parse(self, text: str, world: WorldState, actor: NPC) -> Optional[Dict[str, Any]]:
+        command = self._parse(text.strip(), world, actor)
+        if command is None:
+            self.unparsed += 1
+        else:
+            self.parsed += 1
+        return command
+
+    def _parse(self, text: str, world: WorldState, actor: NPC) -> Optional[Dict[str, Any]]:
+        match = self.pattern.match(text)
+        if not match:
+            return None
+        tool = self.verbs[" ".join(match.group(1).casefold().split())]
+        tokens = (match.group(2) or "").split()
+        params = self._bind(tool.params, tokens, world, actor)
+        if params is None:
+            return None
+        return {"tool": tool.name, "params": params}
+
+    def _bind(
+        self, specs: Sequence[Param], tokens: List[str], world: WorldState, actor: NPC
+    ) -> Optional[Dict[str, Any]]:
+        if not specs:
+            return {} if not tokens else None
+        spec, rest = specs[0], specs[1:]
+        if spec.kind == "text":
+            if tokens:
+                return {spec.name: " ".join(tokens)}
+            return {} if spec.optional else None
+        # Try the longest phrase first so multi-word names bind greedily
+        for end in range(len(tokens), 0, -1):
+            value = self._resolve(spec.kind, tokens[:end], world, actor)
+            if value is None:
+                continue
+            tail = self._bind(rest, tokens[end:], world, actor)
+            if tail is not None:
+                return {spec.name: value, **tail}
+        if spec.optional:
+            tail = self._bind(rest, tokens, world, actor)
+            if tail is not None:
+                return tail if spec.default is None else {spec.name: spec.default, **tail}
+        return None
+
+    def _resolve(self, kind: str, phrase: List[str], world: WorldState, actor: NPC) -> Any:
+        text = " ".join(phrase)
+        key = _norm(text)
+        if kind == "int":
+            return int(text) if len(phrase) == 1 and text.isdigit() else None
+        if kind == "bool":
+            if key in _TRUE_WORDS:
+                return True
+            if key in _FALSE_WORDS:
+                return False
+            return None
+        if kind == "slot":
+            return key if key in actor.slots else None
+        if kind == "location":
+            return self._resolve_location(key, world, actor)
+        if kind == "item":
+            return self._resolve_item(text, key, world, actor)
+        if kind == "npc":
+            return self._resolve_npc(text, key, world, actor)
+        return None
+
+    def _resolve_location(self, key: str, world: WorldState, actor: NPC) -> Optional[str]:
+        if key in world.locations_static:
+            return key
+        current = world.find_npc_location(actor.id)
+        if current:
+            # Directions such as "east" name the neighbour in that direction
+            return world.get_location_static(current).hex_connections.get(key)
+        return None
+
+    def _resolve_item(self, text: str, key: str, world: WorldState, actor: NPC) -> Optional[str]:
+        if text in world.item_instances:
+            return text
+        visible = list(actor.inventory)
+        visible.extend(item_id for item_id in actor.slots.values() if item_id)
+        loc_id = world.find_npc_location(actor.id)
+        if loc_id:
+            visible.extend(world.get_location_state(loc_id).items)
+        matches = set()
+        for item_id in visible:
+            inst = world.item_instances.get(item_id)
+            if inst and _norm(world.get_item_blueprint(inst.blueprint_id).name) == key:
+                matches.add(item_id)
+        return matches.pop() if len(matches) == 1 else None
+
+    def _resolve_npc(self, text: str, key: str, world: WorldState, actor: NPC) -> Optional[str]:
+        if text in world.npcs:
+            return text
+        loc_id = world.find_npc_location(actor.id)
+        nearby = world.get_location_state(loc_id).occupants if loc_id else []
+        for candidates in (nearby, world.npcs):
+            matches = [npc_id for npc_id in candidates if _norm(world.get_npc(npc_id).name) == key]
+            if len(matches) == 1:
+                return matches[0]
+            if matches:
+                return None
+        return None
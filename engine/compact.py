@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import MutableMapping
+from typing import Any, ClassVar, FrozenSet, Iterable, Iterator, Tuple
+
+
+class SchemaDict(MutableMapping):
+    """Dict-like record whose usual keys are stored in ``__slots__``.
+
+    Subclasses made with ``schema_dict`` declare a fixed key schema (the
+    attribute names or equipment slots every NPC has). Those values live in
+    slots instead of a per-instance hash table, which is several times
+    smaller; unexpected keys still work and go to a lazily created dict.
+    Iteration follows the schema order, then extra keys in insertion order.
+    """
+
+    __slots__ = ("_extra",)
+    _keys: ClassVar[Tuple[str, ...]] = ()
+    _key_set: ClassVar[FrozenSet[str]] = frozenset()
+
+    def __init__(self, data: Any = (), **kwargs: Any):
+        self._extra = None
+        items = data.items() if hasattr(data, "items") else data
+        for key, value in items:
+            self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._key_set:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self._key_set:
+            object.__setattr__(self, key, value)
+            return
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in self._key_set:
+            try:
+                object.__delattr__(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+            return
+        if self._extra is None or key not in self._extra:
+            raise KeyError(key)
+        del self._extra[key]
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._key_set:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._keys:
+            if hasattr(self, key):
+                yield key
+        if self._extra is not None:
+            yield from list(self._extra)
+
+    def __len__(self) -> int:
+        count = sum(1 for key in self._keys if hasattr(self, key))
+        return count + (len(self._extra) if self._extra is not None else 0)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._key_set:
+            return getattr(self, key, default)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def copy(self) -> dict:
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def __reduce__(self):
+        return (type(self), (dict(self.items()),))
+
+
+def schema_dict(name: str, keys: Iterable[str]) -> type:
+    """Create a ``SchemaDict`` subclass whose slots are ``keys``."""
+    keys = tuple(keys)
+    namespace = {"__slots__": keys, "_keys": keys, "_key_set": frozenset(keys)}
+    # Like namedtuple, report the caller's module so instances can be pickled
+    namespace["__module__"] = sys._getframe(1).f_globals.get("__name__", __name__)
+    return type(name, (SchemaDict,), namespace)
+
+
+class OrderedSet:
+    """Insertion-ordered set that also answers the list calls the models use.
+
+    Membership, ``append`` and ``remove`` are O(1) instead of O(n) for the
+    id lists that can grow large (location occupants and items, NPC
+    inventories). Iteration follows insertion order, removal keeps the order
+    of the rest, ``remove`` raises ``ValueError`` like ``list.remove`` and
+    appending an element already present leaves it where it is.
+
+    Most of these sets hold a handful of ids, and a dict costs more than
+    twice a list of the same size, so the elements stay in a list (a shared
+    empty tuple while there are none) until there are more than ``SMALL``
+    of them; scanning that few is as fast as hashing.
+    """
+
+    __slots__ = ("_items",)
+    SMALL = 8
+
+    def __init__(self, items: Iterable[Any] = ()):
+        unique = dict.fromkeys(items)
+        if len(unique) > self.SMALL:
+            self._items: Any = unique
+        else:
+            self._items = list(unique) if unique else ()
+
+    def append(self, item: Any):
+        items = self._items
+        if type(items) is dict:
+            items[item] = None
+        elif item not in items:
+            if not items:
+                self._items = [item]
+            elif len(items) < self.SMALL:
+                items.append(item)
+            else:
+                self._items = dict.fromkeys(items)
+                self._items[item] = None
+
+    add = append
+
+    def extend(self, items: Iterable[Any]):
+        for item in items:
+            self.append(item)
+
+    def remove(self, item: Any):
+        items = self._items
+        try:
+            if type(items) is dict:
+                del items[item]
+            else:
+                items.remove(item)
+        except (KeyError, ValueError, AttributeError):
+            raise ValueError(f"{item!r} not in OrderedSet") from None
+
+    def discard(self, item: Any):
+        if item in self._items:
+            self.remove(item)
+
+    def clear(self):
+        self._items = ()
+
+    def copy(self) -> "OrderedSet":
+        return OrderedSet(self._items)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        items = self._items
+        return list(items)[index] if type(items) is dict else items[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, OrderedSet):
+            return list(self._items) == list(other._items)
+        if isinstance(other, list):
+            return list(self._items) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(list(self._items))
+
+    def __reduce__(self):
+        return (OrderedSet, (list(self._items),))
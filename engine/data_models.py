@@ -1,47 +1,102 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any
 
+from .compact import OrderedSet, SchemaDict, schema_dict
+from .memory import DEFAULT_SHORT_TERM_CAPACITY, ShortTermMemory
+from .vitals import VitalsTable
 
-@dataclass
+
+# Fixed key schemas shared by every entity; values live in slots, see compact.py
+Attributes = schema_dict("Attributes", ("strength", "dexterity", "constitution"))
+EquipmentSlots = schema_dict("EquipmentSlots", ("main_hand", "off_hand", "head", "torso", "legs"))
+Tags = schema_dict("Tags", ("inherent", "dynamic"))
+ConnectionState = schema_dict("ConnectionState", ("status",))
+
+
+def _as(schema: type, value: Any) -> Any:
+    return value if type(value) is schema else schema(value)
+
+
+@dataclass(slots=True)
 class NPC:
+    # Set while the NPC's vitals live in a WorldState.vitals table row
+    _vitals: Optional[VitalsTable] = field(default=None, init=False, repr=False, compare=False)
+    _vital_row: int = field(default=-1, init=False, repr=False, compare=False)
     id: str
     name: str
-    inventory: List[str] = field(default_factory=list)
-    slots: Dict[str, Optional[str]] = field(default_factory=dict)
+    inventory: OrderedSet = field(default_factory=OrderedSet)
+    slots: Dict[str, Optional[str]] = field(default_factory=EquipmentSlots)
     hp: int = 0
     memories: List[dict] = field(default_factory=list)
     goals: List[dict] = field(default_factory=list)
     relationships: Dict[str, str] = field(default_factory=dict)
-    tags: Dict[str, List[str]] = field(default_factory=lambda: {"inherent": [], "dynamic": []})
-    short_term_memory: List[dict] = field(default_factory=list)
+    tags: Dict[str, List[str]] = field(default_factory=lambda: Tags(inherent=[], dynamic=[]))
+    short_term_memory: ShortTermMemory = field(default_factory=ShortTermMemory)
+    # Entries short_term_memory keeps; change it on a live NPC with set_short_term_capacity
+    short_term_capacity: int = DEFAULT_SHORT_TERM_CAPACITY
     known_locations: Dict[str, str] = field(default_factory=dict)
     next_available_tick: int = 0
     last_meal_tick: int = 0
     hunger_stage: str = "sated"
     attributes: Dict[str, int] = field(
-        default_factory=lambda: {"strength": 10, "dexterity": 10, "constitution": 10}
+        default_factory=lambda: Attributes(strength=10, dexterity=10, constitution=10)
     )
     skills: Dict[str, str] = field(default_factory=dict)
 
+    def __post_init__(self):
+        self.inventory = _as(OrderedSet, self.inventory)
+        self.slots = _as(EquipmentSlots, self.slots)
+        self.tags = _as(Tags, self.tags)
+        self.attributes = _as(Attributes, self.attributes)
+        memory = self.short_term_memory
+        if type(memory) is not ShortTermMemory or memory.capacity != self.short_term_capacity:
+            self.short_term_memory = ShortTermMemory(memory, self.short_term_capacity)
+
+    def set_short_term_capacity(self, capacity: int):
+        self.short_term_capacity = capacity
+        self.short_term_memory.resize(capacity)
+
+    def __getstate__(self):
+        # Copies carry the values, never the table the original is attached to
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+
+    def __setstate__(self, state):
+        self._vitals = None
+        self._vital_row = -1
+        for name, value in state.items():
+            setattr(self, name, value)
 
-@dataclass
+
+
+@dataclass(slots=True)
 class LocationStatic:
     id: str
     description: str
-    tags: Dict[str, List[str]] = field(default_factory=lambda: {"inherent": []})
+    tags: Dict[str, List[str]] = field(default_factory=lambda: Tags(inherent=[]))
     hex_connections: Dict[str, str] = field(default_factory=dict)
 
+    def __post_init__(self):
+        self.tags = _as(Tags, self.tags)
 
-@dataclass
+
+@dataclass(slots=True)
 class LocationState:
     id: str
-    occupants: List[str] = field(default_factory=list)
-    items: List[str] = field(default_factory=list)
+    occupants: OrderedSet = field(default_factory=OrderedSet)
+    items: OrderedSet = field(default_factory=OrderedSet)
     sublocations: List[str] = field(default_factory=list)
     transient_effects: List[str] = field(default_factory=list)
     connections_state: Dict[str, dict] = field(default_factory=dict)
 
-@dataclass
+    def __post_init__(self):
+        self.occupants = _as(OrderedSet, self.occupants)
+        self.items = _as(OrderedSet, self.items)
+        connections = self.connections_state
+        for neighbour, state in connections.items():
+            connections[neighbour] = _as(ConnectionState, state)
+
+@dataclass(slots=True)
 class ItemBlueprint:
     id: str
     name: str
@@ -52,7 +107,7 @@ class ItemBlueprint:
     skill_tag: str = "unarmed_combat"
     properties: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class ItemInstance:
     id: str
     blueprint_id: str
@@ -60,4 +115,22 @@ class ItemInstance:
     owner_id: Optional[str] = None
     item_state: Dict[str, Any] = field(default_factory=dict)
     inventory: List[str] = field(default_factory=list)
-    tags: Dict[str, List[str]] = field(default_factory=lambda: {"inherent": [], "dynamic": []})
+    tags: Dict[str, List[str]] = field(default_factory=lambda: Tags(inherent=[], dynamic=[]))
+
+    def __post_init__(self):
+        self.tags = _as(Tags, self.tags)
+
+
+def to_dict(obj: Any) -> Any:
+    """Plain JSON-ready copy of a model, the counterpart of ``Model(**data)``.
+
+    ``dataclasses.asdict`` would keep the schema mappings as their own type;
+    this turns them back into dicts.
+    """
+    if hasattr(obj, "__dataclass_fields__"):
+        return {f.name: to_dict(getattr(obj, f.name)) for f in fields(obj) if f.init}
+    if isinstance(obj, (dict, SchemaDict, MappingProxyType)):
+        return {key: to_dict(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple, OrderedSet, ShortTermMemory)):
+        return [to_dict(value) for value in obj]
+    return obj
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     event_type: str
     tick: int
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import sys
+from typing import Dict, Iterator
+
+
+class IdRegistry:
+    """One canonical (interned) string per id for one kind of entity.
+
+    ``intern`` returns the registry's string for an id, registering it on
+    first sight, which lets every occupants list, inventory and event share
+    a single string object per entity and compare ids by identity before
+    falling back to equality. Iteration follows registration order.
+    """
+
+    __slots__ = ("_ids",)
+
+    def __init__(self):
+        self._ids: Dict[str, str] = {}
+
+    def intern(self, entity_id: str) -> str:
+        """Register ``entity_id`` if needed and return its canonical string."""
+        canonical = self._ids.get(entity_id)
+        if canonical is None:
+            canonical = sys.intern(entity_id)
+            self._ids[canonical] = canonical
+        return canonical
+
+    def canonical(self, entity_id: str) -> str:
+        """Canonical string for a registered id, or ``entity_id`` unchanged."""
+        return self._ids.get(entity_id, entity_id)
+
+    def __contains__(self, entity_id: object) -> bool:
+        return entity_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
@@ -0,0 +1,304 @@
+"""Append-only event journal and the replayer that rebuilds worlds from it.
+
+A journal directory holds ``events.log`` and the world snapshots it refers
+to. The log is a sequence of records, each a little endian ``uint32``
+length followed by a ``marshal``-encoded tuple whose first two items are the
+record kind and the game tick:
+
+    EVENT     (kind, tick, event_type, event_tick, actor_id, target_ids, payload)
+    BUSY      (kind, tick, actor_id, next_available_tick)
+    RNG       (kind, tick, Simulator.rng.getstate(), Simulator.rng.draws())
+    DRAWS     (kind, tick, Simulator.rng.draws())
+    SCHEDULE  (kind, tick, handle, event_type, event_tick, actor_id, target_ids, payload)
+    CANCEL    (kind, tick, handle)
+    POP       (kind, tick, handles)
+    HUNGER    (kind, tick, actor_id, handles or None)
+    SNAPSHOT  (kind, tick, file name, simulator flags, RNG state, RNG draws, schedules)
+
+``BUSY`` records the one world change made outside an event: the actor's
+``next_available_tick`` set by ``Simulator.process_command``. ``SCHEDULE``,
+``CANCEL`` and ``POP`` follow the simulator's event queue and ``HUNGER`` its
+``hunger_events``; a snapshot holds both as ``Simulator.schedule_state``.
+The RNG streams are saved whole at checkpoints and count their draws in
+between; ``DRAWS`` is written whenever the counts changed.
+
+Replay loads the last snapshot at or before the requested tick and
+re-applies the events after it through ``WorldState.apply_event``, the
+simulator's perceivers and the few reactions that change the world directly.
+Actors do not think, nothing is narrated and no follow-up events are
+scheduled, since every follow-up was journalled as its own event. A
+truncated last record, left by a crash mid-write, is ignored.
+"""
+from __future__ import annotations
+
+import marshal
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from .data_models import to_dict
+from .events import Event
+from .snapshot import save_snapshot, load_snapshot
+from .world_state import WorldState
+
+if TYPE_CHECKING:
+    from .simulator import Simulator
+
+LOG_NAME = "events.log"
+JOURNAL_VERSION = 2
+EVENT, BUSY, RNG, SNAPSHOT, DRAWS, SCHEDULE, CANCEL, POP, HUNGER = range(9)
+_LENGTH = struct.Struct("<I")
+
+
+def _snapshot_name(tick: int) -> str:
+    return f"snap_{tick:010d}.snap"
+
+
+def _simulator_flags(sim: "Simulator") -> Dict[str, Any]:
+    return {
+        "version": JOURNAL_VERSION,
+        "starvation_enabled": sim.starvation_enabled,
+        "events_handled": sim.events_handled,
+        "seed": sim.rng.seed,
+        "player_id": sim.player_id,
+    }
+
+
+def _event_row(event: Event) -> tuple:
+    return (event.event_type, event.tick, event.actor_id, list(event.target_ids), to_dict(event.payload))
+
+
+class EventJournal:
+    """Writes the records of one simulator to ``directory``; see the module docstring.
+
+    Records are buffered and flushed at the end of every tick, so a crash
+    loses at most the tick in progress.
+    """
+
+    def __init__(self, directory: Path, snapshot_interval: int = 100, rng_interval: int = 100):
+        self.directory = Path(directory)
+        self.snapshot_interval = snapshot_interval
+        self.rng_interval = rng_interval
+        self.next_snapshot_tick = 0
+        self.next_rng_tick = 0
+        self._log = None
+        self._sim: Optional["Simulator"] = None
+        # RNG draw counts as of the last record that carried them
+        self._draws: tuple = ()
+
+    def start(self, sim: "Simulator"):
+        """Open the log for appending and snapshot the world as it is now."""
+        self._sim = sim
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._log = open(self.directory / LOG_NAME, "ab")
+        self.snapshot(sim)
+
+    def _write(self, record: tuple):
+        data = marshal.dumps(record)
+        self._log.write(_LENGTH.pack(len(data)))
+        self._log.write(data)
+
+    def record_event(self, tick: int, event: Event):
+        self._write((EVENT, tick) + _event_row(event))
+
+    def record_busy(self, tick: int, actor_id: str, next_available_tick: int):
+        self._write((BUSY, tick, actor_id, next_available_tick))
+        # Commands entered between ticks draw from the world stream
+        self._record_draws(tick)
+
+    def record_hunger(self, tick: int, actor_id: str, handles: Optional[List[int]]):
+        self._write((HUNGER, tick, actor_id, handles))
+
+    def _record_draws(self, tick: int):
+        draws = self._sim.rng.draws()
+        if draws != self._draws:
+            self._write((DRAWS, tick, draws))
+            self._draws = draws
+
+    # EventScheduler.listener callbacks
+
+    def scheduled(self, handle: int, event: Event):
+        self._write((SCHEDULE, self._sim.game_tick, handle) + _event_row(event))
+
+    def cancelled(self, handle: int):
+        self._write((CANCEL, self._sim.game_tick, handle))
+
+    def popped(self, handles: List[int]):
+        self._write((POP, self._sim.game_tick, handles))
+
+    def snapshot(self, sim: "Simulator"):
+        """Write a world snapshot for the current tick and log it with the RNG and queues."""
+        name = _snapshot_name(sim.game_tick)
+        save_snapshot(sim.world, self.directory / name)
+        state = sim.schedule_state()
+        schedules = {
+            "pending": [(handle,) + _event_row(event) for handle, event in state["pending"]],
+            "next_handle": state["next_handle"],
+            "hunger_events": state["hunger_events"],
+        }
+        self._draws = sim.rng.draws()
+        self._write(
+            (SNAPSHOT, sim.game_tick, name, _simulator_flags(sim), sim.rng.getstate(), self._draws, schedules)
+        )
+        self._log.flush()
+        self.next_snapshot_tick = sim.game_tick + self.snapshot_interval
+        self.next_rng_tick = sim.game_tick + self.rng_interval
+
+    def end_tick(self, sim: "Simulator"):
+        """Take the checkpoints that are due and flush the tick's records."""
+        if self.snapshot_interval and sim.game_tick >= self.next_snapshot_tick:
+            self.snapshot(sim)
+            return
+        if self.rng_interval and sim.game_tick >= self.next_rng_tick:
+            self._draws = sim.rng.draws()
+            self._write((RNG, sim.game_tick, sim.rng.getstate(), self._draws))
+            self.next_rng_tick = sim.game_tick + self.rng_interval
+        else:
+            self._record_draws(sim.game_tick)
+        self._log.flush()
+
+    def close(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+
+def read_records(path: Path) -> List[tuple]:
+    """All complete records in the log at ``path``, in write order."""
+    with open(path, "rb") as f:
+        data = f.read()
+    records = []
+    pos = 0
+    while pos + _LENGTH.size <= len(data):
+        (size,) = _LENGTH.unpack_from(data, pos)
+        end = pos + _LENGTH.size + size
+        if end > len(data):
+            break
+        try:
+            records.append(marshal.loads(data[pos + _LENGTH.size : end]))
+        except (EOFError, ValueError, TypeError):
+            break
+        pos = end
+    return records
+
+
+class Replayer:
+    """Rebuilds the state of a journalled run at any tick it covers.
+
+    ``setup`` is called with every simulator the replayer creates, before any
+    event is re-applied; use it to register the same tools and custom event
+    handlers the live run had.
+    """
+
+    def __init__(self, directory: Path, setup: Optional[Callable[["Simulator"], None]] = None):
+        self.directory = Path(directory)
+        self.setup = setup
+        self.records = read_records(self.directory / LOG_NAME)
+        if not self.records or self.records[0][0] != SNAPSHOT:
+            raise ValueError(f"{self.directory} has no journal starting with a snapshot")
+        version = self.records[0][3].get("version")
+        if version != JOURNAL_VERSION:
+            raise ValueError(f"{self.directory} holds journal version {version}, expected {JOURNAL_VERSION}")
+
+    @property
+    def last_tick(self) -> int:
+        return self.records[-1][1]
+
+    def rng_checkpoints(self) -> List[int]:
+        """Ticks at which the RNG stream states were recorded."""
+        return [record[1] for record in self.records if record[0] in (RNG, SNAPSHOT)]
+
+    def _start(self, tick: int) -> int:
+        # The last snapshot logged at or before ``tick``; a run resumed from
+        # an earlier tick logs a new snapshot, which then takes precedence
+        start = None
+        for pos, record in enumerate(self.records):
+            if record[0] == SNAPSHOT and record[1] <= tick:
+                start = pos
+        if start is None:
+            raise ValueError(f"journal in {self.directory} starts after tick {tick}")
+        return start
+
+    def simulator_at(self, tick: int, **kwargs) -> "Simulator":
+        """A headless simulator in the state the live run had at the end of ``tick``.
+
+        ``kwargs`` go to the ``Simulator`` constructor; ``output`` defaults
+        to None and ``seed`` and ``player_id`` to the live run's. Besides the
+        world and flags, the pending events and hunger timers are restored
+        and the RNG streams are brought from the last checkpoint to ``tick``
+        with the journalled draw counts, so the returned simulator carries on
+        exactly as the live one did, which makes it usable for crash recovery.
+        """
+        from .simulator import Simulator
+
+        start = self._start(tick)
+        _, start_tick, name, flags, rng_state, checkpoint_draws, schedules = self.records[start]
+        world = load_snapshot(self.directory / name)
+        kwargs.setdefault("output", None)
+        kwargs.setdefault("seed", flags["seed"])
+        kwargs.setdefault("player_id", flags["player_id"])
+        sim = Simulator(world, **kwargs)
+        if self.setup is not None:
+            self.setup(sim)
+        sim.game_tick = start_tick
+        sim.starvation_enabled = flags["starvation_enabled"]
+        sim.events_handled = flags["events_handled"]
+        pending = {row[0]: row[1:] for row in schedules["pending"]}
+        next_handle = schedules["next_handle"]
+        hunger_events = dict(schedules["hunger_events"])
+        draws = checkpoint_draws
+        for record in self.records[start + 1 :]:
+            if record[1] > tick:
+                break
+            sim.game_tick = record[1]
+            kind = record[0]
+            if kind == EVENT:
+                self._apply(sim, Event(*record[2:]))
+            elif kind == BUSY:
+                sim.world.get_npc(record[2]).next_available_tick = record[3]
+            elif kind == SCHEDULE:
+                pending[record[2]] = record[3:]
+                next_handle = record[2] + 1
+            elif kind == CANCEL:
+                del pending[record[2]]
+            elif kind == POP:
+                for handle in record[2]:
+                    del pending[handle]
+            elif kind == HUNGER:
+                if record[3] is None:
+                    del hunger_events[record[2]]
+                else:
+                    hunger_events[record[2]] = record[3]
+            elif kind == RNG:
+                rng_state, checkpoint_draws = record[2], record[3]
+                draws = checkpoint_draws
+            elif kind == DRAWS:
+                draws = record[2]
+        sim.game_tick = tick
+        sim.rng.setstate(rng_state)
+        sim.rng.skip([now - then for now, then in zip(draws, checkpoint_draws)])
+        sim.restore_schedules(
+            {
+                "pending": [(handle, Event(*row)) for handle, row in sorted(pending.items())],
+                "next_handle": next_handle,
+                "hunger_events": hunger_events,
+            }
+        )
+        return sim
+
+    def world_at(self, tick: int) -> WorldState:
+        """The world as it was at the end of ``tick``."""
+        return self.simulator_at(tick).world
+
+    @staticmethod
+    def _apply(sim: "Simulator", event: Event):
+        sim.world.apply_event(event)
+        if event.event_type == "toggle_starvation":
+            sim.starvation_enabled = event.payload.get("enabled", True)
+            if not sim.starvation_enabled:
+                sim.world.reset_hunger(sim.game_tick)
+        sim.events_handled += 1
+        perceive = sim.perceivers.get(event.event_type, sim.record_perception)
+        if perceive:
+            perceive(event)
+
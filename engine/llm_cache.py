@@ -0,0 +1,197 @@
+import copy
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+CACHE_VERSION = 1
+# Written into every namespace directory a ResponseCache creates
+MARKER = ".response-cache"
+
+
+def normalize_input(text: str) -> str:
+    """Collapse whitespace and casefold the leading verb.
+
+    The rest keeps its case: it may be free text, such as what to say,
+    which the parsed command carries through verbatim.
+    """
+    words = text.split()
+    if words:
+        words[0] = words[0].casefold()
+    return " ".join(words)
+
+
+def tool_schemas(tools: Mapping[str, Any]) -> str:
+    """Canonical JSON of each tool's ``params`` and ``aliases``, for the cache namespace."""
+    return json.dumps(
+        {
+            name: {
+                "params": [[param.name, param.kind, param.optional, param.default] for param in tool.params],
+                "aliases": list(tool.aliases),
+            }
+            for name, tool in tools.items()
+        },
+        sort_keys=True,
+    )
+
+
+class ResponseCache:
+    """Two-tier cache of parsed LLM replies for one model and system prompt.
+
+    Entries are content addressed by a hash of the model, the system prompt,
+    the registered tools' ``schemas`` (see ``tool_schemas``) and the
+    normalized user input. The memory tier is an LRU of ``max_entries``; the
+    disk tier keeps one JSON file per entry under ``cache_dir/<namespace>``
+    and evicts the least recently used files once they exceed
+    ``max_disk_bytes``. Because the namespace is derived from the prompt and
+    the schemas, changing either starts a fresh namespace; ``prune`` then
+    deletes the stale ones, except those listed in ``keep`` (other caches
+    still in use). Only directories carrying the ``MARKER`` file are treated
+    as namespaces, so anything else under ``cache_dir`` is left alone.
+    Without ``cache_dir`` only the memory tier is used.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        system_prompt: str,
+        schemas: str = "",
+        cache_dir: Optional[Path] = None,
+        max_entries: int = 256,
+        max_disk_bytes: int = 16 * 1024 * 1024,
+        keep: Iterable[str] = (),
+    ):
+        self.model = model
+        self.system_prompt = system_prompt
+        self.namespace = hashlib.sha256(f"{model}\0{system_prompt}\0{schemas}".encode()).hexdigest()[:16]
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.directory: Optional[Path] = None
+        self._disk_bytes = 0
+        if cache_dir is not None:
+            self.directory = Path(cache_dir) / self.namespace
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._claim_directory()
+            self.prune(keep)
+            self._disk_bytes = sum(p.stat().st_size for p in self.directory.glob("*.json"))
+
+    def key(self, user_input: str) -> str:
+        return hashlib.sha256(f"{self.namespace}\0{normalize_input(user_input)}".encode()).hexdigest()
+
+    def get(self, user_input: str) -> Optional[Any]:
+        key = self.key(user_input)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return copy.deepcopy(self._memory[key])
+            value = self._read_disk(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, value)
+            return copy.deepcopy(value)
+
+    def put(self, user_input: str, value: Any):
+        key = self.key(user_input)
+        with self._lock:
+            self._remember(key, value)
+            self._write_disk(key, value)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        hits = self.memory_hits + self.disk_hits
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "entries": len(self._memory),
+            "disk_bytes": self._disk_bytes,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self.directory is not None:
+                for path in self.directory.glob("*.json"):
+                    path.unlink()
+                self._disk_bytes = 0
+
+    def _remember(self, key: str, value: Any):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, key: str) -> Optional[Any]:
+        if self.directory is None:
+            return None
+        path = self.directory / f"{key}.json"
+        try:
+            with open(path, "r") as f:
+                value = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        # Touch the file so eviction treats it as recently used
+        os.utime(path)
+        return value
+
+    def _write_disk(self, key: str, value: Any):
+        if self.directory is None:
+            return
+        path = self.directory / f"{key}.json"
+        data = json.dumps(value).encode()
+        if path.exists():
+            self._disk_bytes -= path.stat().st_size
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._disk_bytes += len(data)
+        if self._disk_bytes > self.max_disk_bytes:
+            self._evict_disk()
+
+    def _evict_disk(self):
+        files = sorted(self.directory.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for path in files:
+            if self._disk_bytes <= self.max_disk_bytes:
+                break
+            self._disk_bytes -= path.stat().st_size
+            path.unlink()
+
+    def prune(self, keep: Iterable[str] = ()) -> int:
+        """Delete the other namespaces under ``cache_dir`` except ``keep``; returns how many were removed."""
+        if self.directory is None:
+            return 0
+        keep = set(keep)
+        keep.add(self.namespace)
+        removed = 0
+        for path in self.directory.parent.iterdir():
+            if path.name not in keep and (path / MARKER).is_file():
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+        return removed
+
+    def _claim_directory(self):
+        marker = self.directory / MARKER
+        try:
+            version = marker.read_text().strip()
+        except OSError:
+            version = None
+        if version != str(CACHE_VERSION):
+            # Entries written by another version (or of unknown origin) are not trusted
+            for path in self.directory.glob("*.json"):
+                path.unlink()
+            marker.write_text(f"{CACHE_VERSION}\n")
@@ -1,11 +1,74 @@
+import http.client
 import json
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
-from urllib import request
+from typing import Any, List, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .llm_cache import ResponseCache, tool_schemas
+
+
+class LLMError(RuntimeError):
+    """Raised when the endpoint cannot produce a reply after all retries."""
+
+
+class ConnectionPool:
+    """Keep-alive HTTP connections to a single endpoint, shared between threads."""
+
+    def __init__(self, endpoint: str, size: int = 4):
+        parts = urlsplit(endpoint)
+        self.scheme = parts.scheme or "http"
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port
+        self.path = parts.path or "/"
+        if parts.query:
+            self.path += "?" + parts.query
+        self.size = size
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+
+    def acquire(self, timeout: float) -> http.client.HTTPConnection:
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn_cls = (
+                http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            )
+            conn = conn_cls(self.host, self.port, timeout=timeout)
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn
+
+    def release(self, conn: http.client.HTTPConnection, reuse: bool = True):
+        if reuse and self._idle.qsize() < self.size:
+            self._idle.put(conn)
+        else:
+            conn.close()
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
 
 
 class LLMClient:
-    """Simple connector to an OpenAI-compatible endpoint."""
+    """Connector to an OpenAI-compatible endpoint.
+
+    Requests reuse persistent connections from a small pool and can be run
+    concurrently with ``submit``/``chat_many``. ``config/llm.json`` controls
+    ``max_concurrency``, ``timeout`` (seconds), ``max_retries`` and
+    ``retry_backoff`` (seconds, doubled after each failed attempt).
+    Parsed commands are cached per system prompt and tool set, in memory and
+    also on disk when ``cache_dir`` is set; ``cache_entries`` and
+    ``cache_max_bytes`` bound the two tiers of each cache.
+    """
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
 
     def __init__(self, config_path: Path):
         with open(config_path, "r") as f:
@@ -13,31 +76,119 @@ class LLMClient:
         self.endpoint = cfg.get("endpoint")
         self.model = cfg.get("model")
         self.max_context = cfg.get("max_context", -1)
+        self.max_concurrency = cfg.get("max_concurrency", 4)
+        self.timeout = cfg.get("timeout", 30)
+        self.max_retries = cfg.get("max_retries", 2)
+        self.retry_backoff = cfg.get("retry_backoff", 0.5)
+        self.pool = ConnectionPool(self.endpoint, size=self.max_concurrency)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self.cache_dir = cfg.get("cache_dir")
+        self.cache_entries = cfg.get("cache_entries", 256)
+        self.cache_max_bytes = cfg.get("cache_max_bytes", 16 * 1024 * 1024)
+        # (system prompt, tool schemas) -> cache
+        self._caches: Dict[Tuple[str, str], ResponseCache] = {}
 
-    def chat(self, messages: List[Dict[str, str]]) -> str:
+    def chat(self, messages: List[Dict[str, str]], timeout: Optional[float] = None) -> str:
         payload = {
             "model": self.model,
             "messages": messages,
         }
         if self.max_context != -1:
             payload["max_tokens"] = self.max_context
-        req = request.Request(
-            self.endpoint,
-            data=json.dumps(payload).encode(),
-            headers={"Content-Type": "application/json"},
-        )
-        with request.urlopen(req, timeout=30) as resp:
-            data = json.loads(resp.read().decode())
+        data = self._post(json.dumps(payload).encode(), self.timeout if timeout is None else timeout)
         return data["choices"][0]["message"]["content"]
 
-    def parse_command(self, user_input: str, system_prompt: str) -> Dict[str, str]:
+    def submit(self, messages: List[Dict[str, str]], timeout: Optional[float] = None) -> "Future[str]":
+        """Run ``chat`` on the client's thread pool and return a future for the reply."""
+        return self._get_executor().submit(self.chat, messages, timeout)
+
+    def chat_many(
+        self, conversations: List[List[Dict[str, str]]], timeout: Optional[float] = None
+    ) -> List[str]:
+        """Send several conversations concurrently and return replies in order."""
+        futures = [self.submit(messages, timeout) for messages in conversations]
+        return [future.result() for future in futures]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency, thread_name_prefix="llm"
+                )
+            return self._executor
+
+    def _post(self, body: bytes, timeout: float) -> dict:
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        last_error: Optional[Exception] = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(self.retry_backoff * (2 ** (attempt - 1)))
+            conn = self.pool.acquire(timeout)
+            try:
+                conn.request("POST", self.pool.path, body=body, headers=headers)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except (OSError, http.client.HTTPException) as e:
+                # Stale keep-alive sockets and timeouts both land here
+                conn.close()
+                last_error = e
+                continue
+            self.pool.release(conn, reuse=not resp.will_close)
+            if resp.status in self.RETRY_STATUSES:
+                last_error = LLMError(f"HTTP {resp.status} from {self.endpoint}")
+                continue
+            if resp.status >= 400:
+                raise LLMError(f"HTTP {resp.status} from {self.endpoint}: {raw[:200]!r}")
+            return json.loads(raw.decode())
+        raise LLMError(f"LLM request failed after {self.max_retries + 1} attempts") from last_error
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.pool.close()
+
+    def __enter__(self) -> "LLMClient":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def cache_for(self, system_prompt: str, tools: Optional[Mapping[str, Any]] = None) -> ResponseCache:
+        """Return the response cache for ``system_prompt`` and the registered ``tools``."""
+        schemas = tool_schemas(tools or {})
+        cache = self._caches.get((system_prompt, schemas))
+        if cache is None:
+            cache = ResponseCache(
+                self.model,
+                system_prompt,
+                schemas,
+                cache_dir=Path(self.cache_dir) if self.cache_dir is not None else None,
+                max_entries=self.cache_entries,
+                max_disk_bytes=self.cache_max_bytes,
+                # Namespaces of this client's other prompts are still live
+                keep=[other.namespace for other in self._caches.values()],
+            )
+            self._caches[system_prompt, schemas] = cache
+        return cache
+
+    def parse_command(
+        self, user_input: str, system_prompt: str, tools: Optional[Mapping[str, Any]] = None
+    ) -> Dict[str, str]:
+        cache = self.cache_for(system_prompt, tools)
+        cached = cache.get(user_input)
+        if cached is not None:
+            return cached
         messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_input},
         ]
         reply = self.chat(messages)
         try:
-            return json.loads(reply)
+            command = json.loads(reply)
         except json.JSONDecodeError:
             return {}
-
+        if command:
+            cache.put(user_input, command)
+        return command
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, List, Mapping, Union
+
+DEFAULT_SHORT_TERM_CAPACITY = 20
+_NO_PAYLOAD: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
+class Perception:
+    """One event as an actor noticed it; shared by everyone who noticed it the same way.
+
+    ``payload`` is a read-only copy taken when the event was perceived, so
+    later changes to the event's own payload do not leak into memories.
+    """
+
+    tick: int
+    event_type: str
+    actor_id: str
+    payload: Mapping[str, Any] = field(default_factory=lambda: _NO_PAYLOAD)
+    sound_level: str = "normal"
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Perception":
+        return cls(
+            data["tick"],
+            data["event_type"],
+            data["actor_id"],
+            MappingProxyType(dict(data.get("payload") or {})),
+            data.get("sound_level", "normal"),
+        )
+
+    def __reduce__(self):
+        # A mappingproxy cannot be pickled or deep-copied, its plain copy can
+        data = {
+            "tick": self.tick,
+            "event_type": self.event_type,
+            "actor_id": self.actor_id,
+            "payload": dict(self.payload),
+            "sound_level": self.sound_level,
+        }
+        return (Perception.from_dict, (data,))
+
+
+def as_perception(entry: Union[Perception, Mapping[str, Any]]) -> Perception:
+    return entry if type(entry) is Perception else Perception.from_dict(entry)
+
+
+class ShortTermMemory:
+    """Fixed-capacity ring buffer of an actor's most recent perceptions, oldest first.
+
+    Appending to a full buffer overwrites the oldest entry in place instead
+    of shifting the list. Entries are shared ``Perception`` objects, so a
+    buffer holds references rather than copies. ``last`` and ``since``
+    answer the prompt-building queries without copying the whole buffer.
+    """
+
+    __slots__ = ("_entries", "_start", "_capacity")
+
+    def __init__(self, entries: Iterable[Any] = (), capacity: int = DEFAULT_SHORT_TERM_CAPACITY):
+        self._capacity = max(capacity, 0)
+        self._entries: List[Perception] = [as_perception(entry) for entry in entries]
+        # Keep only the newest entries that fit
+        del self._entries[: max(len(self._entries) - self._capacity, 0)]
+        # Position of the oldest entry once the buffer has wrapped around
+        self._start = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def resize(self, capacity: int):
+        """Change the capacity, dropping the oldest entries that no longer fit."""
+        entries = list(self)
+        self._capacity = max(capacity, 0)
+        self._entries = entries[max(len(entries) - self._capacity, 0) :]
+        self._start = 0
+
+    def append(self, entry: Perception):
+        entries = self._entries
+        if len(entries) < self._capacity:
+            entries.append(entry)
+        elif self._capacity:
+            entries[self._start] = entry
+            self._start = (self._start + 1) % self._capacity
+
+    def clear(self):
+        self._entries.clear()
+        self._start = 0
+
+    def _at(self, position: int) -> Perception:
+        return self._entries[(self._start + position) % len(self._entries)]
+
+    def last(self, n: int) -> List[Perception]:
+        """The ``n`` most recent entries, oldest first."""
+        size = len(self._entries)
+        return [self._at(position) for position in range(max(size - n, 0), size)]
+
+    def since(self, tick: int) -> List[Perception]:
+        """Entries perceived at ``tick`` or later, oldest first."""
+        found = []
+        for position in range(len(self._entries) - 1, -1, -1):
+            entry = self._at(position)
+            if entry.tick < tick:
+                break
+            found.append(entry)
+        found.reverse()
+        return found
+
+    def __iter__(self) -> Iterator[Perception]:
+        entries, start = self._entries, self._start
+        yield from entries[start:]
+        yield from entries[:start]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, index: int) -> Perception:
+        size = len(self._entries)
+        if not -size <= index < size:
+            raise IndexError("short-term memory index out of range")
+        return self._at(index % size)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ShortTermMemory):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == [as_perception(entry) for entry in other]
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ShortTermMemory({list(self)!r}, capacity={self._capacity})"
+
+    def __reduce__(self):
+        return (ShortTermMemory, (list(self), self._capacity))
@@ -0,0 +1,196 @@
+"""Keyword retrieval over an NPC's long-term ``memories``.
+
+Memories are dicts with at least ``text``, and usually ``tick`` and
+``priority``. A ``MemoryIndex`` keeps an inverted index of one NPC's
+memory texts, addressed by position in ``NPC.memories``, and ranks them
+with BM25, scaled up for priority and down for age.
+"""
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import zlib
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+INDEX_VERSION = 1
+_TOKEN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have he her his i in is it its me my of on or our she "
+    "that the their them they this to was we were with you your".split()
+)
+# Named priorities; numeric priorities are used as they are
+PRIORITIES: Dict[str, float] = {"low": 0.0, "normal": 1.0, "high": 2.0, "core": 3.0}
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in _TOKEN.findall(text.lower()) if token not in _STOPWORDS]
+
+
+def memory_text(memory: Mapping[str, Any]) -> str:
+    return str(memory.get("text", ""))
+
+
+def priority_of(memory: Mapping[str, Any]) -> float:
+    priority = memory.get("priority", 1.0)
+    if isinstance(priority, str):
+        return PRIORITIES.get(priority, 1.0)
+    return float(priority)
+
+
+def fingerprint(memories: Iterable[Mapping[str, Any]], start: int = 0) -> int:
+    """Running CRC of memory texts, used to tell whether a saved index is still current."""
+    for memory in memories:
+        start = zlib.crc32(memory_text(memory).encode("utf-8"), start)
+    return start
+
+
+class MemoryIndex:
+    """BM25 inverted index over one NPC's memories.
+
+    ``add`` indexes a memory appended to the list and ``remove`` drops
+    memories taken out of it; both keep the index in step without
+    re-reading the other memories, though ``remove`` renumbers the postings
+    behind the removed positions. ``matches`` tells whether the index
+    still describes a memory list: the texts are checksummed the first time
+    (an index loaded from disk), after that only the length is compared, so
+    in-place edits of a memory's text must go through ``remove`` and ``add``.
+    """
+
+    # BM25 term-frequency saturation and length normalisation
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self):
+        # term -> {position in memories: term frequency}
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.lengths: List[int] = []
+        self.total_length = 0
+        self.fingerprint = 0
+        # Set once the index is known to describe the current memory list
+        self.verified = True
+
+    @classmethod
+    def build(cls, memories: Iterable[Mapping[str, Any]]) -> "MemoryIndex":
+        index = cls()
+        for memory in memories:
+            index.add(memory)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def matches(self, memories: Sequence[Mapping[str, Any]]) -> bool:
+        if len(memories) != len(self.lengths):
+            return False
+        if not self.verified:
+            self.verified = fingerprint(memories) == self.fingerprint
+        return self.verified
+
+    def add(self, memory: Mapping[str, Any]):
+        """Index ``memory``, which was appended to the end of the memory list."""
+        position = len(self.lengths)
+        text = memory_text(memory)
+        tokens = tokenize(text)
+        for token in tokens:
+            docs = self.postings.get(token)
+            if docs is None:
+                docs = self.postings[token] = {}
+            docs[position] = docs.get(position, 0) + 1
+        self.lengths.append(len(tokens))
+        self.total_length += len(tokens)
+        self.fingerprint = zlib.crc32(text.encode("utf-8"), self.fingerprint)
+
+    def remove(self, positions: Iterable[int], memories: Sequence[Mapping[str, Any]]):
+        """Drop ``positions``; ``memories`` is the list after they were removed from it."""
+        removed = sorted(set(positions))
+        if not removed:
+            return
+        # Old position -> new position for every memory that stays
+        shift = {}
+        kept_lengths = []
+        dropped = 0
+        for position, length in enumerate(self.lengths):
+            if dropped < len(removed) and removed[dropped] == position:
+                dropped += 1
+                self.total_length -= length
+                continue
+            shift[position] = position - dropped
+            kept_lengths.append(length)
+        postings = {}
+        for term, docs in self.postings.items():
+            moved = {shift[position]: tf for position, tf in docs.items() if position in shift}
+            if moved:
+                postings[term] = moved
+        self.postings = postings
+        self.lengths = kept_lengths
+        self.fingerprint = fingerprint(memories)
+
+    def search(
+        self,
+        memories: Sequence[Mapping[str, Any]],
+        query: str,
+        n: int = 5,
+        now: Optional[int] = None,
+        half_life: float = 1000.0,
+        recency_weight: float = 0.5,
+        priority_weight: float = 0.25,
+    ) -> List[Tuple[float, int]]:
+        """``(score, position)`` of the ``n`` best memories for ``query``, best first.
+
+        The BM25 score is multiplied by ``1 + priority_weight * priority``
+        and, when ``now`` is given, by a recency factor that halves every
+        ``half_life`` ticks of age, applied with ``recency_weight`` so old
+        memories fade but are never excluded. Only memories sharing a term
+        with the query are scored.
+        """
+        count = len(self.lengths)
+        if not count:
+            return []
+        average = self.total_length / count or 1.0
+        k1, b = self.K1, self.B
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (count - len(docs) + 0.5) / (len(docs) + 0.5))
+            lengths = self.lengths
+            for position, tf in docs.items():
+                norm = k1 * (1 - b + b * lengths[position] / average)
+                scores[position] = scores.get(position, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+        ranked = []
+        for position, score in scores.items():
+            memory = memories[position]
+            score *= 1 + priority_weight * priority_of(memory)
+            if now is not None:
+                age = max(now - memory.get("tick", now), 0)
+                score *= 1 - recency_weight + recency_weight * 0.5 ** (age / half_life)
+            ranked.append((score, position))
+        return heapq.nlargest(n, ranked, key=lambda pair: (pair[0], -pair[1]))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": INDEX_VERSION,
+            "fingerprint": self.fingerprint,
+            "lengths": list(self.lengths),
+            # Flattened [position, tf, position, tf, ...] per term
+            "postings": {
+                term: [value for pair in docs.items() for value in pair] for term, docs in self.postings.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> Optional["MemoryIndex"]:
+        """Index saved by ``to_dict``, or None if it was written by another version."""
+        if data.get("version") != INDEX_VERSION:
+            return None
+        index = cls()
+        index.verified = False
+        index.fingerprint = data["fingerprint"]
+        index.lengths = list(data["lengths"])
+        index.total_length = sum(index.lengths)
+        index.postings = {
+            term: dict(zip(flat[::2], flat[1::2])) for term, flat in data["postings"].items()
+        }
+        return index
@@ -0,0 +1,226 @@
+"""Offline semantic search over an NPC's long-term ``memories``.
+
+Texts are embedded locally by feature hashing: every word and every
+character trigram of a word is hashed to one of ``dim`` signed buckets and
+the vector is L2-normalised, so related wordings ("dragons", "dragon's")
+share most of their trigrams. Nothing is downloaded and no GPU is needed.
+
+A ``MemoryVectors`` bank keeps one NPC's embeddings as rows of a
+contiguous ``float32`` matrix, so a query is one matrix-vector product
+followed by a top-k selection. Banks are saved as standard ``.npy`` files
+and can be opened memory-mapped, leaving the rows on disk until a query
+touches them. NumPy is used when installed; otherwise the same API runs on
+``array.array`` rows with plain loops.
+"""
+from __future__ import annotations
+
+import ast
+import heapq
+import math
+import mmap
+import operator
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .memory_index import fingerprint, memory_text, tokenize
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+DEFAULT_DIM = 256
+VECTORS_VERSION = 1
+# Trigrams count for less than whole words
+_TRIGRAM_WEIGHT = 0.5
+_NPY_MAGIC = b"\x93NUMPY\x01\x00"
+
+
+def embed(text: str, dim: int = DEFAULT_DIM) -> List[float]:
+    """Unit-length hashed word and trigram features of ``text``."""
+    vector = [0.0] * dim
+    for token in tokenize(text):
+        features = [(f"w:{token}", 1.0)]
+        padded = f"<{token}>"
+        features.extend((padded[i : i + 3], _TRIGRAM_WEIGHT) for i in range(len(padded) - 2))
+        for feature, weight in features:
+            bucket = zlib.crc32(feature.encode("utf-8"))
+            # The top bit picks the sign so colliding features tend to cancel out
+            vector[bucket % dim] += weight if bucket & 0x80000000 else -weight
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm:
+        vector = [value / norm for value in vector]
+    return vector
+
+
+def _npy_bytes(data: bytes, rows: int, dim: int) -> bytes:
+    header = f"{{'descr': '<f4', 'fortran_order': False, 'shape': ({rows}, {dim}), }}"
+    # Magic, version, length field, header and newline padded to 64 bytes
+    header += " " * (-(len(_NPY_MAGIC) + 2 + len(header) + 1) % 64) + "\n"
+    return _NPY_MAGIC + struct.pack("<H", len(header)) + header.encode("latin1") + data
+
+
+def _read_npy_header(data) -> Tuple[Tuple[int, int], int]:
+    if bytes(data[: len(_NPY_MAGIC)]) != _NPY_MAGIC:
+        raise ValueError("not a version 1.0 .npy file")
+    (length,) = struct.unpack_from("<H", data, len(_NPY_MAGIC))
+    start = len(_NPY_MAGIC) + 2
+    header = ast.literal_eval(bytes(data[start : start + length]).decode("latin1"))
+    if header["descr"] != "<f4" or header["fortran_order"]:
+        raise ValueError("expected a C-ordered little-endian float32 matrix")
+    return header["shape"], start + length
+
+
+class MemoryVectors:
+    """Embedding matrix of one NPC's memories, row ``i`` for ``memories[i]``.
+
+    Kept in step with the memory list through ``add`` and ``remove`` like
+    ``MemoryIndex``, with the same ``matches`` check. A memory-mapped bank
+    is read-only; the first change copies it into memory.
+    """
+
+    def __init__(self, dim: int = DEFAULT_DIM, use_numpy: Optional[bool] = None):
+        self.dim = dim
+        self.use_numpy = np is not None if use_numpy is None else use_numpy and np is not None
+        self.count = 0
+        self.fingerprint = 0
+        # Set once the bank is known to describe the current memory list
+        self.verified = True
+        if self.use_numpy:
+            self._matrix = np.zeros((16, dim), dtype=np.float32)
+        else:
+            # Row-major floats; a read-only memoryview while mapped from disk
+            self._rows: Any = array("f")
+
+    @classmethod
+    def build(cls, memories: Iterable[Mapping[str, Any]], dim: int = DEFAULT_DIM, use_numpy: Optional[bool] = None):
+        bank = cls(dim, use_numpy)
+        for memory in memories:
+            bank.add(memory)
+        return bank
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def matrix(self):
+        """The ``count x dim`` embeddings (a NumPy view, or the flat row buffer without NumPy)."""
+        return self._matrix[: self.count] if self.use_numpy else self._rows
+
+    def matches(self, memories: Sequence[Mapping[str, Any]]) -> bool:
+        if len(memories) != self.count:
+            return False
+        if not self.verified:
+            self.verified = fingerprint(memories) == self.fingerprint
+        return self.verified
+
+    def _writable(self):
+        if self.use_numpy:
+            if not self._matrix.flags.writeable:
+                self._matrix = np.array(self._matrix[: self.count])
+        elif not isinstance(self._rows, array):
+            self._rows = array("f", self._rows)
+
+    def add(self, memory: Mapping[str, Any]):
+        """Embed ``memory``, which was appended to the end of the memory list."""
+        self._writable()
+        text = memory_text(memory)
+        vector = embed(text, self.dim)
+        if self.use_numpy:
+            if self.count == len(self._matrix):
+                grown = np.zeros((max(16, 2 * self.count), self.dim), dtype=np.float32)
+                grown[: self.count] = self._matrix[: self.count]
+                self._matrix = grown
+            self._matrix[self.count] = vector
+        else:
+            self._rows.extend(vector)
+        self.count += 1
+        self.fingerprint = zlib.crc32(text.encode("utf-8"), self.fingerprint)
+
+    def remove(self, positions: Iterable[int], memories: Sequence[Mapping[str, Any]]):
+        """Drop the rows at ``positions``; ``memories`` is the list after they were removed."""
+        drop = set(positions)
+        if not drop:
+            return
+        self._writable()
+        keep = [row for row in range(self.count) if row not in drop]
+        if self.use_numpy:
+            self._matrix = self._matrix[keep]
+        else:
+            dim, rows = self.dim, self._rows
+            self._rows = array("f")
+            for row in keep:
+                self._rows.extend(rows[row * dim : (row + 1) * dim])
+        self.count = len(keep)
+        self.fingerprint = fingerprint(memories)
+
+    def search(self, query: str, n: int = 5) -> List[Tuple[float, int]]:
+        """``(cosine similarity, position)`` of the ``n`` closest memories, best first."""
+        if not self.count or n <= 0:
+            return []
+        vector = embed(query, self.dim)
+        if self.use_numpy:
+            scores = self.matrix @ np.asarray(vector, dtype=np.float32)
+            if n < self.count:
+                top = np.argpartition(-scores, n - 1)[:n]
+            else:
+                top = np.arange(self.count)
+            # Stable order: best score first, earlier memory on ties
+            top = top[np.lexsort((top, -scores[top]))]
+            return [(float(scores[row]), int(row)) for row in top]
+        dim, rows = self.dim, self._rows
+        scores = (
+            (sum(map(operator.mul, rows[row * dim : (row + 1) * dim], vector)), row) for row in range(self.count)
+        )
+        return heapq.nlargest(n, scores, key=lambda pair: (pair[0], -pair[1]))
+
+    def meta(self) -> Dict[str, Any]:
+        return {"version": VECTORS_VERSION, "fingerprint": self.fingerprint, "count": self.count, "dim": self.dim}
+
+    def to_npy(self) -> bytes:
+        """The matrix as the bytes of a ``.npy`` file."""
+        if self.use_numpy:
+            data = self.matrix.astype("<f4", copy=False).tobytes()
+        else:
+            rows = array("f", self._rows)
+            if sys.byteorder == "big":
+                rows.byteswap()
+            data = rows.tobytes()
+        return _npy_bytes(data, self.count, self.dim)
+
+    @classmethod
+    def open(
+        cls, path: Path, meta: Mapping[str, Any], use_mmap: bool = True, use_numpy: Optional[bool] = None
+    ) -> Optional["MemoryVectors"]:
+        """Bank saved as ``path`` (``.npy``) with ``meta``; None if they do not belong together."""
+        if meta.get("version") != VECTORS_VERSION:
+            return None
+        bank = cls(meta["dim"], use_numpy)
+        if bank.use_numpy:
+            matrix = np.load(path, mmap_mode="r" if use_mmap else None)
+            shape = matrix.shape
+            bank._matrix = matrix
+        else:
+            with open(path, "rb") as f:
+                if use_mmap and sys.byteorder == "little":
+                    data = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+                else:
+                    data = f.read()
+            shape, offset = _read_npy_header(data)
+            rows = memoryview(data)[offset:]
+            if isinstance(data, bytes) or sys.byteorder == "big":
+                bank._rows = array("f", bytes(rows))
+                if sys.byteorder == "big":
+                    bank._rows.byteswap()
+            else:
+                bank._rows = rows.cast("f")
+        if tuple(shape) != (meta["count"], meta["dim"]):
+            return None
+        bank.count = meta["count"]
+        bank.fingerprint = meta["fingerprint"]
+        bank.verified = False
+        return bank
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any
 
 from .events import Event
 from .world_state import WorldState
@@ -12,155 +12,213 @@ class Narrator:
 
     def __init__(self, world: WorldState):
         self.world = world
+        # event_type -> callback returning the text for that event
+        self.renderers: Dict[str, Callable[[Event], str]] = {
+            "describe_location": self._render_describe_location,
+            "move": self._render_move,
+            "grab": self._render_grab,
+            "drop": self._render_drop,
+            "eat": self._render_eat,
+            "attack_attempt": self._render_attack_attempt,
+            "attack_hit": self._render_attack_hit,
+            "attack_missed": self._render_attack_missed,
+            "damage_applied": self._render_damage_applied,
+            "talk": self._render_talk,
+            "scream": self._render_scream,
+            "talk_loud": self._render_talk_loud,
+            "inventory": self._render_inventory,
+            "stats": self._render_stats,
+            "equip": self._render_equip,
+            "unequip": self._render_unequip,
+            "analyze": self._render_analyze,
+            "give": self._render_give,
+            "toggle_starvation": self._render_toggle_starvation,
+            "open_connection": self._render_open_connection,
+            "close_connection": self._render_close_connection,
+            "npc_died": self._render_npc_died,
+            "wait": self._render_wait,
+            "rest": self._render_rest,
+        }
+
+    def register_renderer(self, event_type: str, renderer: Callable[[Event], str]):
+        """Register ``renderer`` to describe ``event_type`` events."""
+        self.renderers[event_type] = renderer
 
     def render(self, event: Event, extra: Optional[Dict[str, Any]] = None) -> str:
-        if event.event_type == "describe_location":
-            description = event.payload.get("description", "")
-            occupants = event.payload.get("occupants", [])
-            items = event.payload.get("items", [])
-            parts = [description]
-            if occupants:
-                parts.append("You see: " + ", ".join(occupants))
-            if items:
-                parts.append("Items here: " + ", ".join(items))
-            return " ".join(parts).strip()
-        elif event.event_type == "move":
-            actor = self.world.get_npc(event.actor_id)
-            loc = self.world.get_location_static(event.target_ids[0])
-            return f"{actor.name} moves to {loc.description}"
-        elif event.event_type == "grab":
-            actor = self.world.get_npc(event.actor_id)
-            item = self.world.get_item_instance(event.target_ids[0])
-            bp = self.world.get_item_blueprint(item.blueprint_id)
-            return f"{actor.name} picks up {bp.name}."
-        elif event.event_type == "drop":
-            actor = self.world.get_npc(event.actor_id)
-            item = self.world.get_item_instance(event.target_ids[0])
-            bp = self.world.get_item_blueprint(item.blueprint_id)
-            return f"{actor.name} drops {bp.name}."
-        elif event.event_type == "eat":
-            actor = self.world.get_npc(event.actor_id)
-            item_name = event.payload.get("item_name", "something")
-            return f"{actor.name} eats {item_name}."
-        elif event.event_type == "attack_attempt":
-            attacker = self.world.get_npc(event.actor_id)
-            target = self.world.get_npc(event.target_ids[0])
-            weapon = combat_rules.get_weapon(self.world, attacker)
-            return f"{attacker.name} attacks {target.name} with {weapon.name}."
-        elif event.event_type == "attack_hit":
-            attacker = self.world.get_npc(event.actor_id)
-            target = self.world.get_npc(event.target_ids[0])
-            return (
-                f"{attacker.name} hits {target.name} "
-                f"(roll {event.payload['to_hit']} vs AC {event.payload['target_ac']})"
-            )
-        elif event.event_type == "attack_missed":
-            attacker = self.world.get_npc(event.actor_id)
-            target = self.world.get_npc(event.target_ids[0])
-            return (
-                f"{attacker.name} misses {target.name} "
-                f"(roll {event.payload['to_hit']} vs AC {event.payload['target_ac']})"
-            )
-        elif event.event_type == "damage_applied":
-            target = self.world.get_npc(event.target_ids[0])
-            amount = event.payload.get("amount", 0)
-            dmg_type = event.payload.get("damage_type", "")
-            return f"{target.name} takes {amount} {dmg_type} damage (HP: {target.hp})"
-        elif event.event_type == "talk":
-            speaker = self.world.get_npc(event.actor_id)
-            content = event.payload.get("content", "")
-            if event.target_ids:
-                target = self.world.get_npc(event.target_ids[0])
-                return f"{speaker.name} to {target.name}: {content}"
-            return f"{speaker.name} says: {content}"
-        elif event.event_type == "scream":
-            speaker = self.world.get_npc(event.actor_id)
-            content = event.payload.get("content", "")
-            return f"{speaker.name} screams: {content}"
-        elif event.event_type == "talk_loud":
-            speaker = self.world.get_npc(event.actor_id)
-            content = event.payload.get("content", "")
-            return f"{speaker.name} shouts: {content}"
-        elif event.event_type == "inventory":
-            actor = self.world.get_npc(event.actor_id)
-            items = event.payload.get("items", [])
-            if items:
-                return f"{actor.name} carries: {', '.join(items)}"
-            return f"{actor.name} carries nothing."
-        elif event.event_type == "stats":
-            actor = self.world.get_npc(event.actor_id)
-            hp = event.payload.get("hp", 0)
-            attrs = event.payload.get("attributes", {})
-            skills = event.payload.get("skills", {})
-            hunger = event.payload.get("hunger_stage")
-            parts = [f"HP: {hp}"]
-            if attrs:
-                attr_str = ", ".join(f"{k}: {v}" for k, v in attrs.items())
-                parts.append(f"Attributes: {attr_str}")
-            if skills:
-                skill_str = ", ".join(f"{k} ({v})" for k, v in skills.items())
-                parts.append(f"Skills: {skill_str}")
-            if hunger:
-                parts.append(f"Hunger: {hunger}")
-            return f"{actor.name} stats - " + "; ".join(parts)
-        elif event.event_type == "equip":
-            actor = self.world.get_npc(event.actor_id)
-            item = self.world.get_item_instance(event.target_ids[0])
-            bp = self.world.get_item_blueprint(item.blueprint_id)
-            slot = event.payload.get("slot", "")
-            return f"{actor.name} equips {bp.name} to {slot}."
-        elif event.event_type == "unequip":
-            actor = self.world.get_npc(event.actor_id)
-            item = self.world.get_item_instance(event.target_ids[0])
-            bp = self.world.get_item_blueprint(item.blueprint_id)
-            slot = event.payload.get("slot", "")
-            return f"{actor.name} removes {bp.name} from {slot}."
-        elif event.event_type == "analyze":
-            name = event.payload.get("name", "")
-            weight = event.payload.get("weight")
-            damage = event.payload.get("damage_dice")
-            dmg_type = event.payload.get("damage_type")
-            armour = event.payload.get("armour_rating")
-            props = event.payload.get("properties", [])
-            parts = [f"{name} (weight {weight})"]
-            if damage:
-                parts.append(f"Damage: {damage} {dmg_type}")
-            if armour:
-                parts.append(f"Armour rating: {armour}")
-            if props:
-                parts.append("Properties: " + ", ".join(props))
-            return " ".join(parts)
-        elif event.event_type == "give":
-            actor = self.world.get_npc(event.actor_id)
-            item = self.world.get_item_instance(event.target_ids[0])
-            target = self.world.get_npc(event.target_ids[1])
-            bp = self.world.get_item_blueprint(item.blueprint_id)
-            return f"{actor.name} gives {bp.name} to {target.name}."
-        elif event.event_type == "toggle_starvation":
-            enabled = event.payload.get("enabled", True)
-            return "Starvation enabled." if enabled else "Starvation disabled."
-        elif event.event_type == "open_connection":
-            actor = self.world.get_npc(event.actor_id)
-            loc = self.world.get_location_static(event.target_ids[0])
-            return f"{actor.name} opens the way to {loc.description}."
-        elif event.event_type == "close_connection":
-            actor = self.world.get_npc(event.actor_id)
-            loc = self.world.get_location_static(event.target_ids[0])
-            return f"{actor.name} closes the way to {loc.description}."
-        elif event.event_type == "npc_died":
-            actor = self.world.get_npc(event.actor_id)
-            return f"{actor.name} dies."
-        elif event.event_type == "wait":
-            actor = self.world.get_npc(event.actor_id)
-            ticks = event.payload.get("ticks", 1)
-            if ticks == 1:
-                return f"{actor.name} waits."
-            return f"{actor.name} waits for {ticks} ticks."
-        elif event.event_type == "rest":
-            actor = self.world.get_npc(event.actor_id)
-            ticks = event.payload.get("ticks", 1)
-            healed = event.payload.get("healed", 0)
-            if ticks == 1:
-                return f"{actor.name} rests and recovers {healed} HP."
-            return f"{actor.name} rests for {ticks} ticks and recovers {healed} HP."
+        renderer = self.renderers.get(event.event_type)
+        if renderer:
+            return renderer(event)
         return ""
+
+    def _render_describe_location(self, event: Event) -> str:
+        description = event.payload.get("description", "")
+        occupants = event.payload.get("occupants", [])
+        items = event.payload.get("items", [])
+        parts = [description]
+        if occupants:
+            parts.append("You see: " + ", ".join(occupants))
+        if items:
+            parts.append("Items here: " + ", ".join(items))
+        return " ".join(parts).strip()
+
+    def _render_move(self, event: Event) -> str:
+        actor = self.world.get_npc(event.actor_id)
+        loc = self.world.get_location_static(event.target_ids[0])
+        return f"{actor.name} moves to {loc.description}"
+
+    def _render_grab(self, event: Event) -> str:
+        actor = self.world.get_npc(event.actor_id)
+        item = self.world.get_item_instance(event.target_ids[0])
+        bp = self.world.get_item_blueprint(item.blueprint_id)
+        return f"{actor.name} picks up {bp.name}."
+
+    def _render_drop(self, event: Event) -> str:
+        actor = self.world.get_npc(event.actor_id)
+        item = self.world.get_item_instance(event.target_ids[0])
+        bp = self.world.get_item_blueprint(item.blueprint_id)
+        return f"{actor.name} drops {bp.name}."
+
+    def _render_eat(self, event: Event) -> str:
+        actor = self.world.get_npc(event.actor_id)
+        item_name = event.payload.get("item_name", "something")
+        return f"{actor.name} eats {item_name}."
+
+    def _render_attack_attempt(self, event: Event) -> str:
+        attacker = self.world.get_npc(event.actor_id)
+        target = self.world.get_npc(event.target_ids[0])
+        weapon = combat_rules.get_weapon(self.world, attacker)
+        return f"{attacker.name} attacks {target.name} with {weapon.name}."
+
+    def _render_attack_hit(self, event: Event) -> str:
+        attacker = self.world.get_npc(event.actor_id)
+        target = self.world.get_npc(event.target_ids[0])
+        return (
+            f"{attacker.name} hits {target.name} "
+            f"(roll {event.payload['to_hit']} vs AC {event.payload['target_ac']})"
+        )
+
+    def _render_attack_missed(self, event: Event) -> str:
+        attacker = self.world.get_npc(event.actor_id)
+        target = self.world.get_npc(event.target_ids[0])
+        return (
+            f"{attacker.name} misses {target.name} "
+            f"(roll {event.payload['to_hit']} vs AC {event.payload['target_ac']})"
+        )
+
+    def _render_damage_applied(self, event: Event) -> str:
+        target = self.world.get_npc(event.target_ids[0])
+        amount = event.payload.get("amount", 0)
+        dmg_type = event.payload.get("damage_type", "")
+        return f"{target.name} takes {amount} {dmg_type} damage (HP: {target.hp})"
+
+    def _render_talk(self, event: Event) -> str:
+        speaker = self.world.get_npc(event.actor_id)
+        content = event.payload.get("content", "")
+        if event.target_ids:
+            target = self.world.get_npc(event.target_ids[0])
+            return f"{speaker.name} to {target.name}: {content}"
+        return f"{speaker.name} says: {content}"
+
+    def _render_scream(self, event: Event) -> str:
+        speaker = self.world.get_npc(event.actor_id)
+        content = event.payload.get("content", "")
+        return f"{speaker.name} screams: {content}"
+
+    def _render_talk_loud(self, event: Event) -> str:
+        speaker = self.world.get_npc(event.actor_id)
+        content = event.payload.get("content", "")
+        return f"{speaker.name} shouts: {content}"
+
+    def _render_inventory(self, event: Event) -> str:
+        actor = self.world.get_npc(event.actor_id)
+        items = event.payload.get("items", [])
+        if items:
+            return f"{actor.name} carries: {', '.join(items)}"
+        return f"{actor.name} carries nothing."
+
+    def _render_stats(self, event: Event) -> str:
+        actor = self.world.get_npc(event.actor_id)
+        hp = event.payload.get("hp", 0)
+        attrs = event.payload.get("attributes", {})
+        skills = event.payload.get("skills", {})
+        hunger = event.payload.get("hunger_stage")
+        parts = [f"HP: {hp}"]
+        if attrs:
+            attr_str = ", ".join(f"{k}: {v}" for k, v in attrs.items())
+            parts.append(f"Attributes: {attr_str}")
+        if skills:
+            skill_str = ", ".join(f"{k} ({v})" for k, v in skills.items())
+            parts.append(f"Skills: {skill_str}")
+        if hunger:
+            parts.append(f"Hunger: {hunger}")
+        return f"{actor.name} stats - " + "; ".join(parts)
+
+    def _render_equip(self, event: Event) -> str:
+        actor = self.world.get_npc(event.actor_id)
+        item = self.world.get_item_instance(event.target_ids[0])
+        bp = self.world.get_item_blueprint(item.blueprint_id)
+        slot = event.payload.get("slot", "")
+        return f"{actor.name} equips {bp.name} to {slot}."
+
+    def _render_unequip(self, event: Event) -> str:
+        actor = self.world.get_npc(event.actor_id)
+        item = self.world.get_item_instance(event.target_ids[0])
+        bp = self.world.get_item_blueprint(item.blueprint_id)
+        slot = event.payload.get("slot", "")
+        return f"{actor.name} removes {bp.name} from {slot}."
+
+    def _render_analyze(self, event: Event) -> str:
+        name = event.payload.get("name", "")
+        weight = event.payload.get("weight")
+        damage = event.payload.get("damage_dice")
+        dmg_type = event.payload.get("damage_type")
+        armour = event.payload.get("armour_rating")
+        props = event.payload.get("properties", [])
+        parts = [f"{name} (weight {weight})"]
+        if damage:
+            parts.append(f"Damage: {damage} {dmg_type}")
+        if armour:
+            parts.append(f"Armour rating: {armour}")
+        if props:
+            parts.append("Properties: " + ", ".join(props))
+        return " ".join(parts)
+
+    def _render_give(self, event: Event) -> str:
+        actor = self.world.get_npc(event.actor_id)
+        item = self.world.get_item_instance(event.target_ids[0])
+        target = self.world.get_npc(event.target_ids[1])
+        bp = self.world.get_item_blueprint(item.blueprint_id)
+        return f"{actor.name} gives {bp.name} to {target.name}."
+
+    def _render_toggle_starvation(self, event: Event) -> str:
+        enabled = event.payload.get("enabled", True)
+        return "Starvation enabled." if enabled else "Starvation disabled."
+
+    def _render_open_connection(self, event: Event) -> str:
+        actor = self.world.get_npc(event.actor_id)
+        loc = self.world.get_location_static(event.target_ids[0])
+        return f"{actor.name} opens the way to {loc.description}."
+
+    def _render_close_connection(self, event: Event) -> str:
+        actor = self.world.get_npc(event.actor_id)
+        loc = self.world.get_location_static(event.target_ids[0])
+        return f"{actor.name} closes the way to {loc.description}."
+
+    def _render_npc_died(self, event: Event) -> str:
+        actor = self.world.get_npc(event.actor_id)
+        return f"{actor.name} dies."
+
+    def _render_wait(self, event: Event) -> str:
+        actor = self.world.get_npc(event.actor_id)
+        ticks = event.payload.get("ticks", 1)
+        if ticks == 1:
+            return f"{actor.name} waits."
+        return f"{actor.name} waits for {ticks} ticks."
+
+    def _render_rest(self, event: Event) -> str:
+        actor = self.world.get_npc(event.actor_id)
+        ticks = event.payload.get("ticks", 1)
+        healed = event.payload.get("healed", 0)
+        if ticks == 1:
+            return f"{actor.name} rests and recovers {healed} HP."
+        return f"{actor.name} rests for {ticks} ticks and recovers {healed} HP."
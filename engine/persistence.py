@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
+
+# A batch is a list of (path, document); a document of None deletes the file
+WriteBatch = Sequence[Tuple[Path, Optional[Union[dict, bytes]]]]
+
+
+def fsync_directory(directory: Path):
+    """Make renames and deletions in ``directory`` durable.
+
+    A no-op where directories cannot be opened, such as on Windows.
+    """
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_atomic(path: Path, data: Union[dict, bytes], sync_directory: bool = True):
+    """Write ``data`` as JSON, or as is for bytes, to ``path`` through a temporary file and a rename.
+
+    Readers see either the old file or the new one, never a partial write.
+    The temporary file is fsynced before the rename, so a crash cannot leave
+    the new name pointing at missing data, and the directory afterwards
+    unless ``sync_directory`` is false (``write_batch`` syncs each directory
+    once instead). The parent directory must exist.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data if isinstance(data, bytes) else json.dumps(data).encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    if sync_directory:
+        fsync_directory(path.parent)
+
+
+def write_batch(batch: WriteBatch):
+    for directory in {path.parent for path, data in batch if data is not None}:
+        directory.mkdir(parents=True, exist_ok=True)
+    for path, data in batch:
+        if data is None:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        else:
+            write_atomic(path, data, sync_directory=False)
+    for directory in {path.parent for path, _ in batch}:
+        fsync_directory(directory)
+
+
+class BackgroundWriter:
+    """Writes batches from a queue on a daemon thread, in submission order.
+
+    ``WorldState.save(background=True)`` serialises the dirty entities on the
+    caller's thread and only hands the file I/O to this writer, so the
+    simulation never waits on the disk. ``flush`` blocks until everything
+    submitted so far is on disk and re-raises the first write error.
+    """
+
+    def __init__(self):
+        self._queue: "queue.Queue[Optional[WriteBatch]]" = queue.Queue()
+        self._errors: List[BaseException] = []
+        self._thread = threading.Thread(target=self._run, name="world-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, batch: WriteBatch):
+        self._queue.put(batch)
+
+    def _run(self):
+        while True:
+            batch = self._queue.get()
+            try:
+                if batch is None:
+                    return
+                write_batch(batch)
+            except BaseException as exc:  # surfaced by flush()
+                self._errors.append(exc)
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        self._queue.join()
+        if self._errors:
+            error = self._errors[0]
+            self._errors.clear()
+            raise error
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+        self.flush()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import cProfile
+import csv
+import json
+import math
+import pstats
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+
+class TickProfiler:
+    """Wall time and call counts per simulator phase, event type and tool.
+
+    ``Simulator.enable_profiling`` installs timing wrappers around the
+    simulator's phase methods, so nothing is measured (and nothing is paid)
+    while profiling is off. Times are inclusive: ``handle_event`` contains the
+    ``record_perception`` time of the same event.
+    """
+
+    def __init__(self, window: int = 1000):
+        self.totals: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        # Durations of the most recent ticks, for the rolling histogram
+        self.tick_times: Deque[float] = deque(maxlen=window)
+        self.profile_range: Optional[Tuple[int, int, Optional[Path]]] = None
+        self.profile_stats: Optional[pstats.Stats] = None
+        self._cprofile: Optional[cProfile.Profile] = None
+
+    def record(self, key: str, seconds: float):
+        self.totals[key] = self.totals.get(key, 0.0) + seconds
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+    def timed(self, phase: str, func: Callable, key: Optional[Callable[..., str]] = None) -> Callable:
+        """Wrap ``func`` so each call is recorded under ``phase`` and ``phase:<key>``."""
+        perf_counter = time.perf_counter
+
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                self.record(phase, elapsed)
+                if key is not None:
+                    self.record(f"{phase}:{key(*args, **kwargs)}", elapsed)
+
+        return wrapper
+
+    def profile_ticks(self, start: int, end: int, path: Optional[Path] = None):
+        """Capture a cProfile of ticks ``start``..``end`` inclusive, dumped to ``path`` if given."""
+        self.profile_range = (start, end, path)
+        self.profile_stats = None
+
+    def begin_tick(self, tick: int):
+        if self.profile_range is None:
+            return
+        start, end, _ = self.profile_range
+        if tick > end:
+            # advance_until skipped the rest of the range
+            self._finish_profile()
+        elif tick >= start:
+            if self._cprofile is None:
+                self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def end_tick(self, tick: int, seconds: float):
+        self.record("tick", seconds)
+        self.tick_times.append(seconds)
+        if self._cprofile is None:
+            return
+        self._cprofile.disable()
+        if tick >= self.profile_range[1]:
+            self._finish_profile()
+
+    def _finish_profile(self):
+        """Keep and dump what was captured; a range that saw no ticks is dropped."""
+        if self._cprofile is not None:
+            self.profile_stats = pstats.Stats(self._cprofile)
+            if self.profile_range[2] is not None:
+                self.profile_stats.dump_stats(str(self.profile_range[2]))
+            self._cprofile = None
+        self.profile_range = None
+
+    def histogram(self) -> List[Tuple[float, int]]:
+        """Bucket recent tick durations by powers of two; returns (upper bound in ms, count)."""
+        buckets: Dict[int, int] = {}
+        for seconds in self.tick_times:
+            micros = max(seconds * 1e6, 1.0)
+            exponent = math.ceil(math.log2(micros))
+            buckets[exponent] = buckets.get(exponent, 0) + 1
+        return [((2 ** exp) / 1000, buckets[exp]) for exp in sorted(buckets)]
+
+    def summary(self) -> List[Dict[str, Any]]:
+        rows = []
+        for key in sorted(self.totals, key=self.totals.get, reverse=True):
+            total = self.totals[key]
+            calls = self.counts[key]
+            rows.append(
+                {
+                    "phase": key,
+                    "calls": calls,
+                    "total_ms": round(total * 1000, 3),
+                    "mean_us": round(total / calls * 1e6, 2),
+                }
+            )
+        return rows
+
+    def report(self) -> str:
+        lines = [f"{'phase':<36} {'calls':>8} {'total ms':>10} {'mean us':>10}"]
+        for row in self.summary():
+            lines.append(f"{row['phase']:<36} {row['calls']:>8} {row['total_ms']:>10.2f} {row['mean_us']:>10.1f}")
+        histogram = self.histogram()
+        if histogram:
+            lines.append(f"tick durations (last {len(self.tick_times)} ticks):")
+            for upper_ms, count in histogram:
+                lines.append(f"  <= {upper_ms:>9.3f} ms: {count}")
+        return "\n".join(lines)
+
+    def export(self, path: Path):
+        """Write the summary as CSV when ``path`` ends in .csv, JSON otherwise."""
+        path = Path(path)
+        if path.suffix == ".csv":
+            with open(path, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=["phase", "calls", "total_ms", "mean_us"])
+                writer.writeheader()
+                writer.writerows(self.summary())
+            return
+        data = {
+            "phases": self.summary(),
+            "tick_histogram_ms": [[upper, count] for upper, count in self.histogram()],
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
+    def reset(self):
+        self.totals.clear()
+        self.counts.clear()
+        self.tick_times.clear()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import hashlib
+import random
+from typing import Dict, Optional, Sequence, Tuple
+
+STREAMS: Tuple[str, ...] = ("combat", "ai", "world")
+
+
+def derive_seed(seed: int, key: str) -> int:
+    """A 64-bit seed for ``key`` under ``seed``, identical on every run and platform.
+
+    ``hash()`` of a string changes with ``PYTHONHASHSEED``, so it cannot be used here.
+    """
+    digest = hashlib.blake2b(f"{seed}:{key}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class RngStreams:
+    """Independent seeded ``random.Random`` streams owned by one simulator.
+
+    ``combat`` rolls attack and damage dice, ``ai`` drives ``npc_think`` and
+    ``world`` is handed to tools. Keeping them apart means that, for example,
+    an extra NPC decision does not shift every later dice roll. ``fork``
+    derives a child set of streams from the seed alone, so shards or
+    parallel runs get reproducible streams regardless of how far the parent
+    has advanced.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        # Without a seed, draw one from the global RNG so random.seed() still pins a run
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.combat = random.Random(derive_seed(self.seed, "combat"))
+        self.ai = random.Random(derive_seed(self.seed, "ai"))
+        self.world = random.Random(derive_seed(self.seed, "world"))
+
+    def fork(self, key) -> "RngStreams":
+        return RngStreams(derive_seed(self.seed, f"fork:{key}"))
+
+    def count_draws(self, enabled: bool = True):
+        """Start counting, from zero, the 32-bit words each stream draws, or stop.
+
+        Counting wraps ``random`` (two words) and ``getrandbits`` (one word
+        per 32 bits) as instance attributes, which every ``random.Random``
+        method the engine uses draws through, so the count is exact while
+        uncounted streams run at full speed. With a saved state and two
+        counts, ``skip`` reproduces every later state; the journal relies on
+        it to restore the RNG at ticks without a checkpoint.
+        """
+        for name in STREAMS:
+            stream = getattr(self, name)
+            for attr in ("random", "getrandbits", "draws"):
+                stream.__dict__.pop(attr, None)
+            if enabled:
+                _count_draws(stream)
+
+    def draws(self) -> Tuple[int, ...]:
+        """Words drawn by each stream, in ``STREAMS`` order, since ``count_draws``; zeros when not counting."""
+        return tuple(getattr(self, name).__dict__.get("draws", 0) for name in STREAMS)
+
+    def skip(self, words: Sequence[int]):
+        """Advance each stream as if it had drawn ``words`` (in ``STREAMS`` order) more words."""
+        for name, count in zip(STREAMS, words):
+            stream = getattr(self, name)
+            while count > 0:
+                # getrandbits(32 * n) draws exactly n words in one call
+                chunk = min(count, 1 << 20)
+                stream.getrandbits(32 * chunk)
+                count -= chunk
+
+    def getstate(self) -> Dict[str, tuple]:
+        return {name: getattr(self, name).getstate() for name in STREAMS}
+
+    def setstate(self, state: Dict[str, tuple]):
+        for name in STREAMS:
+            getattr(self, name).setstate(state[name])
+
+
+def _count_draws(stream: random.Random):
+    stream.draws = 0
+    plain_random, plain_getrandbits = stream.random, stream.getrandbits
+
+    def counted_random() -> float:
+        stream.draws += 2
+        return plain_random()
+
+    def counted_getrandbits(k: int) -> int:
+        stream.draws += (k + 31) // 32
+        return plain_getrandbits(k)
+
+    stream.random = counted_random
+    stream.getrandbits = counted_getrandbits
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import heapq
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .events import Event
+
+
+class EventScheduler:
+    """Priority queue of events ordered by ``(tick, insertion order)``.
+
+    Popping due events only touches the events that are due, so long
+    ``wait``/``rest`` actions scheduled far ahead cost nothing per tick.
+    Cancelled entries stay in the heap and are skipped when they surface.
+    A ``listener`` (the simulator's journal) is told of every change:
+    ``scheduled(handle, event)``, ``cancelled(handle)`` and
+    ``popped(handles)``.
+    """
+
+    def __init__(self):
+        self._heap: List[list] = []
+        self.next_handle = 0
+        # handle -> heap entry [tick, handle, event]; event is None once cancelled
+        self._entries: Dict[int, list] = {}
+        self._by_actor: Dict[str, Set[int]] = {}
+        self.listener: Optional[Any] = None
+
+    @classmethod
+    def restore(cls, pending: Iterable[Tuple[int, Event]], next_handle: int) -> "EventScheduler":
+        """Scheduler holding ``pending`` (handle, event) pairs, as returned by ``pending``."""
+        scheduler = cls()
+        for handle, event in pending:
+            scheduler._push(handle, event)
+        scheduler.next_handle = next_handle
+        return scheduler
+
+    def schedule(self, event: Event) -> int:
+        """Queue ``event`` and return a handle that can be passed to ``cancel``."""
+        handle = self.next_handle
+        self.next_handle += 1
+        self._push(handle, event)
+        if self.listener is not None:
+            self.listener.scheduled(handle, event)
+        return handle
+
+    def _push(self, handle: int, event: Event):
+        entry = [event.tick, handle, event]
+        heapq.heappush(self._heap, entry)
+        self._entries[handle] = entry
+        self._by_actor.setdefault(event.actor_id, set()).add(handle)
+
+    def append(self, event: Event):
+        self.schedule(event)
+
+    def extend(self, events: Iterable[Event]):
+        for event in events:
+            self.schedule(event)
+
+    def cancel(self, handle: int) -> bool:
+        entry = self._entries.pop(handle, None)
+        if entry is None:
+            return False
+        event = entry[2]
+        entry[2] = None
+        self._forget_actor(event.actor_id, handle)
+        if self.listener is not None:
+            self.listener.cancelled(handle)
+        return True
+
+    def cancel_actor(self, actor_id: str, after_tick: Optional[int] = None) -> int:
+        """Cancel events emitted by ``actor_id``, optionally only those due after ``after_tick``."""
+        cancelled = 0
+        for handle in list(self._by_actor.get(actor_id, ())):
+            entry = self._entries[handle]
+            if after_tick is None or entry[0] > after_tick:
+                self.cancel(handle)
+                cancelled += 1
+        return cancelled
+
+    def peek_tick(self) -> Optional[int]:
+        """Return the tick of the earliest pending event, if any."""
+        heap = self._heap
+        while heap and heap[0][2] is None:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def pop_due(self, tick: int) -> List[Event]:
+        """Remove and return every event scheduled at or before ``tick`` in order."""
+        heap = self._heap
+        due: List[Event] = []
+        handles: List[int] = []
+        while heap and heap[0][0] <= tick:
+            _, handle, event = heapq.heappop(heap)
+            if event is None:
+                continue
+            del self._entries[handle]
+            self._forget_actor(event.actor_id, handle)
+            due.append(event)
+            handles.append(handle)
+        if handles and self.listener is not None:
+            self.listener.popped(handles)
+        return due
+
+    def _forget_actor(self, actor_id: str, handle: int):
+        handles = self._by_actor.get(actor_id)
+        if handles is not None:
+            handles.discard(handle)
+            if not handles:
+                del self._by_actor[actor_id]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def __iter__(self) -> Iterator[Event]:
+        """Iterate pending events in the order they will be handled."""
+        for entry in sorted(self._entries.values()):
+            yield entry[2]
+
+    def pending(self) -> List[Tuple[int, Event]]:
+        """``(handle, event)`` for every pending event, in the order they will be handled."""
+        return [(handle, event) for _, handle, event in sorted(self._entries.values())]
+
+
+class ReadyQueue:
+    """Actors keyed by the tick at which they may act next.
+
+    Rescheduling an actor leaves its old heap entry behind; entries whose
+    tick no longer matches the actor's latest schedule are skipped on pop.
+    Actors that become ready on the same tick are returned in the order they
+    were first scheduled, which keeps NPC turns deterministic.
+    """
+
+    def __init__(self):
+        self._heap: List[tuple] = []
+        self._ticks: Dict[str, int] = {}
+        self._order: Dict[str, int] = {}
+
+    def schedule(self, actor_id: str, tick: int):
+        order = self._order.setdefault(actor_id, len(self._order))
+        self._ticks[actor_id] = tick
+        heapq.heappush(self._heap, (tick, order, actor_id))
+
+    def discard(self, actor_id: str):
+        self._ticks.pop(actor_id, None)
+
+    def peek_tick(self) -> Optional[int]:
+        """Return the earliest tick at which a scheduled actor becomes ready."""
+        heap = self._heap
+        while heap and self._ticks.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def pop_ready(self, tick: int) -> List[str]:
+        """Remove and return every actor ready at or before ``tick``."""
+        heap = self._heap
+        ready: List[tuple] = []
+        while heap and heap[0][0] <= tick:
+            scheduled, order, actor_id = heapq.heappop(heap)
+            if self._ticks.get(actor_id) != scheduled:
+                continue
+            del self._ticks[actor_id]
+            ready.append((order, actor_id))
+        ready.sort()
+        return [actor_id for _, actor_id in ready]
+
+    def __contains__(self, actor_id: str) -> bool:
+        return actor_id in self._ticks
+
+    def __len__(self) -> int:
+        return len(self._ticks)
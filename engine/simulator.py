@@ -1,34 +1,277 @@
 from __future__ import annotations
 
-from typing import Dict, Any, List, Optional
-import random
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Optional
+import time
 
-from .world_state import WorldState
+from .world_state import WorldState, HUNGRY_THRESHOLD, STARVING_THRESHOLD, hunger_stage_for
 from .events import Event
-from .data_models import NPC
+from .data_models import NPC, to_dict
+from .memory import Perception
 from .tools.base import Tool
 from .narrator import Narrator
+from .scheduler import EventScheduler, ReadyQueue
+from .profiling import TickProfiler
+from .journal import EventJournal
+from .rng import RngStreams
+from .sound import NOISE_LEVELS, grade as sound_grade
 from rpg import combat_rules
 
 
 class Simulator:
+    # event_type -> noise level in sound.NOISE_LEVELS; other events are normal
+    SOUND_LEVELS: Dict[str, str] = {"talk_loud": "loud", "scream": "scream"}
+
     def __init__(
         self,
         world: WorldState,
         narrator: Optional[Narrator] = None,
         player_id: Optional[str] = None,
+        output: Optional[Callable[[str], None]] = print,
+        seed: Optional[int] = None,
     ):
         self.world = world
         self.game_tick = 0
-        self.event_queue: List[Event] = []
+        # Separate combat, ai and world streams; the same seed and commands replay exactly
+        self.rng = RngStreams(seed)
         self.tools: Dict[str, Tool] = {}
         self.narrator = narrator or Narrator(world)
         self.player_id = player_id
+        # Receives narration text; None skips rendering entirely (headless runs)
+        self.output = output
+        self.events_handled = 0
+        self.profiler: Optional[TickProfiler] = None
         self.starvation_enabled = True
+        # World.save() runs every autosave_interval ticks when set; see enable_autosave
+        self.autosave_interval: Optional[int] = None
+        self.autosave_background = True
+        self.next_autosave_tick = 0
+        # Records handled events for replay when set; see enable_journal
+        self.journal: Optional[EventJournal] = None
+        self.rebuild_schedules()
+        # event_type -> simulator follow-up run after the world applies the event
+        self.reactions: Dict[str, Callable[[Event], None]] = {
+            "attack_attempt": self._react_attack_attempt,
+            "damage_applied": self._react_damage_applied,
+            "toggle_starvation": self._react_toggle_starvation,
+            "npc_died": self._react_npc_died,
+            "eat": self._react_eat,
+        }
+        # event_type -> perception recorder; None means nobody notices the event
+        self.perceivers: Dict[str, Optional[Callable[[Event], None]]] = {
+            "describe_location": None,
+            "wait": None,
+            "hunger_changed": None,
+        }
+
+    def rebuild_schedules(self):
+        """Seed fresh event and ready queues from the world's current state.
+
+        Pending events are dropped. Used at construction and for worlds
+        loaded without the queues that were live when they were saved.
+        """
+        self._install_queues(EventScheduler())
+        # npc_id -> scheduler handles of its pending hunger events
+        self.hunger_events: Dict[str, List[int]] = {}
+        for npc_id in self.world.npcs:
+            self.schedule_hunger(npc_id)
+        if self.journal is not None:
+            # Handles restart, so the journal needs a new starting point
+            self.journal.snapshot(self)
+
+    def schedule_state(self) -> Dict[str, Any]:
+        """The pending events and hunger handles, for ``restore_schedules``.
+
+        The ready queue is not part of it: at the end of a tick every living
+        actor is due at its ``next_available_tick`` or the next tick, which
+        ``restore_schedules`` re-derives from the world.
+        """
+        return {
+            "pending": self.event_queue.pending(),
+            "next_handle": self.event_queue.next_handle,
+            "hunger_events": {npc_id: list(handles) for npc_id, handles in self.hunger_events.items()},
+        }
+
+    def restore_schedules(self, state: Dict[str, Any]):
+        """Replace the queues with a ``schedule_state`` taken from this world at the current tick."""
+        self._install_queues(EventScheduler.restore(state["pending"], state["next_handle"]))
+        self.hunger_events = {npc_id: list(handles) for npc_id, handles in state["hunger_events"].items()}
+        if self.journal is not None:
+            self.journal.snapshot(self)
+
+    def _install_queues(self, event_queue: EventScheduler):
+        self.event_queue = event_queue
+        if self.journal is not None:
+            event_queue.listener = self.journal
+        # Non-player actors waiting for their next turn, keyed by next_available_tick
+        self.ready_queue = ReadyQueue()
+        for npc_id in self.world.npcs:
+            self.schedule_actor(npc_id)
+        if self.profiler is not None:
+            self._profile_queues()
+
+    def _profile_queues(self):
+        # Queues are replaced by rebuild_schedules and restore_schedules, so each new pair is wrapped
+        self.event_queue.pop_due = self.profiler.timed("pop_due_events", self.event_queue.pop_due)
+        self.ready_queue.pop_ready = self.profiler.timed("pop_ready_actors", self.ready_queue.pop_ready)
 
     def register_tool(self, tool: Tool):
+        tool.rng = self.rng.world
         self.tools[tool.name] = tool
 
+    def enable_profiling(self, window: int = 1000) -> TickProfiler:
+        """Start timing every tick phase; returns the active profiler.
+
+        Timing wrappers are installed as instance attributes over the phase
+        methods, so a simulator without profiling runs the plain methods.
+        """
+        if self.profiler is not None:
+            return self.profiler
+        profiler = TickProfiler(window)
+        self.profiler = profiler
+        cls = type(self)
+        self.npc_think = profiler.timed("npc_think", cls.npc_think.__get__(self))
+        self.process_command = profiler.timed(
+            "process_command", cls.process_command.__get__(self), key=lambda actor_id, command: command["tool"]
+        )
+        self.handle_event = profiler.timed(
+            "handle_event", cls.handle_event.__get__(self), key=lambda event: event.event_type
+        )
+        self.record_perception = profiler.timed(
+            "record_perception", cls.record_perception.__get__(self), key=lambda event: event.event_type
+        )
+        self._profile_queues()
+        tick = cls.tick.__get__(self)
+        perf_counter = time.perf_counter
+
+        def timed_tick():
+            upcoming = self.game_tick + 1
+            profiler.begin_tick(upcoming)
+            start = perf_counter()
+            try:
+                tick()
+            finally:
+                profiler.end_tick(upcoming, perf_counter() - start)
+
+        self.tick = timed_tick
+        return profiler
+
+    def disable_profiling(self):
+        for name in ("npc_think", "process_command", "handle_event", "record_perception", "tick"):
+            self.__dict__.pop(name, None)
+        self.event_queue.__dict__.pop("pop_due", None)
+        self.ready_queue.__dict__.pop("pop_ready", None)
+        self.profiler = None
+
+    def enable_autosave(self, interval: int, background: bool = True):
+        """Save the world's changed entities every ``interval`` ticks.
+
+        With ``background`` the files are written on the world's writer
+        thread, so a save only costs the tick the time to serialise them.
+        """
+        self.autosave_interval = interval
+        self.autosave_background = background
+        self.next_autosave_tick = self.game_tick + interval
+
+    def disable_autosave(self):
+        self.autosave_interval = None
+
+    def enable_journal(self, directory: Path, snapshot_interval: int = 100, rng_interval: int = 100) -> EventJournal:
+        """Record every handled event under ``directory`` for ``journal.Replayer``.
+
+        A world snapshot is written now and every ``snapshot_interval``
+        ticks, and the RNG stream states every ``rng_interval`` ticks; in
+        between, the streams count their draws so replay can catch up.
+        """
+        self.disable_journal()
+        self.journal = EventJournal(directory, snapshot_interval, rng_interval)
+        self.rng.count_draws()
+        self.event_queue.listener = self.journal
+        self.journal.start(self)
+        return self.journal
+
+    def disable_journal(self):
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+            self.event_queue.listener = None
+            self.rng.count_draws(False)
+
+    def schedule_actor(self, npc_id: str):
+        """(Re)queue a non-player actor for its next turn."""
+        npc = self.world.get_npc(npc_id)
+        if npc_id == self.player_id or "dead" in npc.tags.get("dynamic", []):
+            return
+        self.ready_queue.schedule(npc_id, npc.next_available_tick)
+
+    def schedule_hunger(self, npc_id: str):
+        """Queue the upcoming hunger transitions for ``npc_id`` based on its last meal.
+
+        Any previously scheduled hunger events for the actor are cancelled, so
+        this is called again whenever ``last_meal_tick`` changes.
+        """
+        self.cancel_hunger(npc_id)
+        npc = self.world.get_npc(npc_id)
+        if not self.starvation_enabled or "dead" in npc.tags.get("dynamic", []):
+            return
+        first = self.game_tick + 1
+        ticks_since = first - npc.last_meal_tick
+        handles = []
+        stage = hunger_stage_for(ticks_since)
+        if stage != npc.hunger_stage:
+            handles.append(self._schedule_hunger_change(npc_id, first, stage))
+        if ticks_since < HUNGRY_THRESHOLD:
+            handles.append(
+                self._schedule_hunger_change(npc_id, npc.last_meal_tick + HUNGRY_THRESHOLD, "hungry")
+            )
+        if ticks_since < STARVING_THRESHOLD:
+            handles.append(
+                self._schedule_hunger_change(npc_id, npc.last_meal_tick + STARVING_THRESHOLD, "starving")
+            )
+        handles.append(
+            self._schedule_starvation_damage(npc_id, max(npc.last_meal_tick + STARVING_THRESHOLD, first))
+        )
+        self._set_hunger_events(npc_id, handles)
+
+    def cancel_hunger(self, npc_id: str):
+        handles = self.hunger_events.get(npc_id)
+        if handles is None:
+            return
+        for handle in handles:
+            self.event_queue.cancel(handle)
+        self._set_hunger_events(npc_id, None)
+
+    def _set_hunger_events(self, npc_id: str, handles: Optional[List[int]]):
+        if handles is None:
+            del self.hunger_events[npc_id]
+        else:
+            self.hunger_events[npc_id] = handles
+        if self.journal is not None:
+            self.journal.record_hunger(self.game_tick, npc_id, handles)
+
+    def _schedule_hunger_change(self, npc_id: str, tick: int, stage: str) -> int:
+        return self.event_queue.schedule(
+            Event(
+                event_type="hunger_changed",
+                tick=tick,
+                actor_id=npc_id,
+                target_ids=[npc_id],
+                payload={"stage": stage},
+            )
+        )
+
+    def _schedule_starvation_damage(self, npc_id: str, tick: int) -> int:
+        return self.event_queue.schedule(
+            Event(
+                event_type="damage_applied",
+                tick=tick,
+                actor_id=npc_id,
+                target_ids=[npc_id],
+                payload={"amount": 1, "damage_type": "starvation"},
+            )
+        )
+
     def process_command(self, actor_id: str, command: Dict[str, Any]):
         tool = self.tools.get(command["tool"])
         actor = self.world.get_npc(actor_id)
@@ -36,11 +279,26 @@ class Simulator:
             raise ValueError(f"Unknown tool {command['tool']}")
         if actor.next_available_tick > self.game_tick:
             raise ValueError("Actor is busy")
-        if not tool.validate_intent(command.get("params", {}), self.world, actor):
+        params = self._canonical_params(tool, command.get("params", {}))
+        if not tool.validate_intent(params, self.world, actor):
             raise ValueError("Invalid intent")
-        events = tool.generate_events(command.get("params", {}), self.world, actor, self.game_tick)
+        events = tool.generate_events(params, self.world, actor, self.game_tick)
         self.event_queue.extend(events)
         actor.next_available_tick = self.game_tick + tool.time_cost
+        self.world.dirty_npcs.add(actor_id)
+        if self.journal is not None:
+            self.journal.record_busy(self.game_tick, actor_id, actor.next_available_tick)
+        if actor_id != self.player_id:
+            self.ready_queue.schedule(actor_id, actor.next_available_tick)
+
+    def _canonical_params(self, tool: Tool, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of ``params`` with typed ids swapped for the registry string of their kind."""
+        canonical = dict(params)
+        for param in tool.params:
+            value = params.get(param.name)
+            if isinstance(value, str):
+                canonical[param.name] = self.world.canonical_id(param.kind, value)
+        return canonical
 
     def npc_think(self, npc: NPC) -> Optional[Dict[str, Any]]:
         """Produce a simple command for a non-player actor."""
@@ -57,8 +315,9 @@ class Simulator:
             if other_id != npc.id
             and "dead" not in self.world.get_npc(other_id).tags.get("dynamic", [])
         ]
-        if potential_targets and random.random() < 0.5:
-            target = random.choice(potential_targets)
+        rng = self.rng.ai
+        if potential_targets and rng.random() < 0.5:
+            target = rng.choice(potential_targets)
             return {"tool": "attack", "params": {"target_id": target}}
 
         options = []
@@ -67,199 +326,203 @@ class Simulator:
             if conn.get("status", "open") == "open":
                 options.append(neighbor_id)
         if options:
-            target = random.choice(options)
+            target = rng.choice(options)
             return {"tool": "move", "params": {"target_location": target}}
-        if random.random() < 0.3:
+        if rng.random() < 0.3:
             return {"tool": "talk", "params": {"content": "looks around."}}
         return None
 
     def tick(self):
         self.game_tick += 1
-        if self.starvation_enabled:
-            hunger_events = self.world.update_hunger(self.game_tick)
-            self.event_queue.extend(hunger_events)
-        for npc_id, npc in self.world.npcs.items():
-            if npc_id == self.player_id or "dead" in npc.tags.get("dynamic", []):
+        for npc_id in self.ready_queue.pop_ready(self.game_tick):
+            npc = self.world.get_npc(npc_id)
+            if "dead" in npc.tags.get("dynamic", []):
+                continue
+            if npc.next_available_tick > self.game_tick:
+                self.ready_queue.schedule(npc_id, npc.next_available_tick)
                 continue
-            if npc.next_available_tick <= self.game_tick:
-                command = self.npc_think(npc)
-                if command:
-                    self.process_command(npc_id, command)
-        ready_events = [e for e in self.event_queue if e.tick <= self.game_tick]
-        self.event_queue = [e for e in self.event_queue if e.tick > self.game_tick]
-        for event in ready_events:
+            # Idle actors think again next tick unless their command keeps them busy
+            self.ready_queue.schedule(npc_id, self.game_tick + 1)
+            command = self.npc_think(npc)
+            if command:
+                self.process_command(npc_id, command)
+        for event in self.event_queue.pop_due(self.game_tick):
             self.handle_event(event)
+        if self.autosave_interval and self.game_tick >= self.next_autosave_tick:
+            self.world.save(background=self.autosave_background)
+            self.next_autosave_tick = self.game_tick + self.autosave_interval
+        if self.journal is not None:
+            self.journal.end_tick(self)
+
+    def register_event_handler(
+        self,
+        event_type: str,
+        apply: Optional[Callable[[Event], None]] = None,
+        narrate: Optional[Callable[[Event], str]] = None,
+        react: Optional[Callable[[Event], None]] = None,
+        perceive: Optional[Callable[[Event], None]] = None,
+    ):
+        """Plug in callbacks for ``event_type``; omitted callbacks keep their defaults.
+
+        ``apply`` mutates the world, ``react`` lets the simulator schedule
+        follow-up events, ``narrate`` returns display text and ``perceive``
+        records the event in the memories of actors who noticed it.
+        """
+        if apply:
+            self.world.register_apply_handler(event_type, apply)
+        if narrate:
+            self.narrator.register_renderer(event_type, narrate)
+        if react:
+            self.reactions[event_type] = react
+        if perceive:
+            self.perceivers[event_type] = perceive
+
+    def next_wakeup_tick(self) -> Optional[int]:
+        """Earliest tick after the current one on which ticking does any work."""
+        candidates = [self.event_queue.peek_tick(), self.ready_queue.peek_tick()]
+        pending = [tick for tick in candidates if tick is not None]
+        if not pending:
+            return None
+        return max(min(pending), self.game_tick + 1)
+
+    def advance_until(self, tick: int):
+        """Advance ``game_tick`` to ``tick``, skipping ticks on which nothing happens.
+
+        The result is the same as calling ``tick()`` repeatedly: only ticks
+        with due events (hunger included) or ready actors are actually run.
+        """
+        while self.game_tick < tick:
+            wakeup = self.next_wakeup_tick()
+            if wakeup is None or wakeup > tick:
+                self.game_tick = tick
+                return
+            self.game_tick = wakeup - 1
+            self.tick()
+
+    def fast_forward(self) -> bool:
+        """Jump to the next meaningful tick and run it; return False when idle forever."""
+        wakeup = self.next_wakeup_tick()
+        if wakeup is None:
+            return False
+        self.advance_until(wakeup)
+        return True
+
+    def run_until_ready(self, actor_id: str):
+        """Handle pending events and skip ahead until ``actor_id`` may act again."""
+        actor = self.world.get_npc(actor_id)
+        while True:
+            due = self.event_queue.peek_tick()
+            if due is not None and due <= self.game_tick:
+                self.tick()
+            elif actor.next_available_tick > self.game_tick:
+                self.advance_until(actor.next_available_tick)
+            else:
+                return
 
     def handle_event(self, event: Event):
-        if event.event_type == "describe_location":
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type == "move":
-            self.world.apply_event(event)
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type == "grab":
-            self.world.apply_event(event)
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type == "drop":
-            self.world.apply_event(event)
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type == "eat":
-            self.world.apply_event(event)
+        if self.journal is not None:
+            self.journal.record_event(self.game_tick, event)
+        self.world.apply_event(event)
+        react = self.reactions.get(event.event_type)
+        if react:
+            react(event)
+        if self.output is not None:
             msg = self.narrator.render(event)
             if msg:
-                print(msg)
-        elif event.event_type == "attack_attempt":
-            attacker = self.world.get_npc(event.actor_id)
-            target = self.world.get_npc(event.target_ids[0])
-            result = combat_rules.resolve_attack(self.world, attacker, target)
-            payload = {
-                "to_hit": result["to_hit"],
-                "target_ac": result["target_ac"],
-            }
-            if result["hit"]:
-                payload["damage"] = result["damage"]
-                self.event_queue.append(
-                    Event(
-                        event_type="attack_hit",
-                        tick=self.game_tick,
-                        actor_id=event.actor_id,
-                        target_ids=event.target_ids,
-                        payload=payload,
-                    )
+                self.output(msg)
+        self.events_handled += 1
+        # After applying and narrating, record perception for nearby actors
+        perceive = self.perceivers.get(event.event_type, self.record_perception)
+        if perceive:
+            perceive(event)
+
+    def _react_attack_attempt(self, event: Event):
+        attacker = self.world.get_npc(event.actor_id)
+        target = self.world.get_npc(event.target_ids[0])
+        result = combat_rules.resolve_attack(self.world, attacker, target, self.rng.combat)
+        payload = {
+            "to_hit": result["to_hit"],
+            "target_ac": result["target_ac"],
+        }
+        if result["hit"]:
+            payload["damage"] = result["damage"]
+            self.event_queue.append(
+                Event(
+                    event_type="attack_hit",
+                    tick=self.game_tick,
+                    actor_id=event.actor_id,
+                    target_ids=event.target_ids,
+                    payload=payload,
                 )
-                self.event_queue.append(
-                    Event(
-                        event_type="damage_applied",
-                        tick=self.game_tick,
-                        actor_id=event.actor_id,
-                        target_ids=event.target_ids,
-                        payload={
-                            "amount": result["damage"],
-                            "damage_type": combat_rules.get_weapon(self.world, attacker).damage_type,
-                        },
-                    )
+            )
+            self.event_queue.append(
+                Event(
+                    event_type="damage_applied",
+                    tick=self.game_tick,
+                    actor_id=event.actor_id,
+                    target_ids=event.target_ids,
+                    payload={
+                        "amount": result["damage"],
+                        "damage_type": combat_rules.get_weapon(self.world, attacker).damage_type,
+                    },
                 )
-            else:
-                self.event_queue.append(
-                    Event(
-                        event_type="attack_missed",
-                        tick=self.game_tick,
-                        actor_id=event.actor_id,
-                        target_ids=event.target_ids,
-                        payload=payload,
-                    )
+            )
+        else:
+            self.event_queue.append(
+                Event(
+                    event_type="attack_missed",
+                    tick=self.game_tick,
+                    actor_id=event.actor_id,
+                    target_ids=event.target_ids,
+                    payload=payload,
                 )
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type == "attack_hit":
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type == "attack_missed":
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type == "damage_applied":
-            self.world.apply_event(event)
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-            target = self.world.get_npc(event.target_ids[0])
-            if target.hp <= 0 and "dead" not in target.tags.get("dynamic", []):
-                loc_id = self.world.find_npc_location(target.id)
-                self.event_queue.append(
-                    Event(
-                        event_type="npc_died",
-                        tick=self.game_tick,
-                        actor_id=target.id,
-                        target_ids=[loc_id] if loc_id else [],
-                    )
+            )
+
+    def _react_damage_applied(self, event: Event):
+        target = self.world.get_npc(event.target_ids[0])
+        if (
+            event.payload.get("damage_type") == "starvation"
+            and self.starvation_enabled
+            and target.hp > 0
+            and self.game_tick - target.last_meal_tick >= STARVING_THRESHOLD
+        ):
+            # Starvation keeps biting every tick until the actor eats
+            self._set_hunger_events(target.id, [self._schedule_starvation_damage(target.id, self.game_tick + 1)])
+        if target.hp <= 0 and "dead" not in target.tags.get("dynamic", []):
+            loc_id = self.world.find_npc_location(target.id)
+            self.event_queue.append(
+                Event(
+                    event_type="npc_died",
+                    tick=self.game_tick,
+                    actor_id=target.id,
+                    target_ids=[loc_id] if loc_id else [],
                 )
-        elif event.event_type == "talk":
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type == "talk_loud":
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type == "scream":
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type == "inventory":
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type == "stats":
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type == "equip":
-            self.world.apply_event(event)
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type == "unequip":
-            self.world.apply_event(event)
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type == "analyze":
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type == "give":
-            self.world.apply_event(event)
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type == "toggle_starvation":
-            self.starvation_enabled = event.payload.get("enabled", True)
-            if not self.starvation_enabled:
-                for npc in self.world.npcs.values():
-                    npc.hunger_stage = "sated"
-                    npc.last_meal_tick = self.game_tick
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type in {"open_connection", "close_connection"}:
-            self.world.apply_event(event)
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type == "npc_died":
-            self.world.apply_event(event)
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type == "wait":
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        elif event.event_type == "rest":
-            self.world.apply_event(event)
-            msg = self.narrator.render(event)
-            if msg:
-                print(msg)
-        else:
-            self.world.apply_event(event)
-        # After applying and narrating, record perception for nearby actors
-        self.record_perception(event)
+            )
+
+    def _react_npc_died(self, event: Event):
+        # Drop actions the dead actor still had in progress, such as a long rest
+        self.event_queue.cancel_actor(event.actor_id, after_tick=self.game_tick)
+        self.ready_queue.discard(event.actor_id)
+        self.cancel_hunger(event.actor_id)
+
+    def _react_eat(self, event: Event):
+        self.schedule_hunger(event.actor_id)
+
+    def _react_toggle_starvation(self, event: Event):
+        self.starvation_enabled = event.payload.get("enabled", True)
+        if not self.starvation_enabled:
+            self.world.reset_hunger(self.game_tick)
+        for npc_id in self.world.npcs:
+            self.schedule_hunger(npc_id)
 
     def record_perception(self, event: Event):
-        """Add a simplified perception entry to actors in the same location."""
-        if event.event_type in {"describe_location", "wait"}:
-            return
+        """Add a perception entry to the actors who heard ``event``.
 
+        The event's noise level (``SOUND_LEVELS``, normal by default) spreads
+        from its location through ``WorldState.sound``; each recipient's entry
+        carries the level it was heard at, and recipients at the same level
+        share one entry.
+        """
         if event.event_type == "move":
             location_id = event.target_ids[0]
         elif event.event_type == "npc_died":
@@ -270,37 +533,25 @@ class Simulator:
         if not location_id:
             return
 
-        recipients = set()
-        loc_state = self.world.get_location_state(location_id)
-        for npc_id in loc_state.occupants:
-            if npc_id != event.actor_id:
-                recipients.add(npc_id)
-
-        if event.event_type == "scream":
-            loc_static = self.world.get_location_static(location_id)
-            for neighbor_id in loc_static.hex_connections.values():
-                neighbor_state = self.world.get_location_state(neighbor_id)
-                for npc_id in neighbor_state.occupants:
-                    recipients.add(npc_id)
-        elif event.event_type == "talk_loud":
-            loc_static = self.world.get_location_static(location_id)
-            loc_state = self.world.get_location_state(location_id)
-            for neighbor_id in loc_static.hex_connections.values():
-                conn = loc_state.connections_state.get(neighbor_id, {})
-                if conn.get("status", "open") == "open":
-                    neighbor_state = self.world.get_location_state(neighbor_id)
-                    for npc_id in neighbor_state.occupants:
-                        recipients.add(npc_id)
-
-        for npc_id in recipients:
-            npc = self.world.get_npc(npc_id)
-            npc.short_term_memory.append(
-                {
-                    "tick": self.game_tick,
-                    "event_type": event.event_type,
-                    "actor_id": event.actor_id,
-                    "payload": event.payload,
-                }
-            )
-            if len(npc.short_term_memory) > 20:
-                npc.short_term_memory.pop(0)
+        intensity = NOISE_LEVELS[self.SOUND_LEVELS.get(event.event_type, "normal")]
+        locations_state = self.world.locations_state
+        npcs = self.world.npcs
+        actor_id = event.actor_id
+        # Recipients who heard the event at the same level share one perception
+        records: Dict[str, Perception] = {}
+        payload = None
+        recipients = []
+        for loc_id, heard in self.world.sound.propagate(location_id, intensity):
+            occupants = [npc_id for npc_id in locations_state[loc_id].occupants if npc_id != actor_id]
+            if not occupants:
+                continue
+            level = sound_grade(heard)
+            record = records.get(level)
+            if record is None:
+                if payload is None:
+                    payload = MappingProxyType(to_dict(event.payload))
+                record = records[level] = Perception(self.game_tick, event.event_type, actor_id, payload, level)
+            for npc_id in occupants:
+                npcs[npc_id].short_term_memory.append(record)
+            recipients.extend(occupants)
+        self.world.dirty_npcs.update(recipients)
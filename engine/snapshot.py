@@ -0,0 +1,198 @@
+"""Single-file binary snapshots of a ``WorldState``.
+
+Layout (little endian)::
+
+    magic    6 bytes   b"LTSNAP"
+    version  uint16    SNAPSHOT_VERSION
+    strings  uint32    number of entries in the string table
+    size     uint32    byte length of the string table
+    table    size bytes NUL separated UTF-8 entity ids
+    body     marshal data, one list of row tuples per entity kind
+
+Entity ids are written once in the string table and every reference to them
+(ids, occupants, inventories, slots, connections, owners) is stored as an
+index into it, so loading shares one string object per id. The body is
+``marshal`` data: fast to read, but only load snapshots you wrote yourself.
+Snapshots hold exactly what the JSON ``data/`` layout holds, so
+``save_snapshot`` and ``WorldState.write_json`` round-trip through each other.
+"""
+from __future__ import annotations
+
+import marshal
+import os
+import struct
+import sys
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .data_models import NPC, LocationStatic, LocationState, ItemBlueprint, ItemInstance, to_dict
+from .world_state import WorldState
+from .loading import paused_gc
+from .persistence import fsync_directory
+
+
+SNAPSHOT_MAGIC = b"LTSNAP"
+SNAPSHOT_VERSION = 2
+_HEADER = struct.Struct("<6sHII")
+
+# How id references are stored in each model's fields
+_ID, _ID_LIST, _ID_VALUES, _ID_KEYS = range(4)
+_ID_FIELDS: Dict[type, Dict[str, int]] = {
+    NPC: {"id": _ID, "inventory": _ID_LIST, "slots": _ID_VALUES},
+    LocationStatic: {"id": _ID, "hex_connections": _ID_VALUES},
+    LocationState: {"id": _ID, "occupants": _ID_LIST, "items": _ID_LIST, "connections_state": _ID_KEYS},
+    ItemBlueprint: {"id": _ID},
+    ItemInstance: {
+        "id": _ID,
+        "blueprint_id": _ID,
+        "current_location": _ID,
+        "owner_id": _ID,
+        "inventory": _ID_LIST,
+    },
+}
+# Body sections in write order: attribute of WorldState and its model
+_SECTIONS: List[Tuple[str, type]] = [
+    ("npcs", NPC),
+    ("locations_static", LocationStatic),
+    ("locations_state", LocationState),
+    ("item_blueprints", ItemBlueprint),
+    ("item_instances", ItemInstance),
+]
+
+
+class SnapshotError(ValueError):
+    """Raised for files that are not snapshots or use an unknown version."""
+
+
+def _init_fields(model: type) -> List[str]:
+    return [f.name for f in fields(model) if f.init]
+
+
+class _StringTable:
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def ref(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        ref = self.index.get(value)
+        if ref is None:
+            if "\0" in value:
+                raise SnapshotError(f"id {value!r} contains a NUL character")
+            ref = self.index[value] = len(self.strings)
+            self.strings.append(value)
+        return ref
+
+
+def _encode(entity: Any, names: List[str], id_fields: Dict[str, int], table: _StringTable) -> tuple:
+    row = []
+    for name in names:
+        value = getattr(entity, name)
+        kind = id_fields.get(name)
+        if kind is None:
+            row.append(to_dict(value))
+        elif kind == _ID:
+            row.append(table.ref(value))
+        elif kind == _ID_LIST:
+            row.append([table.ref(v) for v in value])
+        elif kind == _ID_VALUES:
+            row.append({key: table.ref(v) for key, v in value.items()})
+        else:
+            row.append({table.ref(key): to_dict(v) for key, v in value.items()})
+    return tuple(row)
+
+
+def save_snapshot(world: WorldState, path: Path):
+    """Write ``world`` to ``path`` atomically and durably (fsynced temporary file plus rename)."""
+    table = _StringTable()
+    body = []
+    for attr, model in _SECTIONS:
+        names = _init_fields(model)
+        id_fields = _ID_FIELDS[model]
+        body.append([_encode(entity, names, id_fields, table) for entity in getattr(world, attr).values()])
+    blob = "\0".join(table.strings).encode("utf-8")
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(table.strings), len(blob)))
+        f.write(blob)
+        marshal.dump(body, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    fsync_directory(path.parent)
+
+
+def _decoder(model: type, strings: List[str]):
+    names = _init_fields(model)
+    # Row position and encoding of every id field
+    plan = [(names.index(name), kind) for name, kind in _ID_FIELDS[model].items()]
+
+    def decode(row: tuple):
+        row = list(row)
+        for pos, kind in plan:
+            value = row[pos]
+            if kind == _ID:
+                row[pos] = strings[value] if value >= 0 else None
+            elif kind == _ID_LIST:
+                row[pos] = [strings[v] for v in value]
+            elif kind == _ID_VALUES:
+                row[pos] = {key: strings[v] if v >= 0 else None for key, v in value.items()}
+            else:
+                row[pos] = {strings[key]: v for key, v in value.items()}
+        return model(*row)
+
+    return decode
+
+
+def _read(path: Path) -> Tuple[List[str], list]:
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise SnapshotError(f"{path} is too short to be a snapshot")
+        magic, version, count, size = _HEADER.unpack(header)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotError(f"{path} is not a world snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotError(f"{path} has snapshot version {version}, expected {SNAPSHOT_VERSION}")
+        blob = f.read(size)
+        try:
+            # One read is much faster than letting marshal pull from the file
+            body = marshal.loads(f.read())
+        except (EOFError, ValueError, TypeError) as exc:
+            raise SnapshotError(f"{path} is truncated or corrupt") from exc
+    strings = [sys.intern(s) for s in blob.decode("utf-8").split("\0")] if count else []
+    if len(strings) != count or len(body) != len(_SECTIONS):
+        raise SnapshotError(f"{path} is truncated or corrupt")
+    return strings, body
+
+
+def load_snapshot(path: Path, data_dir: Optional[Path] = None) -> WorldState:
+    """Build a ``WorldState`` from a snapshot written by ``save_snapshot``.
+
+    ``data_dir`` becomes the new world's ``data_dir``; it defaults to the
+    directory containing the snapshot.
+    """
+    path = Path(path)
+    with paused_gc():
+        strings, body = _read(path)
+        world = WorldState(Path(data_dir) if data_dir is not None else path.parent)
+        for (attr, model), rows in zip(_SECTIONS, body):
+            decode = _decoder(model, strings)
+            target = getattr(world, attr)
+            for row in rows:
+                entity = decode(row)
+                target[entity.id] = entity
+    # Ids already share the table's strings; this makes them the registries' too
+    for registry, entities in (
+        (world.npc_registry, world.npcs),
+        (world.location_registry, world.locations_state),
+        (world.location_registry, world.locations_static),
+        (world.item_registry, world.item_instances),
+    ):
+        for entity_id in entities:
+            registry.intern(entity_id)
+    world.rebuild_location_index()
+    return world
@@ -0,0 +1,114 @@
+"""Sound propagation over the location graph.
+
+A sound starts with the intensity of its noise level and loses
+``HOP_LOSS`` per connection crossed, plus ``DOOR_LOSS`` for the status of
+that connection in the source side's ``connections_state``; locked doors
+block it entirely. Every location reached with intensity left hears the
+sound, graded ``loud``, ``normal`` or ``faint`` by what is left.
+
+With the default numbers a normal voice stays in the room, a loud one
+carries through open connections, and a scream reaches two rooms away
+through open ones or muffled through a closed door.
+"""
+from __future__ import annotations
+
+import heapq
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .world_state import WorldState
+
+NOISE_LEVELS: Dict[str, int] = {"normal": 10, "loud": 20, "scream": 30}
+HOP_LOSS = 10
+# Extra loss per connection status; None blocks the sound
+DOOR_LOSS: Dict[str, Optional[int]] = {"open": 0, "closed": 15, "locked": None}
+
+Heard = Tuple[Tuple[str, int], ...]
+
+
+def grade(intensity: int) -> str:
+    """Perceived level of a sound that arrives with ``intensity``."""
+    if intensity >= NOISE_LEVELS["loud"]:
+        return "loud"
+    if intensity >= NOISE_LEVELS["normal"]:
+        return "normal"
+    return "faint"
+
+
+class SoundMap:
+    """Cached sound propagation for one world.
+
+    ``propagate`` runs a Dijkstra search that stops once the intensity runs
+    out, so its cost depends on the loudness and the local density, not on
+    the size of the map. Per-location attenuation tables and propagation
+    results are both cached; ``invalidate`` is called when a connection
+    opens or closes and drops only the tables of its two ends and the
+    results whose search went through either of them.
+    """
+
+    def __init__(self, world: "WorldState"):
+        self.world = world
+        # loc_id -> [(neighbour, loss)] for every passable connection
+        self._edges: Dict[str, List[Tuple[str, int]]] = {}
+        self._heard: Dict[Tuple[str, int], Heard] = {}
+        # loc_id -> cached searches that reached it
+        self._reached_by: Dict[str, Set[Tuple[str, int]]] = {}
+
+    def edges(self, loc_id: str) -> List[Tuple[str, int]]:
+        edges = self._edges.get(loc_id)
+        if edges is None:
+            edges = self._edges[loc_id] = self._attenuation(loc_id)
+        return edges
+
+    def _attenuation(self, loc_id: str) -> List[Tuple[str, int]]:
+        world = self.world
+        static = world.locations_static.get(loc_id)
+        if static is None:
+            return []
+        connections = world.locations_state[loc_id].connections_state
+        edges = []
+        for neighbour in dict.fromkeys(static.hex_connections.values()):
+            if neighbour == loc_id or neighbour not in world.locations_state:
+                continue
+            status = connections.get(neighbour, {}).get("status", "open")
+            door = DOOR_LOSS.get(status, 0)
+            if door is not None:
+                edges.append((neighbour, HOP_LOSS + door))
+        return edges
+
+    def propagate(self, loc_id: str, intensity: int) -> Heard:
+        """``(location, intensity heard)`` for every location the sound reaches, loudest first."""
+        key = (loc_id, intensity)
+        heard = self._heard.get(key)
+        if heard is not None:
+            return heard
+        best = {loc_id: intensity}
+        frontier = [(-intensity, loc_id)]
+        result = []
+        while frontier:
+            negative, current = heapq.heappop(frontier)
+            remaining = -negative
+            if remaining < best[current]:
+                continue
+            result.append((current, remaining))
+            for neighbour, loss in self.edges(current):
+                left = remaining - loss
+                if left > 0 and left > best.get(neighbour, 0):
+                    best[neighbour] = left
+                    heapq.heappush(frontier, (-left, neighbour))
+        heard = self._heard[key] = tuple(result)
+        for reached, _ in heard:
+            self._reached_by.setdefault(reached, set()).add(key)
+        return heard
+
+    def invalidate(self, *loc_ids: str):
+        """Forget what depends on the connections of ``loc_ids``."""
+        for loc_id in loc_ids:
+            self._edges.pop(loc_id, None)
+            for key in self._reached_by.pop(loc_id, ()):
+                self._heard.pop(key, None)
+
+    def clear(self):
+        self._edges.clear()
+        self._heard.clear()
+        self._reached_by.clear()
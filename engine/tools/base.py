@@ -1,17 +1,40 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Any, List
+import random
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, ClassVar, Optional, Tuple
 
 from ..events import Event
 from ..world_state import WorldState
 from ..data_models import NPC
 
 
+@dataclass(frozen=True)
+class Param:
+    """One intent parameter of a tool.
+
+    ``kind`` tells the command parser how to read it: ``location``, ``item``,
+    ``npc`` and ``slot`` are resolved against the world, ``int`` and ``bool``
+    are literals and ``text`` takes the rest of the input.
+    """
+
+    name: str
+    kind: str
+    optional: bool = False
+    default: Any = None
+
+
 @dataclass
 class Tool:
     name: str
     time_cost: int = 1
+    # The simulator's world stream, set by Simulator.register_tool; tools
+    # that need randomness draw from it so runs stay reproducible
+    rng: Optional[random.Random] = field(default=None, repr=False, compare=False)
+
+    # Parameter schema and extra verbs used by the local command parser
+    params: ClassVar[Tuple[Param, ...]] = ()
+    aliases: ClassVar[Tuple[str, ...]] = ()
 
     def get_llm_prompt_fragment(self) -> str:
         return self.name
@@ -1,12 +1,14 @@
 from typing import Dict, Any, List
 
-from .base import Tool
+from .base import Param, Tool
 from ..events import Event
 from ..world_state import WorldState
 from ..data_models import NPC
 
 
 class CloseDoorTool(Tool):
+    params = (Param("target_location", "location"),)
+
     def __init__(self, time_cost: int = 1):
         super().__init__(name="close", time_cost=time_cost)
 
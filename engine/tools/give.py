@@ -1,12 +1,14 @@
 from typing import Dict, Any, List
 
-from .base import Tool
+from .base import Param, Tool
 from ..events import Event
 from ..world_state import WorldState
 from ..data_models import NPC
 
 
 class GiveTool(Tool):
+    params = (Param("item_id", "item"), Param("target_id", "npc"))
+
     def __init__(self, time_cost: int = 1):
         super().__init__(name="give", time_cost=time_cost)
 
@@ -1,12 +1,15 @@
 from typing import Dict, Any, List
 
-from .base import Tool
+from .base import Param, Tool
 from ..events import Event
 from ..world_state import WorldState
 from ..data_models import NPC
 
 
 class MoveTool(Tool):
+    params = (Param("target_location", "location"),)
+    aliases = ("go",)
+
     def __init__(self, time_cost: int = 5):
         super().__init__(name="move", time_cost=time_cost)
 
@@ -1,6 +1,6 @@
 from typing import Dict, Any, List
 
-from .base import Tool
+from .base import Param, Tool
 from ..events import Event
 from ..world_state import WorldState
 from ..data_models import NPC
@@ -9,6 +9,8 @@ from ..data_models import NPC
 class RestTool(Tool):
     """Spend time to recover hit points."""
 
+    params = (Param("ticks", "int", optional=True, default=1),)
+
     def __init__(self):
         super().__init__(name="rest", time_cost=1)
 
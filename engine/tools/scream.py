@@ -1,6 +1,6 @@
 from typing import Dict, Any, List
 
-from .base import Tool
+from .base import Param, Tool
 from ..events import Event
 from ..world_state import WorldState
 from ..data_models import NPC
@@ -9,6 +9,8 @@ from ..data_models import NPC
 class ScreamTool(Tool):
     """Broadcast a loud shout that can be heard in adjacent locations."""
 
+    params = (Param("content", "text"),)
+
     def __init__(self, time_cost: int = 1):
         super().__init__(name="scream", time_cost=time_cost)
 
@@ -1,6 +1,6 @@
 from typing import Dict, Any, List
 
-from .base import Tool
+from .base import Param, Tool
 from ..events import Event
 from ..world_state import WorldState
 from ..data_models import NPC
@@ -9,6 +9,9 @@ from ..data_models import NPC
 class TalkLoudTool(Tool):
     """Speak loudly so adjacent locations with open connections can hear."""
 
+    params = (Param("content", "text"),)
+    aliases = ("shout",)
+
     def __init__(self, time_cost: int = 1):
         super().__init__(name="talk_loud", time_cost=time_cost)
 
@@ -1,12 +1,15 @@
 from typing import Dict, Any, List
 
-from .base import Tool
+from .base import Param, Tool
 from ..events import Event
 from ..world_state import WorldState
 from ..data_models import NPC
 
 
 class ToggleStarvationTool(Tool):
+    params = (Param("enabled", "bool"),)
+    aliases = ("starvation",)
+
     def __init__(self, time_cost: int = 0):
         super().__init__(name="toggle_starvation", time_cost=time_cost)
 
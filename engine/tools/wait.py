@@ -1,6 +1,6 @@
 from typing import Dict, Any, List
 
-from .base import Tool
+from .base import Param, Tool
 from ..events import Event
 from ..world_state import WorldState
 from ..data_models import NPC
@@ -9,6 +9,8 @@ from ..data_models import NPC
 class WaitTool(Tool):
     """Tool allowing an actor to deliberately pass time."""
 
+    params = (Param("ticks", "int", optional=True, default=1),)
+
     def __init__(self):
         super().__init__(name="wait", time_cost=1)
 
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+
+HUNGER_STAGES = ("sated", "hungry", "starving")
+_STAGE_CODES = {stage: code for code, stage in enumerate(HUNGER_STAGES)}
+
+
+class VitalField:
+    """Descriptor for an NPC field that can live in a ``VitalsTable`` column.
+
+    It wraps the slot the dataclass created for the field: a detached NPC
+    reads and writes its own slot, an attached one reads and writes its row
+    of the table, so the table is the single source of truth while attached.
+    Only the table-backed subclass from ``_vital_class`` carries these, so
+    NPCs that are not attached anywhere keep plain slots.
+    """
+
+    __slots__ = ("name", "slot")
+
+    def __init__(self, name: str, slot: Any):
+        self.name = name
+        self.slot = slot
+
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        table = obj._vitals
+        if table is None:
+            return self.slot.__get__(obj, owner)
+        return table.get(self.name, obj._vital_row)
+
+    def __set__(self, obj: Any, value: Any):
+        table = obj._vitals
+        if table is None:
+            self.slot.__set__(obj, value)
+        else:
+            table.set(self.name, obj._vital_row, value)
+
+
+# Plain NPC class -> its table-backed subclass; see _vital_class
+_vital_classes: Dict[type, type] = {}
+
+
+def _reduce_plain(npc: Any, protocol: int):
+    # Copies and pickles are of the plain class and carry the values, never the table
+    return object.__new__, (npc._plain_class,), npc.__getstate__()
+
+
+def _vital_class(cls: type) -> type:
+    """Subclass of ``cls`` whose vital fields are ``VitalField`` descriptors.
+
+    An attached NPC has its ``__class__`` switched to it and a detached one
+    is switched back, so the descriptors only ever slow down NPCs that are
+    in a table and other worlds sharing the class are left alone.
+    """
+    vital = _vital_classes.get(cls)
+    if vital is None:
+        namespace = {name: VitalField(name, getattr(cls, name)) for name in VitalsTable.FIELDS}
+        namespace.update(
+            __slots__=(),
+            __module__=cls.__module__,
+            __qualname__=cls.__qualname__,
+            __reduce_ex__=_reduce_plain,
+            _plain_class=cls,
+        )
+        vital = _vital_classes[cls] = type(cls.__name__, (cls,), namespace)
+    return vital
+
+
+class VitalsTable:
+    """Column store of the integer vitals of every NPC, one row per actor.
+
+    Columns are NumPy ``int64`` arrays when NumPy is installed so that
+    whole-population queries (the hunger sweep, who is ready this tick, bulk
+    damage and healing) run as vectorised operations. Without NumPy the same
+    API is served from ``array.array`` columns with plain loops.
+    ``constitution`` is copied from ``NPC.attributes`` on attach and caps
+    healing; call ``sync_constitution`` after changing the attribute.
+    """
+
+    FIELDS = ("hp", "last_meal_tick", "hunger_stage", "next_available_tick")
+    COLUMNS = FIELDS + ("constitution", "alive")
+
+    def __init__(self, capacity: int = 64, use_numpy: Optional[bool] = None):
+        self.use_numpy = np is not None if use_numpy is None else use_numpy and np is not None
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self._npcs: List[Any] = []
+        self._capacity = max(capacity, 1)
+        if self.use_numpy:
+            self.columns = {name: np.zeros(self._capacity, dtype=np.int64) for name in self.COLUMNS}
+        else:
+            self.columns = {name: array("q") for name in self.COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, npc_id: str) -> bool:
+        return npc_id in self.rows
+
+    # -- attaching -----------------------------------------------------------
+
+    def attach(self, npc: Any) -> int:
+        """Move ``npc``'s vitals into a new row and make the NPC a view onto it."""
+        if npc._vitals is self:
+            return npc._vital_row
+        if npc._vitals is not None:
+            npc._vitals.detach(npc)
+        row = len(self.ids)
+        values = {
+            "hp": npc.hp,
+            "last_meal_tick": npc.last_meal_tick,
+            "hunger_stage": _STAGE_CODES[npc.hunger_stage],
+            "next_available_tick": npc.next_available_tick,
+            "constitution": npc.attributes.get("constitution", npc.hp),
+            "alive": int("dead" not in npc.tags.get("dynamic", [])),
+        }
+        if self.use_numpy:
+            if row == self._capacity:
+                self._grow(self._capacity * 2)
+            for name, value in values.items():
+                self.columns[name][row] = value
+        else:
+            for name, value in values.items():
+                self.columns[name].append(value)
+        self.ids.append(npc.id)
+        self.rows[npc.id] = row
+        self._npcs.append(npc)
+        npc.__class__ = _vital_class(type(npc))
+        npc._vitals = self
+        npc._vital_row = row
+        return row
+
+    def attach_all(self, npcs: Iterable[Any]):
+        npcs = list(npcs)
+        if self.use_numpy and len(self.ids) + len(npcs) > self._capacity:
+            self._grow(len(self.ids) + len(npcs))
+        for npc in npcs:
+            self.attach(npc)
+
+    def detach(self, npc: Any):
+        """Copy ``npc``'s row back into the NPC and drop it from the table."""
+        row = self.rows.pop(npc.id)
+        values = {name: self.get(name, row) for name in self.FIELDS}
+        npc._vitals = None
+        npc._vital_row = -1
+        npc.__class__ = npc._plain_class
+        for name, value in values.items():
+            setattr(npc, name, value)
+        last = len(self.ids) - 1
+        if row != last:
+            # Move the last row into the gap so rows stay dense
+            moved = self._npcs[last]
+            for column in self.columns.values():
+                column[row] = column[last]
+            self.ids[row] = moved.id
+            self._npcs[row] = moved
+            self.rows[moved.id] = row
+            moved._vital_row = row
+        self.ids.pop()
+        self._npcs.pop()
+        if not self.use_numpy:
+            for column in self.columns.values():
+                column.pop()
+
+    def detach_all(self):
+        for npc in list(self._npcs):
+            self.detach(npc)
+
+    def _grow(self, capacity: int):
+        for name, column in self.columns.items():
+            grown = np.zeros(capacity, dtype=np.int64)
+            grown[: len(self.ids)] = column[: len(self.ids)]
+            self.columns[name] = grown
+        self._capacity = capacity
+
+    # -- single values -------------------------------------------------------
+
+    def get(self, name: str, row: int) -> Any:
+        value = int(self.columns[name][row])
+        return HUNGER_STAGES[value] if name == "hunger_stage" else value
+
+    def set(self, name: str, row: int, value: Any):
+        if name == "hunger_stage":
+            value = _STAGE_CODES[value]
+        self.columns[name][row] = value
+
+    def mark_dead(self, npc_id: str):
+        row = self.rows.get(npc_id)
+        if row is not None:
+            self.columns["alive"][row] = 0
+
+    def sync_constitution(self, npc: Any):
+        row = self.rows.get(npc.id)
+        if row is not None:
+            self.columns["constitution"][row] = npc.attributes.get("constitution", npc.hp)
+
+    # -- whole population ----------------------------------------------------
+
+    def _column(self, name: str):
+        column = self.columns[name]
+        return column[: len(self.ids)] if self.use_numpy else column
+
+    def hunger_sweep(self, tick: int, hungry_after: int, starving_after: int) -> List[Tuple[str, str]]:
+        """Return ``(npc_id, stage)`` for living actors whose stored stage is stale at ``tick``."""
+        if self.use_numpy:
+            since = tick - self._column("last_meal_tick")
+            stages = (since >= hungry_after).astype(np.int64) + (since >= starving_after)
+            stale = np.flatnonzero((stages != self._column("hunger_stage")) & (self._column("alive") != 0))
+            return [(self.ids[row], HUNGER_STAGES[stages[row]]) for row in stale.tolist()]
+        changes = []
+        meals, current, alive = self.columns["last_meal_tick"], self.columns["hunger_stage"], self.columns["alive"]
+        for row, npc_id in enumerate(self.ids):
+            since = tick - meals[row]
+            stage = (since >= hungry_after) + (since >= starving_after)
+            if stage != current[row] and alive[row]:
+                changes.append((npc_id, HUNGER_STAGES[stage]))
+        return changes
+
+    def ready_at(self, tick: int) -> List[str]:
+        """Ids of living actors whose ``next_available_tick`` is at or before ``tick``."""
+        if self.use_numpy:
+            mask = (self._column("next_available_tick") <= tick) & (self._column("alive") != 0)
+            return [self.ids[row] for row in np.flatnonzero(mask).tolist()]
+        ready_ticks, alive = self.columns["next_available_tick"], self.columns["alive"]
+        return [npc_id for row, npc_id in enumerate(self.ids) if ready_ticks[row] <= tick and alive[row]]
+
+    def reset_hunger(self, tick: int):
+        """Mark every actor as having just eaten at ``tick``."""
+        if self.use_numpy:
+            self._column("last_meal_tick")[:] = tick
+            self._column("hunger_stage")[:] = 0
+            return
+        for row in range(len(self.ids)):
+            self.columns["last_meal_tick"][row] = tick
+            self.columns["hunger_stage"][row] = 0
+
+    def _rows_for(self, npc_ids: Sequence[str]) -> List[int]:
+        return [self.rows[npc_id] for npc_id in npc_ids]
+
+    def apply_damage(self, npc_ids: Sequence[str], amounts: Sequence[int]):
+        """Subtract ``amounts`` from the hp of ``npc_ids``, never going below zero."""
+        rows = self._rows_for(npc_ids)
+        hp = self.columns["hp"]
+        if self.use_numpy:
+            # np.subtract.at handles the same actor appearing more than once
+            np.subtract.at(hp, rows, np.asarray(amounts, dtype=np.int64))
+            hp[rows] = np.maximum(hp[rows], 0)
+            return
+        for row, amount in zip(rows, amounts):
+            hp[row] = max(hp[row] - amount, 0)
+
+    def heal(self, npc_ids: Sequence[str], amounts: Sequence[int]):
+        """Add ``amounts`` to the hp of ``npc_ids``, capped at their constitution."""
+        rows = self._rows_for(npc_ids)
+        hp, cap = self.columns["hp"], self.columns["constitution"]
+        if self.use_numpy:
+            np.add.at(hp, rows, np.asarray(amounts, dtype=np.int64))
+            hp[rows] = np.minimum(hp[rows], cap[rows])
+            return
+        for row, amount in zip(rows, amounts):
+            hp[row] = min(hp[row] + amount, cap[row])
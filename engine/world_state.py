@@ -1,15 +1,45 @@
-import json
+import time
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Set
 
 from .data_models import (
     NPC,
+    ConnectionState,
     LocationStatic,
     LocationState,
     ItemBlueprint,
     ItemInstance,
+    to_dict,
 )
 from .events import Event
+from .compact import OrderedSet
+from .vitals import VitalsTable
+from .ids import IdRegistry
+from .loading import load_json_files, paused_gc
+from .persistence import BackgroundWriter, write_atomic, write_batch
+from .sound import SoundMap
+from .memory_index import MemoryIndex
+from .memory_vectors import MemoryVectors
+
+
+HUNGRY_THRESHOLD = 20
+STARVING_THRESHOLD = 40
+
+# File name, relative to data_dir, of an entity that was not loaded from a file
+DEFAULT_FILES: Dict[str, str] = {
+    "npcs": "npcs/{}.json",
+    "locations_static": "locations/{}_static.json",
+    "locations_state": "locations/{}_state.json",
+    "item_instances": "items/instances/{}.json",
+}
+
+
+def hunger_stage_for(ticks_since_meal: int) -> str:
+    if ticks_since_meal >= STARVING_THRESHOLD:
+        return "starving"
+    if ticks_since_meal >= HUNGRY_THRESHOLD:
+        return "hungry"
+    return "sated"
 
 
 class WorldState:
@@ -20,23 +50,125 @@ class WorldState:
         self.locations_state: Dict[str, LocationState] = {}
         self.item_blueprints: Dict[str, ItemBlueprint] = {}
         self.item_instances: Dict[str, ItemInstance] = {}
+        # npc_id -> loc_id, kept in sync with LocationState.occupants
+        self.npc_locations: Dict[str, str] = {}
+        # Canonical id strings per entity kind; see register_ids
+        self.npc_registry = IdRegistry()
+        self.location_registry = IdRegistry()
+        self.item_registry = IdRegistry()
+        # Param kind -> registry, for ids arriving in commands; see canonical_id
+        self.id_registries: Dict[str, IdRegistry] = {
+            "npc": self.npc_registry,
+            "location": self.location_registry,
+            "item": self.item_registry,
+        }
+        # Ids of entities changed since the last save(); see mark_dirty
+        self.dirty_npcs: Set[str] = set()
+        self.dirty_locations: Set[str] = set()
+        self.dirty_items: Set[str] = set()
+        self.deleted_items: Set[str] = set()
+        # section -> entity id -> file it was loaded from, relative to data_dir; see entity_file
+        self.entity_files: Dict[str, Dict[str, Path]] = {section: {} for section in DEFAULT_FILES}
+        self._writer: Optional[BackgroundWriter] = None
+        # Seconds per stage of the last load(); see loading.load_json_files
+        self.load_timings: Dict[str, float] = {}
+        # Column store for hp/hunger/readiness; see enable_vitals
+        self.vitals: Optional[VitalsTable] = None
+        # Cached sound propagation over the location graph
+        self.sound = SoundMap(self)
+        # npc_id -> keyword index of its memories, built on first search; see memory_index
+        self.memory_indexes: Dict[str, MemoryIndex] = {}
+        # npc_id -> embedding matrix of its memories; see vector_bank
+        self.memory_vectors: Dict[str, MemoryVectors] = {}
+        # Open saved vector banks memory-mapped instead of reading them into RAM
+        self.mmap_vectors = True
+        # event_type -> callback mutating the world for that event
+        self.apply_handlers: Dict[str, Callable[[Event], None]] = {
+            "move": self._apply_move,
+            "grab": self._apply_grab,
+            "drop": self._apply_drop,
+            "eat": self._apply_eat,
+            "damage_applied": self._apply_damage,
+            "rest": self._apply_rest,
+            "equip": self._apply_equip,
+            "unequip": self._apply_unequip,
+            "give": self._apply_give,
+            "open_connection": self._apply_open_connection,
+            "close_connection": self._apply_close_connection,
+            "npc_died": self._apply_npc_died,
+            "hunger_changed": self._apply_hunger_changed,
+        }
 
-    def load(self):
-        self._load_npcs()
-        self._load_locations()
-        self._load_items()
-        # assign current_location for items based on location state
-        for loc_id, state in self.locations_state.items():
-            for item_id in state.items:
-                inst = self.item_instances.get(item_id)
-                if inst and inst.current_location is None:
-                    inst.current_location = loc_id
+    def load(self, workers: int = 0, processes: int = 0, batch_size: int = 64) -> Dict[str, float]:
+        """Load every JSON file under ``data_dir``.
+
+        ``workers`` > 0 reads the files from a thread pool and ``processes``
+        > 0 parses them in a process pool (see ``loading.load_json_files``);
+        every mode builds the same world. Returns seconds per stage, which are
+        also kept in ``load_timings``.
+        """
+        perf_counter = time.perf_counter
+        start = perf_counter()
+        timings: Dict[str, float] = {}
+        npc_paths = list((self.data_dir / "npcs").glob("*.json"))
+        loc_dir = self.data_dir / "locations"
+        static_paths = list(loc_dir.glob("*_static.json"))
+        state_paths = list(loc_dir.glob("*_state.json"))
+        items_dir = self.data_dir / "items"
+        catalog_paths = [items_dir / "catalog.json"] if (items_dir / "catalog.json").exists() else []
+        instance_paths = list((items_dir / "instances").glob("*.json"))
+        index_paths = list((self.data_dir / "memory_index").glob("*.json"))
+        sections = [npc_paths, static_paths, state_paths, catalog_paths, instance_paths, index_paths]
+        timings["list"] = perf_counter() - start
+
+        with paused_gc():
+            documents, fetch_timings = load_json_files(
+                [path for paths in sections for path in paths], workers, processes, batch_size
+            )
+            timings.update(fetch_timings)
 
-    def _load_npcs(self):
-        npcs_dir = self.data_dir / "npcs"
-        for path in npcs_dir.glob("*.json"):
-            with open(path, "r") as f:
-                data = json.load(f)
+            mark = perf_counter()
+            offset = 0
+            split = []
+            for paths in sections:
+                split.append(documents[offset : offset + len(paths)])
+                offset += len(paths)
+            npc_docs, static_docs, state_docs, catalog_docs, instance_docs, index_docs = split
+            # Saves write back to these files, whose names need not match the ids
+            for section, paths, docs in (
+                ("npcs", npc_paths, npc_docs),
+                ("locations_static", static_paths, static_docs),
+                ("locations_state", state_paths, state_docs),
+                ("item_instances", instance_paths, instance_docs),
+            ):
+                files = self.entity_files[section]
+                for path, data in zip(paths, docs):
+                    files[data["id"]] = path.relative_to(self.data_dir)
+            self._build_npcs(npc_docs)
+            self._build_locations(static_docs, state_docs)
+            self._build_items(catalog_docs[0] if catalog_docs else {}, instance_docs)
+            for path, data in zip(index_paths, index_docs):
+                index = MemoryIndex.from_dict(data)
+                if index is not None:
+                    self.memory_indexes[path.stem] = index
+            timings["build"] = perf_counter() - mark
+
+            mark = perf_counter()
+            self.register_ids()
+            self.rebuild_location_index()
+            # assign current_location for items based on location state
+            for loc_id, state in self.locations_state.items():
+                for item_id in state.items:
+                    inst = self.item_instances.get(item_id)
+                    if inst and inst.current_location is None:
+                        inst.current_location = loc_id
+            timings["index"] = perf_counter() - mark
+        timings["total"] = perf_counter() - start
+        self.load_timings = timings
+        return timings
+
+    def _build_npcs(self, documents: List[dict]):
+        for data in documents:
             if "next_available_tick" not in data:
                 data["next_available_tick"] = 0
             if "last_meal_tick" not in data:
@@ -46,36 +178,283 @@ class WorldState:
             npc = NPC(**data)
             self.npcs[npc.id] = npc
 
-    def _load_locations(self):
-        loc_dir = self.data_dir / "locations"
-        for path in loc_dir.glob("*_static.json"):
-            with open(path, "r") as f:
-                data = json.load(f)
+    def _build_locations(self, static_documents: List[dict], state_documents: List[dict]):
+        for data in static_documents:
             loc = LocationStatic(**data)
             self.locations_static[loc.id] = loc
-        for path in loc_dir.glob("*_state.json"):
-            with open(path, "r") as f:
-                data = json.load(f)
+        for data in state_documents:
             loc = LocationState(**data)
             self.locations_state[loc.id] = loc
 
-    def _load_items(self):
-        items_dir = self.data_dir / "items"
-        catalog_path = items_dir / "catalog.json"
-        if catalog_path.exists():
-            with open(catalog_path, "r") as f:
-                catalog = json.load(f)
-            for item_id, data in catalog.items():
-                blueprint = ItemBlueprint(id=item_id, **data)
-                self.item_blueprints[blueprint.id] = blueprint
-
-        instances_dir = items_dir / "instances"
-        if instances_dir.exists():
-            for path in instances_dir.glob("*.json"):
-                with open(path, "r") as f:
-                    data = json.load(f)
-                instance = ItemInstance(**data)
-                self.item_instances[instance.id] = instance
+    def _build_items(self, catalog: Dict[str, dict], instance_documents: List[dict]):
+        for item_id, data in catalog.items():
+            blueprint = ItemBlueprint(id=item_id, **data)
+            self.item_blueprints[blueprint.id] = blueprint
+        for data in instance_documents:
+            instance = ItemInstance(**data)
+            self.item_instances[instance.id] = instance
+
+    def write_json(self, data_dir: Optional[Path] = None):
+        """Write the world in the directory layout ``load`` reads, to ``data_dir`` or ``self.data_dir``."""
+        data_dir = Path(data_dir if data_dir is not None else self.data_dir)
+        for directory in ("npcs", "locations", "items/instances"):
+            (data_dir / directory).mkdir(parents=True, exist_ok=True)
+        for npc in self.npcs.values():
+            write_atomic(data_dir / self.entity_file("npcs", npc.id), to_dict(npc))
+        if self.memory_indexes:
+            (data_dir / "memory_index").mkdir(exist_ok=True)
+        for npc_id, index in self.memory_indexes.items():
+            write_atomic(data_dir / "memory_index" / f"{npc_id}.json", index.to_dict())
+        if self.memory_vectors:
+            (data_dir / "memory_vectors").mkdir(exist_ok=True)
+        for npc_id, bank in self.memory_vectors.items():
+            write_atomic(data_dir / "memory_vectors" / f"{npc_id}.npy", bank.to_npy())
+            write_atomic(data_dir / "memory_vectors" / f"{npc_id}.json", bank.meta())
+        for loc in self.locations_static.values():
+            write_atomic(data_dir / self.entity_file("locations_static", loc.id), to_dict(loc))
+        for loc in self.locations_state.values():
+            write_atomic(data_dir / self.entity_file("locations_state", loc.id), to_dict(loc))
+        catalog = {}
+        for blueprint in self.item_blueprints.values():
+            data = to_dict(blueprint)
+            catalog[data.pop("id")] = data
+        write_atomic(data_dir / "items" / "catalog.json", catalog)
+        for item in self.item_instances.values():
+            write_atomic(data_dir / self.entity_file("item_instances", item.id), to_dict(item))
+
+    def entity_file(self, section: str, entity_id: str) -> Path:
+        """File of an entity relative to ``data_dir``: the one it was loaded from, else ``DEFAULT_FILES``.
+
+        ``section`` is the ``WorldState`` attribute holding the entity.
+        """
+        files = self.entity_files[section]
+        path = files.get(entity_id)
+        if path is None:
+            path = files[entity_id] = Path(DEFAULT_FILES[section].format(entity_id))
+        return path
+
+    def mark_dirty(self, *entity_ids: str):
+        """Record that the NPCs, location states or item instances with these ids changed.
+
+        Ids that are not an NPC, location or item (or are None) are ignored.
+        """
+        for entity_id in entity_ids:
+            if entity_id in self.npcs:
+                self.dirty_npcs.add(entity_id)
+            elif entity_id in self.locations_state:
+                self.dirty_locations.add(entity_id)
+            elif entity_id in self.item_instances:
+                self.dirty_items.add(entity_id)
+
+    def _delete_item(self, item_id: str):
+        self.item_instances.pop(item_id, None)
+        self.dirty_items.discard(item_id)
+        self.deleted_items.add(item_id)
+
+    def save(self, background: bool = False) -> int:
+        """Write the entities changed since the last save into ``data_dir``.
+
+        Only dirty NPCs, location states and item instances are written (and
+        eaten items deleted), each through a temporary file and a rename, to
+        the file it was loaded from (see ``entity_file``).
+        Documents are serialised here; with ``background`` the file writes
+        happen on a writer thread and ``flush_saves`` waits for them. Static
+        locations and the catalog never change, so saving into a new
+        directory needs a ``write_json`` first. Returns the number of files
+        written or deleted.
+        """
+        data_dir = Path(self.data_dir)
+        batch = []
+        for npc_id in self.dirty_npcs:
+            npc = self.npcs.get(npc_id)
+            if npc is not None:
+                batch.append((data_dir / self.entity_file("npcs", npc_id), to_dict(npc)))
+                index = self.memory_indexes.get(npc_id)
+                if index is not None and index.matches(npc.memories):
+                    batch.append((data_dir / "memory_index" / f"{npc_id}.json", index.to_dict()))
+                bank = self.memory_vectors.get(npc_id)
+                if bank is not None and bank.matches(npc.memories):
+                    # Matrix before metadata, so a crash in between leaves a mismatch, not a wrong bank
+                    batch.append((data_dir / "memory_vectors" / f"{npc_id}.npy", bank.to_npy()))
+                    batch.append((data_dir / "memory_vectors" / f"{npc_id}.json", bank.meta()))
+        for loc_id in self.dirty_locations:
+            loc = self.locations_state.get(loc_id)
+            if loc is not None:
+                batch.append((data_dir / self.entity_file("locations_state", loc_id), to_dict(loc)))
+        for item_id in self.dirty_items:
+            item = self.item_instances.get(item_id)
+            if item is not None:
+                batch.append((data_dir / self.entity_file("item_instances", item_id), to_dict(item)))
+        for item_id in self.deleted_items:
+            batch.append((data_dir / self.entity_file("item_instances", item_id), None))
+            del self.entity_files["item_instances"][item_id]
+        self.dirty_npcs.clear()
+        self.dirty_locations.clear()
+        self.dirty_items.clear()
+        self.deleted_items.clear()
+        if not batch:
+            return 0
+        if background:
+            if self._writer is None:
+                self._writer = BackgroundWriter()
+            self._writer.submit(batch)
+        else:
+            write_batch(batch)
+        return len(batch)
+
+    def flush_saves(self):
+        """Block until background saves have reached the disk."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self):
+        """Finish pending background saves and stop the writer thread."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def register_ids(self):
+        """Register every entity id and share one string per id.
+
+        JSON loading creates a new string for every mention of an id; after
+        this each occupants list, inventory, slot and connection refers to the
+        registry's canonical string instead. Safe to call again after adding
+        entities.
+        """
+        npc_ids, loc_ids, item_ids = self.npc_registry, self.location_registry, self.item_registry
+        self.npcs = {npc_ids.intern(npc_id): npc for npc_id, npc in self.npcs.items()}
+        self.locations_static = {loc_ids.intern(loc_id): loc for loc_id, loc in self.locations_static.items()}
+        self.locations_state = {loc_ids.intern(loc_id): loc for loc_id, loc in self.locations_state.items()}
+        self.item_instances = {item_ids.intern(item_id): inst for item_id, inst in self.item_instances.items()}
+        for npc in self.npcs.values():
+            npc.id = npc_ids.intern(npc.id)
+            npc.inventory = OrderedSet(item_ids.intern(item_id) for item_id in npc.inventory)
+            for slot, item_id in npc.slots.items():
+                if item_id:
+                    npc.slots[slot] = item_ids.intern(item_id)
+        for loc in self.locations_static.values():
+            loc.id = loc_ids.intern(loc.id)
+            for direction, neighbour in loc.hex_connections.items():
+                loc.hex_connections[direction] = loc_ids.intern(neighbour)
+        for loc in self.locations_state.values():
+            loc.id = loc_ids.intern(loc.id)
+            loc.occupants = OrderedSet(npc_ids.intern(npc_id) for npc_id in loc.occupants)
+            loc.items = OrderedSet(item_ids.intern(item_id) for item_id in loc.items)
+            loc.connections_state = {
+                loc_ids.intern(neighbour): state for neighbour, state in loc.connections_state.items()
+            }
+        for inst in self.item_instances.values():
+            inst.id = item_ids.intern(inst.id)
+            inst.inventory[:] = [item_ids.intern(item_id) for item_id in inst.inventory]
+            if inst.current_location:
+                inst.current_location = loc_ids.intern(inst.current_location)
+            if inst.owner_id:
+                inst.owner_id = npc_ids.canonical(inst.owner_id)
+        # Cached sound propagation may still hold the replaced strings
+        self.sound.clear()
+
+    def memory_index(self, npc_id: str) -> MemoryIndex:
+        """Keyword index of the NPC's memories, loaded, kept or rebuilt as needed.
+
+        An index saved with the NPC is used as long as it still matches the
+        memory list; memories changed other than through ``add_memory`` and
+        ``consolidate_memories`` cause a rebuild on the next call.
+        """
+        memories = self.npcs[npc_id].memories
+        index = self.memory_indexes.get(npc_id)
+        if index is None or not index.matches(memories):
+            index = self.memory_indexes[npc_id] = MemoryIndex.build(memories)
+            self.dirty_npcs.add(npc_id)
+        return index
+
+    def _memory_stores(self, npc_id: str) -> list:
+        """The NPC's loaded keyword index and vector bank, dropping any out of step."""
+        memories = self.npcs[npc_id].memories
+        stores = []
+        for cache in (self.memory_indexes, self.memory_vectors):
+            store = cache.get(npc_id)
+            if store is None:
+                continue
+            if store.matches(memories):
+                stores.append(store)
+            else:
+                # Rebuilt on next use; kept, it could match again by length alone
+                del cache[npc_id]
+        return stores
+
+    def add_memory(self, npc_id: str, text: str, tick: int, priority: Any = 1, **fields: Any) -> dict:
+        """Append a long-term memory to the NPC and index it."""
+        npc = self.npcs[npc_id]
+        memory = {"text": text, "tick": tick, "priority": priority, **fields}
+        stores = self._memory_stores(npc_id)
+        npc.memories.append(memory)
+        for store in stores:
+            store.add(memory)
+        self.dirty_npcs.add(npc_id)
+        return memory
+
+    def consolidate_memories(self, npc_id: str, positions: List[int], summary: Optional[dict] = None):
+        """Replace the memories at ``positions`` with ``summary`` (or just drop them)."""
+        npc = self.npcs[npc_id]
+        stores = self._memory_stores(npc_id)
+        drop = set(positions)
+        npc.memories[:] = [memory for position, memory in enumerate(npc.memories) if position not in drop]
+        for store in stores:
+            store.remove(drop, npc.memories)
+        if summary is not None:
+            npc.memories.append(summary)
+            for store in stores:
+                store.add(summary)
+        self.dirty_npcs.add(npc_id)
+
+    def search_memories(
+        self, npc_id: str, query: str, n: int = 5, now: Optional[int] = None, **weights: float
+    ) -> List[dict]:
+        """The ``n`` memories most relevant to ``query``; see ``MemoryIndex.search``."""
+        memories = self.npcs[npc_id].memories
+        ranked = self.memory_index(npc_id).search(memories, query, n, now, **weights)
+        return [memories[position] for _, position in ranked]
+
+    def vector_bank(self, npc_id: str) -> MemoryVectors:
+        """Embeddings of the NPC's memories, opened from disk, kept or rebuilt as needed.
+
+        A bank saved under ``data_dir/memory_vectors`` is memory-mapped when
+        ``mmap_vectors`` is set and used as long as it matches the memory
+        list, like ``memory_index``.
+        """
+        memories = self.npcs[npc_id].memories
+        bank = self.memory_vectors.get(npc_id)
+        if bank is None:
+            bank = self._open_vector_bank(npc_id)
+        if bank is None or not bank.matches(memories):
+            bank = MemoryVectors.build(memories)
+            self.dirty_npcs.add(npc_id)
+        self.memory_vectors[npc_id] = bank
+        return bank
+
+    def _open_vector_bank(self, npc_id: str) -> Optional[MemoryVectors]:
+        base = Path(self.data_dir) / "memory_vectors" / npc_id
+        meta_path, npy_path = base.with_suffix(".json"), base.with_suffix(".npy")
+        if not (meta_path.exists() and npy_path.exists()):
+            return None
+        try:
+            (meta,), _ = load_json_files([meta_path])
+            return MemoryVectors.open(npy_path, meta, use_mmap=self.mmap_vectors)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def semantic_search(self, npc_id: str, query: str, n: int = 5) -> List[dict]:
+        """The ``n`` memories closest in meaning to ``query``; see ``MemoryVectors.search``."""
+        memories = self.npcs[npc_id].memories
+        return [memories[position] for _, position in self.vector_bank(npc_id).search(query, n)]
+
+    def canonical_id(self, kind: str, entity_id: str) -> str:
+        """Registry string for an id of ``kind`` (``npc``, ``location`` or ``item``).
+
+        Unknown ids and other parameter kinds come back unchanged.
+        """
+        registry = self.id_registries.get(kind)
+        return entity_id if registry is None else registry.canonical(entity_id)
 
     def get_npc(self, npc_id: str) -> NPC:
         return self.npcs[npc_id]
@@ -93,150 +472,245 @@ class WorldState:
         return self.item_blueprints[blueprint_id]
 
     def find_npc_location(self, npc_id: str) -> Optional[str]:
+        return self.npc_locations.get(npc_id)
+
+    def rebuild_location_index(self):
+        """Recompute ``npc_locations`` from the occupants of every location."""
+        self.npc_locations = {}
         for loc_id, loc in self.locations_state.items():
-            if npc_id in loc.occupants:
-                return loc_id
-        return None
-
-    def update_hunger(self, current_tick: int) -> list[Event]:
-        HUNGRY_THRESHOLD = 20
-        STARVING_THRESHOLD = 40
-        events: list[Event] = []
-        for npc in self.npcs.values():
-            if "dead" in npc.tags.get("dynamic", []):
-                continue
-            ticks_since = current_tick - npc.last_meal_tick
-            if ticks_since >= STARVING_THRESHOLD:
-                npc.hunger_stage = "starving"
-                events.append(
-                    Event(
-                        event_type="damage_applied",
-                        tick=current_tick,
-                        actor_id=npc.id,
-                        target_ids=[npc.id],
-                        payload={"amount": 1, "damage_type": "starvation"},
-                    )
-                )
-            elif ticks_since >= HUNGRY_THRESHOLD:
-                npc.hunger_stage = "hungry"
-            else:
+            for npc_id in loc.occupants:
+                self.npc_locations[npc_id] = loc_id
+
+    def check_location_index(self) -> List[str]:
+        """Return a description of every mismatch between the index and occupants."""
+        problems: List[str] = []
+        seen: Dict[str, str] = {}
+        for loc_id, loc in self.locations_state.items():
+            for npc_id in loc.occupants:
+                if npc_id in seen:
+                    problems.append(f"{npc_id} occupies both {seen[npc_id]} and {loc_id}")
+                    continue
+                seen[npc_id] = loc_id
+                indexed = self.npc_locations.get(npc_id)
+                if indexed != loc_id:
+                    problems.append(f"{npc_id} is in {loc_id} but indexed at {indexed}")
+        for npc_id, loc_id in self.npc_locations.items():
+            if npc_id not in seen:
+                problems.append(f"{npc_id} indexed at {loc_id} but not an occupant anywhere")
+        return problems
+
+    def enable_vitals(self, use_numpy: Optional[bool] = None) -> VitalsTable:
+        """Move every NPC's vitals into a ``VitalsTable`` and return it.
+
+        NPC attributes keep working as before but read and write the table.
+        NPCs added to ``npcs`` afterwards are only included once passed to
+        ``vitals.attach``. The table speeds up whole-population work:
+        ``hunger_sweep``, ``ready_actors``, ``reset_hunger`` and the bulk
+        ``apply_damage``/``heal`` calls, which the ``damage_applied`` and
+        ``rest`` handlers also go through. The simulator still schedules
+        hunger and turns per NPC from its event and ready queues, so
+        ``hunger_sweep`` and ``ready_actors`` serve callers outside the tick.
+        """
+        if self.vitals is None:
+            self.vitals = VitalsTable(capacity=len(self.npcs), use_numpy=use_numpy)
+            self.vitals.attach_all(self.npcs.values())
+        return self.vitals
+
+    def disable_vitals(self):
+        """Copy the table back into the NPC objects and drop it."""
+        if self.vitals is not None:
+            self.vitals.detach_all()
+            self.vitals = None
+
+    def hunger_sweep(self, tick: int) -> List[tuple]:
+        """Return ``(npc_id, stage)`` for living NPCs whose ``hunger_stage`` is stale at ``tick``."""
+        if self.vitals is not None:
+            return self.vitals.hunger_sweep(tick, HUNGRY_THRESHOLD, STARVING_THRESHOLD)
+        changes = []
+        for npc_id, npc in self.npcs.items():
+            stage = hunger_stage_for(tick - npc.last_meal_tick)
+            if stage != npc.hunger_stage and "dead" not in npc.tags.get("dynamic", []):
+                changes.append((npc_id, stage))
+        return changes
+
+    def ready_actors(self, tick: int) -> List[str]:
+        """Ids of living NPCs free to act at ``tick``."""
+        if self.vitals is not None:
+            return self.vitals.ready_at(tick)
+        return [
+            npc_id
+            for npc_id, npc in self.npcs.items()
+            if npc.next_available_tick <= tick and "dead" not in npc.tags.get("dynamic", [])
+        ]
+
+    def reset_hunger(self, tick: int):
+        """Mark every NPC as having just eaten at ``tick``."""
+        if self.vitals is not None:
+            self.vitals.reset_hunger(tick)
+        else:
+            for npc in self.npcs.values():
                 npc.hunger_stage = "sated"
-        return events
-
-    def apply_event(self, event):
-        if event.event_type == "move":
-            actor_id = event.actor_id
-            target = event.target_ids[0]
-            current_loc = self.find_npc_location(actor_id)
-            if current_loc:
-                self.locations_state[current_loc].occupants.remove(actor_id)
-            self.locations_state[target].occupants.append(actor_id)
-        elif event.event_type == "grab":
-            actor_id = event.actor_id
-            item_id = event.target_ids[0]
-            loc_id = self.find_npc_location(actor_id)
-            if loc_id and item_id in self.locations_state[loc_id].items:
-                self.locations_state[loc_id].items.remove(item_id)
-                self.npcs[actor_id].inventory.append(item_id)
-                inst = self.item_instances.get(item_id)
-                if inst:
-                    inst.owner_id = actor_id
-                    inst.current_location = None
-        elif event.event_type == "drop":
-            actor_id = event.actor_id
-            item_id = event.target_ids[0]
-            loc_id = self.find_npc_location(actor_id)
-            if loc_id and item_id in self.npcs[actor_id].inventory:
-                self.npcs[actor_id].inventory.remove(item_id)
+                npc.last_meal_tick = tick
+        self.dirty_npcs.update(self.npcs)
+
+    def register_apply_handler(self, event_type: str, handler: Callable[[Event], None]):
+        """Register ``handler`` to mutate world state for ``event_type`` events."""
+        self.apply_handlers[event_type] = handler
+
+    def apply_event(self, event: Event):
+        handler = self.apply_handlers.get(event.event_type)
+        if handler:
+            handler(event)
+            # Handlers mark anything else they touch, such as a move's origin
+            self.mark_dirty(event.actor_id, *event.target_ids)
+
+    def _apply_move(self, event: Event):
+        actor_id = event.actor_id
+        target = event.target_ids[0]
+        current_loc = self.find_npc_location(actor_id)
+        if current_loc:
+            self.locations_state[current_loc].occupants.remove(actor_id)
+            self.dirty_locations.add(current_loc)
+        self.locations_state[target].occupants.append(actor_id)
+        self.npc_locations[actor_id] = target
+
+    def _apply_grab(self, event: Event):
+        actor_id = event.actor_id
+        item_id = event.target_ids[0]
+        loc_id = self.find_npc_location(actor_id)
+        if loc_id and item_id in self.locations_state[loc_id].items:
+            self.locations_state[loc_id].items.remove(item_id)
+            self.npcs[actor_id].inventory.append(item_id)
+            self.dirty_locations.add(loc_id)
+            inst = self.item_instances.get(item_id)
+            if inst:
+                inst.owner_id = actor_id
+                inst.current_location = None
+
+    def _apply_drop(self, event: Event):
+        actor_id = event.actor_id
+        item_id = event.target_ids[0]
+        loc_id = self.find_npc_location(actor_id)
+        if loc_id and item_id in self.npcs[actor_id].inventory:
+            self.npcs[actor_id].inventory.remove(item_id)
+            self.locations_state[loc_id].items.append(item_id)
+            self.dirty_locations.add(loc_id)
+            inst = self.item_instances.get(item_id)
+            if inst:
+                inst.owner_id = None
+                inst.current_location = loc_id
+
+    def _apply_eat(self, event: Event):
+        actor_id = event.actor_id
+        item_id = event.target_ids[0]
+        npc = self.npcs.get(actor_id)
+        if npc and item_id in npc.inventory:
+            npc.inventory.remove(item_id)
+            self._delete_item(item_id)
+            npc.last_meal_tick = event.tick
+            npc.hunger_stage = "sated"
+
+    def _apply_hunger_changed(self, event: Event):
+        npc = self.npcs.get(event.actor_id)
+        if npc and "dead" not in npc.tags.get("dynamic", []):
+            npc.hunger_stage = event.payload["stage"]
+
+    def _apply_damage(self, event: Event):
+        target_id = event.target_ids[0]
+        amount = event.payload.get("amount", 0)
+        npc = self.npcs.get(target_id)
+        if not npc:
+            return
+        if self.vitals is not None and target_id in self.vitals:
+            self.vitals.apply_damage([target_id], [amount])
+        else:
+            npc.hp = max(npc.hp - amount, 0)
+
+    def _apply_rest(self, event: Event):
+        actor_id = event.actor_id
+        healed = event.payload.get("healed", 0)
+        npc = self.npcs.get(actor_id)
+        if not npc:
+            return
+        if self.vitals is not None and actor_id in self.vitals:
+            self.vitals.heal([actor_id], [healed])
+        else:
+            max_hp = npc.attributes.get("constitution", npc.hp)
+            npc.hp = min(npc.hp + healed, max_hp)
+
+    def _apply_equip(self, event: Event):
+        actor_id = event.actor_id
+        item_id = event.target_ids[0]
+        slot = event.payload.get("slot")
+        npc = self.npcs.get(actor_id)
+        if npc and slot in npc.slots and item_id in npc.inventory:
+            current = npc.slots.get(slot)
+            if current:
+                npc.inventory.append(current)
+            npc.inventory.remove(item_id)
+            npc.slots[slot] = item_id
+
+    def _apply_unequip(self, event: Event):
+        actor_id = event.actor_id
+        slot = event.payload.get("slot")
+        npc = self.npcs.get(actor_id)
+        if npc and slot in npc.slots and npc.slots.get(slot):
+            item_id = npc.slots[slot]
+            npc.inventory.append(item_id)
+            npc.slots[slot] = None
+
+    def _apply_give(self, event: Event):
+        actor_id = event.actor_id
+        item_id, target_id = event.target_ids
+        giver = self.npcs.get(actor_id)
+        receiver = self.npcs.get(target_id)
+        if giver and receiver and item_id in giver.inventory:
+            giver.inventory.remove(item_id)
+            receiver.inventory.append(item_id)
+            inst = self.item_instances.get(item_id)
+            if inst:
+                inst.owner_id = target_id
+
+    def _set_connection_status(self, event: Event, status: str):
+        actor_loc = self.find_npc_location(event.actor_id)
+        target = event.target_ids[0]
+        if actor_loc:
+            self.locations_state[actor_loc].connections_state.setdefault(target, ConnectionState())["status"] = status
+            self.locations_state[target].connections_state.setdefault(actor_loc, ConnectionState())["status"] = status
+            self.dirty_locations.add(actor_loc)
+            self.sound.invalidate(actor_loc, target)
+
+    def _apply_open_connection(self, event: Event):
+        self._set_connection_status(event, "open")
+
+    def _apply_close_connection(self, event: Event):
+        self._set_connection_status(event, "closed")
+
+    def _apply_npc_died(self, event: Event):
+        npc = self.npcs.get(event.actor_id)
+        if not npc:
+            return
+        loc_id = self.find_npc_location(npc.id)
+        if loc_id and npc.id in self.locations_state[loc_id].occupants:
+            self.locations_state[loc_id].occupants.remove(npc.id)
+            del self.npc_locations[npc.id]
+            # Drop inventory and equipped items
+            all_items = list(npc.inventory)
+            for slot, item_id in npc.slots.items():
+                if item_id:
+                    all_items.append(item_id)
+                    npc.slots[slot] = None
+            self.mark_dirty(loc_id, *all_items)
+            for item_id in all_items:
                 self.locations_state[loc_id].items.append(item_id)
                 inst = self.item_instances.get(item_id)
                 if inst:
                     inst.owner_id = None
                     inst.current_location = loc_id
-        elif event.event_type == "eat":
-            actor_id = event.actor_id
-            item_id = event.target_ids[0]
-            npc = self.npcs.get(actor_id)
-            if npc and item_id in npc.inventory:
-                npc.inventory.remove(item_id)
-                self.item_instances.pop(item_id, None)
-                npc.last_meal_tick = event.tick
-                npc.hunger_stage = "sated"
-        elif event.event_type == "damage_applied":
-            target_id = event.target_ids[0]
-            amount = event.payload.get("amount", 0)
-            npc = self.npcs.get(target_id)
-            if npc:
-                npc.hp = max(npc.hp - amount, 0)
-        elif event.event_type == "rest":
-            actor_id = event.actor_id
-            healed = event.payload.get("healed", 0)
-            npc = self.npcs.get(actor_id)
-            if npc:
-                max_hp = npc.attributes.get("constitution", npc.hp)
-                npc.hp = min(npc.hp + healed, max_hp)
-        elif event.event_type == "equip":
-            actor_id = event.actor_id
-            item_id = event.target_ids[0]
-            slot = event.payload.get("slot")
-            npc = self.npcs.get(actor_id)
-            if npc and slot in npc.slots and item_id in npc.inventory:
-                current = npc.slots.get(slot)
-                if current:
-                    npc.inventory.append(current)
-                npc.inventory.remove(item_id)
-                npc.slots[slot] = item_id
-        elif event.event_type == "unequip":
-            actor_id = event.actor_id
-            slot = event.payload.get("slot")
-            npc = self.npcs.get(actor_id)
-            if npc and slot in npc.slots and npc.slots.get(slot):
-                item_id = npc.slots[slot]
-                npc.inventory.append(item_id)
-                npc.slots[slot] = None
-        elif event.event_type == "give":
-            actor_id = event.actor_id
-            item_id, target_id = event.target_ids
-            giver = self.npcs.get(actor_id)
-            receiver = self.npcs.get(target_id)
-            if giver and receiver and item_id in giver.inventory:
-                giver.inventory.remove(item_id)
-                receiver.inventory.append(item_id)
-                inst = self.item_instances.get(item_id)
-                if inst:
-                    inst.owner_id = target_id
-        elif event.event_type == "open_connection":
-            actor_loc = self.find_npc_location(event.actor_id)
-            target = event.target_ids[0]
-            if actor_loc:
-                self.locations_state[actor_loc].connections_state.setdefault(target, {})["status"] = "open"
-                self.locations_state[target].connections_state.setdefault(actor_loc, {})["status"] = "open"
-        elif event.event_type == "close_connection":
-            actor_loc = self.find_npc_location(event.actor_id)
-            target = event.target_ids[0]
-            if actor_loc:
-                self.locations_state[actor_loc].connections_state.setdefault(target, {})["status"] = "closed"
-                self.locations_state[target].connections_state.setdefault(actor_loc, {})["status"] = "closed"
-        elif event.event_type == "npc_died":
-            npc = self.npcs.get(event.actor_id)
-            if not npc:
-                return
-            loc_id = self.find_npc_location(npc.id)
-            if loc_id and npc.id in self.locations_state[loc_id].occupants:
-                self.locations_state[loc_id].occupants.remove(npc.id)
-                # Drop inventory and equipped items
-                all_items = list(npc.inventory)
-                for slot, item_id in npc.slots.items():
-                    if item_id:
-                        all_items.append(item_id)
-                        npc.slots[slot] = None
-                for item_id in all_items:
-                    self.locations_state[loc_id].items.append(item_id)
-                    inst = self.item_instances.get(item_id)
-                    if inst:
-                        inst.owner_id = None
-                        inst.current_location = loc_id
-                npc.inventory.clear()
-            # Mark as dead
-            if "dead" not in npc.tags.get("dynamic", []):
-                npc.tags.setdefault("dynamic", []).append("dead")
+            npc.inventory.clear()
+        # Mark as dead
+        if "dead" not in npc.tags.get("dynamic", []):
+            npc.tags.setdefault("dynamic", []).append("dead")
+        if self.vitals is not None:
+            self.vitals.mark_dead(npc.id)
+
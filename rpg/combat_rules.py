@@ -1,5 +1,5 @@
 import random
-from typing import Dict
+from typing import Dict, Optional
 
 from engine.data_models import NPC, ItemBlueprint
 from engine.world_state import WorldState
@@ -21,11 +21,13 @@ def proficiency_bonus(level: str) -> int:
     return _PROFICIENCY_MAP.get(level, 0)
 
 
-def roll_dice(spec: str) -> int:
+def roll_dice(spec: str, rng: Optional[random.Random] = None) -> int:
+    """Roll ``spec`` such as ``2d6``; ``rng`` defaults to the global ``random`` module."""
+    randint = (rng or random).randint
     num, die = spec.lower().split('d')
     num = int(num)
     die = int(die)
-    return sum(random.randint(1, die) for _ in range(num))
+    return sum(randint(1, die) for _ in range(num))
 
 
 _DEFAULT_UNARMED = ItemBlueprint(
@@ -61,7 +63,9 @@ def compute_ac(world: WorldState, actor: NPC) -> int:
     return ac
 
 
-def resolve_attack(world: WorldState, attacker: NPC, target: NPC) -> Dict[str, int]:
+def resolve_attack(
+    world: WorldState, attacker: NPC, target: NPC, rng: Optional[random.Random] = None
+) -> Dict[str, int]:
     weapon = get_weapon(world, attacker)
     # choose ability
     str_mod = ability_modifier(attacker.attributes.get("strength", 10))
@@ -72,16 +76,16 @@ def resolve_attack(world: WorldState, attacker: NPC, target: NPC) -> Dict[str, i
         attr_mod = str_mod
     prof_level = attacker.skills.get(weapon.skill_tag, "")
     prof_bonus = proficiency_bonus(prof_level)
-    d20 = roll_dice("1d20")
+    d20 = roll_dice("1d20", rng)
     to_hit = d20 + attr_mod + prof_bonus
     target_ac = compute_ac(world, target)
     hit = to_hit >= target_ac
     critical = d20 == 20
     damage = 0
     if hit:
-        damage = roll_dice(weapon.damage_dice)
+        damage = roll_dice(weapon.damage_dice, rng)
         if critical:
-            damage += roll_dice(weapon.damage_dice)
+            damage += roll_dice(weapon.damage_dice, rng)
         damage += attr_mod
     return {
         "hit": hit,
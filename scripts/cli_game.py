@@ -31,6 +31,8 @@ from engine.tools.toggle_starvation import ToggleStarvationTool
 from engine.tools.wait import WaitTool
 from engine.tools.rest import RestTool
 from engine.llm_client import LLMClient
+from engine.command_parser import CommandParser
+from engine.snapshot import load_snapshot
 
 
 SYSTEM_PROMPT = (
@@ -42,17 +44,69 @@ SYSTEM_PROMPT = (
 )
 
 
+def handle_perf(sim: Simulator, args):
+    """perf on|off|reset, perf export <file.json|file.csv>, perf profile <start> <end> [file]."""
+    if args == ["on"]:
+        sim.enable_profiling()
+        print("Profiling enabled.")
+    elif args == ["off"]:
+        sim.disable_profiling()
+        print("Profiling disabled.")
+    elif sim.profiler is None:
+        print("Profiling is off. Use 'perf on' first.")
+    elif not args:
+        print(f"Tick {sim.game_tick}")
+        print(sim.profiler.report())
+    elif args == ["reset"]:
+        sim.profiler.reset()
+    elif args[0] == "export" and len(args) == 2:
+        sim.profiler.export(Path(args[1]))
+        print(f"Wrote {args[1]}")
+    elif args[0] == "profile" and len(args) in {3, 4} and args[1].isdigit() and args[2].isdigit():
+        path = Path(args[3]) if len(args) == 4 else None
+        sim.profiler.profile_ticks(int(args[1]), int(args[2]), path)
+        print(f"Will profile ticks {args[1]}-{args[2]}.")
+    else:
+        print(handle_perf.__doc__)
+
+
+def handle_mem(npc, args):
+    """mem (whole buffer), mem <N> (last N), mem since <tick>."""
+    memory = npc.short_term_memory
+    if not args:
+        entries = list(memory)
+    elif len(args) == 1 and args[0].isdigit():
+        entries = memory.last(int(args[0]))
+    elif len(args) == 2 and args[0] == "since" and args[1].lstrip("-").isdigit():
+        entries = memory.since(int(args[1]))
+    else:
+        print(handle_mem.__doc__)
+        return
+    for entry in entries:
+        print(f"[{entry.tick}] {entry.event_type} by {entry.actor_id} ({entry.sound_level}) {dict(entry.payload)}")
+    print(f"{len(entries)} of {len(memory)} memories (capacity {memory.capacity})")
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--llm", action="store_true", help="Use LLM to parse commands")
+    parser.add_argument("--snapshot", type=Path, help="Start from a binary world snapshot instead of data/")
+    parser.add_argument(
+        "--autosave", type=int, metavar="TICKS", help="Write changed entities back to data/ every TICKS ticks"
+    )
+    parser.add_argument("--seed", type=int, help="Seed the simulator's RNG streams for a reproducible session")
+    parser.add_argument("--journal", type=Path, metavar="DIR", help="Record every event in DIR for replay")
     args = parser.parse_args()
 
-    world = WorldState(Path("data"))
-    world.load()
+    if args.snapshot:
+        world = load_snapshot(args.snapshot, data_dir=Path("data"))
+    else:
+        world = WorldState(Path("data"))
+        world.load()
 
     narrator = Narrator(world)
     actor_id = "npc_sample"  # temporary player actor
-    sim = Simulator(world, narrator=narrator, player_id=actor_id)
+    sim = Simulator(world, narrator=narrator, player_id=actor_id, seed=args.seed)
     sim.register_tool(MoveTool())
     sim.register_tool(LookTool())
     sim.register_tool(GrabTool())
@@ -73,11 +127,16 @@ def main():
     sim.register_tool(ToggleStarvationTool())
     sim.register_tool(WaitTool())
     sim.register_tool(RestTool())
+    if args.autosave:
+        sim.enable_autosave(args.autosave)
+    if args.journal:
+        sim.enable_journal(args.journal)
+    command_parser = CommandParser(sim.tools)
     if args.llm:
         llm = LLMClient(Path("config/llm.json"))
         print("Type text commands. Say 'quit' to exit.")
     else:
-        print("Type 'look', 'move <loc>', 'grab <item>', 'drop <item>', 'attack <npc>', 'talk <msg>' or 'talk <target> <msg>', 'shout <msg>', 'scream <msg>', 'inventory', 'stats', 'equip <item> <slot>', 'unequip <slot>', 'analyze <item>', 'eat <item>', 'give <item> <npc>', 'open <loc>', 'close <loc>', 'starvation <on/off>', 'mem' to review memories, or 'quit'.")
+        print("Type 'look', 'move <loc>', 'grab <item>', 'drop <item>', 'attack <npc>', 'talk <msg>' or 'talk <target> <msg>', 'shout <msg>', 'scream <msg>', 'inventory', 'stats', 'equip <item> <slot>', 'unequip <slot>', 'analyze <item>', 'eat <item>', 'give <item> <npc>', 'open <loc>', 'close <loc>', 'starvation <on/off>', 'mem [N | since <tick>]' to review memories, 'perf' for timings, 'save' to write changes to data/, or 'quit'.")
         print("Use 'wait [ticks]' to pass time or 'rest [ticks]' to recover HP.")
 
     while True:
@@ -87,136 +146,45 @@ def main():
         if cmd in {"quit", "exit"}:
             break
 
-        if args.llm:
-            command = llm.parse_command(cmd, SYSTEM_PROMPT)
+        if cmd == "mem" or cmd.startswith("mem "):
+            handle_mem(world.get_npc(actor_id), cmd.split()[1:])
+            continue
+
+        if cmd == "save":
+            print(f"Saved {world.save()} changed files.")
+            continue
+
+        if cmd == "perf" or cmd.startswith("perf "):
+            handle_perf(sim, cmd.split()[1:])
+            continue
+
+        # Commands the local grammar understands never reach the LLM
+        command = command_parser.parse(cmd, world, world.get_npc(actor_id))
+        if command is None:
+            if not args.llm:
+                print("Unknown command")
+                continue
+            command = llm.parse_command(cmd, SYSTEM_PROMPT, sim.tools)
             if not command:
                 print("Failed to parse command")
                 continue
-        else:
-            if cmd == "look":
-                command = {"tool": "look", "params": {}}
-            elif cmd.startswith("move "):
-                target = cmd.split(" ", 1)[1]
-                command = {"tool": "move", "params": {"target_location": target}}
-            elif cmd.startswith("grab "):
-                item = cmd.split(" ", 1)[1]
-                command = {"tool": "grab", "params": {"item_id": item}}
-            elif cmd.startswith("drop "):
-                item = cmd.split(" ", 1)[1]
-                command = {"tool": "drop", "params": {"item_id": item}}
-            elif cmd.startswith("attack "):
-                target = cmd.split(" ", 1)[1]
-                command = {"tool": "attack", "params": {"target_id": target}}
-            elif cmd.startswith("talk "):
-                parts = cmd.split(" ", 2)
-                if len(parts) == 2:
-                    content = parts[1]
-                    command = {"tool": "talk", "params": {"content": content}}
-                elif len(parts) == 3:
-                    if parts[1] in world.npcs:
-                        target = parts[1]
-                        content = parts[2]
-                        command = {
-                            "tool": "talk",
-                            "params": {"target_id": target, "content": content},
-                        }
-                    else:
-                        content = f"{parts[1]} {parts[2]}"
-                        command = {"tool": "talk", "params": {"content": content}}
-                else:
-                    print("Unknown command")
-                    continue
-            elif cmd.startswith("scream "):
-                content = cmd.split(" ", 1)[1]
-                command = {"tool": "scream", "params": {"content": content}}
-            elif cmd.startswith("shout "):
-                content = cmd.split(" ", 1)[1]
-                command = {"tool": "talk_loud", "params": {"content": content}}
-            elif cmd in {"inventory", "inv"}:
-                command = {"tool": "inventory", "params": {}}
-            elif cmd == "stats":
-                command = {"tool": "stats", "params": {}}
-            elif cmd.startswith("analyze "):
-                item = cmd.split(" ", 1)[1]
-                command = {"tool": "analyze", "params": {"item_id": item}}
-            elif cmd.startswith("eat "):
-                item = cmd.split(" ", 1)[1]
-                command = {"tool": "eat", "params": {"item_id": item}}
-            elif cmd.startswith("give "):
-                parts = cmd.split()
-                if len(parts) == 3:
-                    item, target = parts[1], parts[2]
-                    command = {"tool": "give", "params": {"item_id": item, "target_id": target}}
-                else:
-                    print("Usage: give <item_id> <npc_id>")
-                    continue
-            elif cmd.startswith("open "):
-                target = cmd.split(" ", 1)[1]
-                command = {"tool": "open", "params": {"target_location": target}}
-            elif cmd.startswith("close "):
-                target = cmd.split(" ", 1)[1]
-                command = {"tool": "close", "params": {"target_location": target}}
-            elif cmd.startswith("equip "):
-                parts = cmd.split()
-                if len(parts) == 3:
-                    item, slot = parts[1], parts[2]
-                    command = {"tool": "equip", "params": {"item_id": item, "slot": slot}}
-                else:
-                    print("Usage: equip <item_id> <slot>")
-                    continue
-            elif cmd.startswith("unequip "):
-                parts = cmd.split()
-                if len(parts) == 2:
-                    slot = parts[1]
-                    command = {"tool": "unequip", "params": {"slot": slot}}
-                else:
-                    print("Usage: unequip <slot>")
-                    continue
-            elif cmd.startswith("starvation "):
-                arg = cmd.split(" ", 1)[1].lower()
-                if arg in {"on", "off"}:
-                    enabled = arg == "on"
-                    command = {"tool": "toggle_starvation", "params": {"enabled": enabled}}
-                else:
-                    print("Usage: starvation on|off")
-                    continue
-            elif cmd.startswith("wait"):
-                parts = cmd.split()
-                ticks = 1
-                if len(parts) == 2 and parts[1].isdigit():
-                    ticks = int(parts[1])
-                elif len(parts) > 2 or (len(parts) == 2 and not parts[1].isdigit()):
-                    print("Usage: wait [ticks]")
-                    continue
-                command = {"tool": "wait", "params": {"ticks": ticks}}
-            elif cmd.startswith("rest"):
-                parts = cmd.split()
-                ticks = 1
-                if len(parts) == 2 and parts[1].isdigit():
-                    ticks = int(parts[1])
-                elif len(parts) > 2 or (len(parts) == 2 and not parts[1].isdigit()):
-                    print("Usage: rest [ticks]")
-                    continue
-                command = {"tool": "rest", "params": {"ticks": ticks}}
-            elif cmd == "mem":
-                npc = world.get_npc(actor_id)
-                for mem in npc.short_term_memory:
-                    print(mem)
-                continue
-            else:
-                print("Unknown command")
-                continue
         try:
             sim.process_command(actor_id, command)
         except ValueError as e:
             print("Error:", e)
             continue
-        # Process events until queue is empty
-        while sim.event_queue:
-            sim.tick()
-        # Advance time until actor is ready again
-        while sim.world.get_npc(actor_id).next_available_tick > sim.game_tick:
-            sim.tick()
+        # Process pending events and skip ahead until the actor is ready again
+        sim.run_until_ready(actor_id)
+
+    if args.autosave:
+        world.save()
+    world.close()
+    sim.disable_journal()
+    if args.llm:
+        print(f"Local parser handled {command_parser.local_fraction:.0%} of commands without the LLM")
+        stats = llm.cache_for(SYSTEM_PROMPT, sim.tools).stats()
+        print(f"LLM cache: {stats['memory_hits'] + stats['disk_hits']} hits, {stats['misses']} misses")
+        llm.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,35 @@
+import sys
+import os
+import argparse
+from pathlib import Path
+
+# Allow running from repository root
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from engine.world_state import WorldState
+from engine.snapshot import save_snapshot, load_snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert between the JSON data/ layout and a binary world snapshot."
+    )
+    parser.add_argument("source", type=Path, help="A data directory or a snapshot file")
+    parser.add_argument("target", type=Path, help="Snapshot file to write, or directory when source is a snapshot")
+    args = parser.parse_args()
+
+    if args.source.is_dir():
+        world = WorldState(args.source)
+        world.load()
+        save_snapshot(world, args.target)
+    else:
+        world = load_snapshot(args.source)
+        world.write_json(args.target)
+    print(
+        f"Wrote {args.target}: {len(world.npcs)} NPCs, {len(world.locations_state)} locations, "
+        f"{len(world.item_instances)} items"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Local stand-in for an OpenAI-compatible chat endpoint.
+
+Point ``config/llm.json`` at ``http://localhost:<port>/v1/chat/completions``
+to exercise ``LLMClient`` (connection reuse, concurrency, retries) without a
+model. Replies map the first word of the user message to a tool command.
+With ``--port 0`` the server picks a free port; the first line it prints
+names the address it listens on.
+"""
+import sys
+import os
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Allow running from repository root
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+
+def fake_command(text: str) -> dict:
+    words = text.split()
+    if not words:
+        return {}
+    verb, rest = words[0].lower(), words[1:]
+    if verb in {"look", "inventory", "stats"}:
+        return {"tool": verb, "params": {}}
+    if verb in {"wait", "rest"} and rest and rest[0].isdigit():
+        return {"tool": verb, "params": {"ticks": int(rest[0])}}
+    return {"tool": "talk", "params": {"content": text}}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    delay = 0.0
+    fail_rate = 0.0
+    # Requests still to be failed by --fail-first, shared by the handler threads
+    fail_first = 0
+    fail_lock = threading.Lock()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        if self.delay:
+            time.sleep(self.delay)
+        with self.fail_lock:
+            fail = StubHandler.fail_first > 0
+            if fail:
+                StubHandler.fail_first -= 1
+        if fail or random.random() < self.fail_rate:
+            self._send(503, {"error": "stub overloaded"})
+            return
+        user_text = ""
+        for message in request.get("messages", []):
+            if message.get("role") == "user":
+                user_text = message.get("content", "")
+        content = json.dumps(fake_command(user_text))
+        self._send(200, {"choices": [{"message": {"role": "assistant", "content": content}}]})
+
+    def _send(self, status: int, body: dict):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=1234)
+    parser.add_argument("--delay", type=float, default=0.0, help="Seconds to sleep per request")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--fail-first", type=int, default=0, help="Answer the first N requests with 503")
+    args = parser.parse_args()
+    StubHandler.delay = args.delay
+    StubHandler.fail_rate = args.fail_rate
+    StubHandler.fail_first = args.fail_first
+    server = ThreadingHTTPServer(("localhost", args.port), StubHandler)
+    port = server.server_address[1]
+    print(f"Stub LLM listening on http://localhost:{port}/v1/chat/completions", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+from engine.world_state import WorldState
+
+SHIPPED_DATA = Path(__file__).resolve().parent.parent / "data"
+
+
+@pytest.fixture
+def data_dir(tmp_path) -> Path:
+    """A writable copy of the shipped ``data/`` directory."""
+    target = tmp_path / "data"
+    shutil.copytree(SHIPPED_DATA, target)
+    return target
+
+
+@pytest.fixture
+def world(data_dir) -> WorldState:
+    world = WorldState(data_dir)
+    world.load()
+    return world
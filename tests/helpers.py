@@ -0,0 +1,9 @@
+from engine.data_models import to_dict
+from engine.world_state import WorldState
+
+SECTIONS = ("npcs", "locations_static", "locations_state", "item_blueprints", "item_instances")
+
+
+def world_dump(world: WorldState) -> dict:
+    """Plain copy of everything ``load`` reads, for comparing two worlds."""
+    return {section: {key: to_dict(value) for key, value in getattr(world, section).items()} for section in SECTIONS}
@@ -0,0 +1,86 @@
+import pytest
+
+from engine import tools
+from engine.command_parser import CommandParser
+from engine.tools.close_door import CloseDoorTool
+from engine.tools.open_door import OpenDoorTool
+
+
+def tool_table():
+    every = [getattr(tools, name)() for name in tools.__all__] + [OpenDoorTool(), CloseDoorTool()]
+    return {tool.name: tool for tool in every}
+
+
+@pytest.fixture
+def parse(world):
+    parser = CommandParser(tool_table())
+    actor = world.get_npc("npc_sample")
+    # An item the player can refer to by name
+    actor.inventory.append("item_apple_1")
+    return lambda text: parser.parse(text, world, actor)
+
+
+@pytest.mark.parametrize(
+    "text, command",
+    [
+        ("look", ("look", {})),
+        ("move market_square", ("move", {"target_location": "market_square"})),
+        ("go east", ("move", {"target_location": "market_square"})),
+        ("Go  Market Square", ("move", {"target_location": "market_square"})),
+        ("grab item_rusty_sword_1", ("grab", {"item_id": "item_rusty_sword_1"})),
+        ("take item_rusty_sword_1", ("grab", {"item_id": "item_rusty_sword_1"})),
+        ("pick up item_rusty_sword_1", ("grab", {"item_id": "item_rusty_sword_1"})),
+        ("drop apple", ("drop", {"item_id": "item_apple_1"})),
+        ("eat Apple", ("eat", {"item_id": "item_apple_1"})),
+        ("analyze item_apple_1", ("analyze", {"item_id": "item_apple_1"})),
+        ("attack angry peasant", ("attack", {"target_id": "npc_enemy"})),
+        ("attack npc_enemy", ("attack", {"target_id": "npc_enemy"})),
+        ("talk hello there", ("talk", {"content": "hello there"})),
+        ("say angry peasant calm down", ("talk", {"target_id": "npc_enemy", "content": "calm down"})),
+        ("talk_loud over here", ("talk_loud", {"content": "over here"})),
+        ("shout over here", ("talk_loud", {"content": "over here"})),
+        ("scream help", ("scream", {"content": "help"})),
+        ("inventory", ("inventory", {})),
+        ("inv", ("inventory", {})),
+        ("stats", ("stats", {})),
+        ("equip apple main hand", ("equip", {"item_id": "item_apple_1", "slot": "main_hand"})),
+        ("unequip torso", ("unequip", {"slot": "torso"})),
+        ("give apple angry peasant", ("give", {"item_id": "item_apple_1", "target_id": "npc_enemy"})),
+        ("open east", ("open", {"target_location": "market_square"})),
+        ("close market_square", ("close", {"target_location": "market_square"})),
+        ("toggle_starvation off", ("toggle_starvation", {"enabled": False})),
+        ("starvation on", ("toggle_starvation", {"enabled": True})),
+        ("wait", ("wait", {"ticks": 1})),
+        ("wait 5", ("wait", {"ticks": 5})),
+        ("rest 12", ("rest", {"ticks": 12})),
+    ],
+)
+def test_parses_every_tool_form(parse, text, command):
+    tool, params = command
+    assert parse(text) == {"tool": tool, "params": params}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "dance wildly",
+        "look around",
+        "move north",
+        "attack nobody",
+        "grab sword",
+        "wait a bit",
+        "unequip tail",
+        "toggle_starvation maybe",
+        "talk",
+    ],
+)
+def test_leaves_unknown_input_to_the_llm(parse, text):
+    assert parse(text) is None
+
+
+def test_counts_local_fraction(world):
+    parser = CommandParser(tool_table())
+    actor = world.get_npc("npc_sample")
+    parser.parse("look", world, actor)
+    parser.parse("sing a song", world, actor)
+    assert parser.local_fraction == 0.5
@@ -0,0 +1,29 @@
+import pytest
+
+from engine.compact import OrderedSet
+from engine.data_models import ConnectionState, LocationState, to_dict
+
+
+@pytest.mark.parametrize("size", [0, 3, OrderedSet.SMALL, OrderedSet.SMALL + 5])
+def test_ordered_set_keeps_list_semantics(size):
+    ids = [f"id_{i}" for i in range(size)]
+    items = OrderedSet(ids + ids[:2])
+    assert items == ids and len(items) == size
+    items.append("new")
+    items.append(ids[0] if ids else "new")
+    assert list(items) == ids + ["new"]
+    if ids:
+        items.remove(ids[0])
+        assert items[0] == (ids[1] if size > 1 else "new")
+    with pytest.raises(ValueError):
+        items.remove("missing")
+    items.discard("missing")
+    assert list(reversed(items))[0] == "new"
+    items.clear()
+    assert not items and "new" not in items
+
+
+def test_connection_states_are_compact_and_serialise_as_dicts():
+    loc = LocationState(id="a", connections_state={"b": {"status": "closed"}})
+    assert type(loc.connections_state["b"]) is ConnectionState
+    assert to_dict(loc)["connections_state"] == {"b": {"status": "closed"}}
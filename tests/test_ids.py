@@ -0,0 +1,36 @@
+from benchmarks.worldgen import default_tools
+from engine.simulator import Simulator
+
+
+def typed(entity_id):
+    """An equal string that is not the loaded object, as input parsing would produce."""
+    return "".join(list(entity_id))
+
+
+def test_intern_keeps_one_string_per_id(world):
+    registry = world.npc_registry
+    assert registry.intern(typed("npc_enemy")) is registry.canonical("npc_enemy")
+    new_id = typed("npc_newcomer")
+    assert registry.intern(new_id) is registry.intern(typed("npc_newcomer"))
+    assert registry.canonical(typed("npc_nobody")) == "npc_nobody"
+
+
+def test_commands_carry_the_registry_strings(world):
+    sim = Simulator(world, player_id="npc_sample", output=None, seed=0)
+    for tool in default_tools():
+        sim.register_tool(tool)
+    target = typed("npc_enemy")
+    assert target is not world.npc_registry.canonical("npc_enemy")
+    sim.process_command("npc_sample", {"tool": "attack", "params": {"target_id": target}})
+    sim.process_command("npc_enemy", {"tool": "open", "params": {"target_location": typed("market_square")}})
+    events = {event.event_type: event for _, event in sim.event_queue.pending()}
+    attack, door = events["attack_attempt"], events["open_connection"]
+    assert attack.target_ids[0] is world.npc_registry.canonical("npc_enemy")
+    assert door.target_ids[0] is world.location_registry.canonical("market_square")
+
+
+def test_ids_are_only_looked_up_in_their_own_registry(world):
+    npc_id = typed("npc_enemy")
+    assert world.canonical_id("npc", npc_id) is world.npc_registry.canonical("npc_enemy")
+    assert world.canonical_id("location", npc_id) is npc_id
+    assert world.canonical_id("text", npc_id) is npc_id
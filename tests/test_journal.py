@@ -0,0 +1,72 @@
+import pytest
+
+from benchmarks.worldgen import default_tools, generate_world
+from engine.journal import Replayer
+from engine.simulator import Simulator
+
+from tests.helpers import world_dump
+
+
+def register_tools(sim):
+    for tool in default_tools():
+        sim.register_tool(tool)
+
+
+def new_simulator(seed=5):
+    world = generate_world(30, 24, 40, seed=seed)
+    sim = Simulator(world, output=None, seed=seed, player_id="npc_0")
+    register_tools(sim)
+    return sim
+
+
+def run(sim, ticks):
+    for _ in range(ticks):
+        sim.tick()
+        # Commands entered between ticks, with actions still pending afterwards
+        if sim.game_tick % 7 == 0 and sim.world.get_npc("npc_0").next_available_tick <= sim.game_tick:
+            tool = "rest" if sim.game_tick % 14 else "wait"
+            sim.process_command("npc_0", {"tool": tool, "params": {"ticks": 9}})
+
+
+def state(sim):
+    return (
+        world_dump(sim.world),
+        [(handle, event) for handle, event in sim.event_queue.pending()],
+        sim.hunger_events,
+        sim.rng.getstate(),
+        sim.events_handled,
+    )
+
+
+@pytest.fixture
+def journalled(tmp_path):
+    sim = new_simulator()
+    sim.enable_journal(tmp_path, snapshot_interval=25, rng_interval=10)
+    run(sim, 60)
+    sim.disable_journal()
+    return sim, Replayer(tmp_path, setup=register_tools)
+
+
+def test_world_at_matches_live_run(tmp_path):
+    sim = new_simulator()
+    sim.enable_journal(tmp_path, snapshot_interval=20)
+    dumps = {}
+    for tick in (13, 20, 47):
+        run(sim, tick - sim.game_tick)
+        dumps[tick] = world_dump(sim.world)
+    sim.disable_journal()
+    replayer = Replayer(tmp_path, setup=register_tools)
+    for tick, expected in dumps.items():
+        assert world_dump(replayer.world_at(tick)) == expected
+
+
+@pytest.mark.parametrize("crash_tick", [25, 33, 56, 60])
+def test_recovered_simulator_carries_on_like_the_live_one(journalled, crash_tick):
+    _, replayer = journalled
+    live = new_simulator()
+    run(live, crash_tick)
+    recovered = replayer.simulator_at(crash_tick)
+    assert state(recovered) == state(live)
+    run(live, 40)
+    run(recovered, 40)
+    assert state(recovered) == state(live)
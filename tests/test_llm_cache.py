@@ -0,0 +1,47 @@
+import json
+
+from engine.llm_cache import MARKER, ResponseCache, tool_schemas
+from engine.llm_client import LLMClient
+from engine.tools.rest import RestTool
+from engine.tools.talk import TalkTool
+
+
+def test_only_own_namespaces_are_pruned(tmp_path):
+    foreign = tmp_path / "0123456789abcdef"
+    foreign.mkdir()
+    (foreign / "keep.json").write_text("{}")
+    old = ResponseCache("model", "old prompt", cache_dir=tmp_path)
+    old.put("look", {"action": "look"})
+    new = ResponseCache("model", "new prompt", cache_dir=tmp_path)
+    assert not old.directory.exists()
+    assert (new.directory / MARKER).is_file()
+    assert (foreign / "keep.json").is_file()
+
+
+def test_memory_tier_without_cache_dir(tmp_path):
+    config = tmp_path / "llm.json"
+    config.write_text(json.dumps({"endpoint": "http://localhost:1/v1", "model": "model"}))
+    client = LLMClient(config)
+    cache = client.cache_for("prompt")
+    assert cache.directory is None
+    cache.put("Go   North", {"action": "move"})
+    assert cache.get("go North") == {"action": "move"}
+    assert cache.stats()["memory_hits"] == 1
+
+
+def test_only_whitespace_and_the_verb_are_normalized():
+    cache = ResponseCache("model", "prompt")
+    cache.put("say Hello", {"tool": "talk", "params": {"content": "Hello"}})
+    assert cache.get("SAY   Hello ") == {"tool": "talk", "params": {"content": "Hello"}}
+    # Free text keeps its case, so a shout is not answered with the quiet reply
+    assert cache.get("say HELLO") is None
+
+
+def test_tool_schemas_are_part_of_the_namespace():
+    talk = {"talk": TalkTool()}
+    more = {"talk": TalkTool(), "rest": RestTool()}
+    assert tool_schemas(talk) == tool_schemas({"talk": TalkTool()})
+    assert tool_schemas(talk) != tool_schemas(more)
+    first = ResponseCache("model", "prompt", tool_schemas(talk))
+    assert first.namespace != ResponseCache("model", "prompt", tool_schemas(more)).namespace
+    assert first.namespace != ResponseCache("model", "prompt").namespace
@@ -0,0 +1,102 @@
+import json
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from engine.llm_client import LLMClient, LLMError
+
+STUB = Path(__file__).resolve().parent.parent / "scripts" / "llm_stub_server.py"
+
+
+@pytest.fixture
+def stub():
+    """Start scripts/llm_stub_server.py with extra arguments; returns its endpoint."""
+    servers = []
+
+    def start(*args: str) -> str:
+        server = subprocess.Popen(
+            [sys.executable, str(STUB), "--port", "0", *args],
+            stdout=subprocess.PIPE,
+            # Requests abandoned by a client timeout make the server log broken pipes
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        servers.append(server)
+        return re.search(r"http://\S+", server.stdout.readline()).group(0)
+
+    yield start
+    for server in servers:
+        server.terminate()
+        server.wait()
+        server.stdout.close()
+
+
+def new_client(tmp_path, endpoint, **settings) -> LLMClient:
+    config = tmp_path / "llm.json"
+    config.write_text(json.dumps({"endpoint": endpoint, "model": "stub", "timeout": 5, **settings}))
+    return LLMClient(config)
+
+
+def ask(text: str):
+    return [{"role": "user", "content": text}]
+
+
+def test_requests_reuse_one_keep_alive_connection(tmp_path, stub):
+    with new_client(tmp_path, stub()) as client:
+        assert json.loads(client.chat(ask("look"))) == {"tool": "look", "params": {}}
+        conn = client.pool._idle.queue[-1]
+        sock = conn.sock
+        assert sock is not None
+        assert json.loads(client.chat(ask("stats"))) == {"tool": "stats", "params": {}}
+        # Same pooled connection and the same socket: no reconnect in between
+        assert client.pool._idle.queue == [conn] and conn.sock is sock
+
+
+def test_chat_many_runs_concurrently_and_keeps_order(tmp_path, stub):
+    delay = 0.3
+    with new_client(tmp_path, stub("--delay", str(delay)), max_concurrency=4) as client:
+        start = time.perf_counter()
+        replies = client.chat_many([ask(f"wait {ticks}") for ticks in range(1, 5)])
+        elapsed = time.perf_counter() - start
+    assert [json.loads(reply)["params"]["ticks"] for reply in replies] == [1, 2, 3, 4]
+    assert elapsed < 2 * delay
+
+
+def test_5xx_replies_are_retried_with_backoff(tmp_path, stub):
+    with new_client(tmp_path, stub("--fail-first", "2"), max_retries=2, retry_backoff=0.1) as client:
+        start = time.perf_counter()
+        assert json.loads(client.chat(ask("inventory"))) == {"tool": "inventory", "params": {}}
+        # Two failures wait 0.1 and then 0.2 seconds before the third attempt
+        assert time.perf_counter() - start >= 0.3
+
+
+def test_gives_up_once_retries_run_out(tmp_path, stub):
+    with new_client(tmp_path, stub("--fail-first", "3"), max_retries=1, retry_backoff=0) as client:
+        with pytest.raises(LLMError, match="after 2 attempts"):
+            client.chat(ask("look"))
+        # The stub's last failure is retried away
+        assert json.loads(client.chat(ask("look"))) == {"tool": "look", "params": {}}
+
+
+def test_per_request_timeout_overrides_the_configured_one(tmp_path, stub):
+    with new_client(tmp_path, stub("--delay", "0.5"), max_retries=0) as client:
+        start = time.perf_counter()
+        with pytest.raises(LLMError):
+            client.chat(ask("look"), timeout=0.05)
+        assert time.perf_counter() - start < 0.5
+
+
+def test_caches_are_kept_per_system_prompt(tmp_path):
+    client = new_client(tmp_path, "http://localhost:1/v1", cache_dir=str(tmp_path / "cache"))
+    first = client.cache_for("first prompt")
+    first.put("look", {"tool": "look", "params": {}})
+    second = client.cache_for("second prompt")
+    assert client.cache_for("first prompt") is first
+    assert client.cache_for("second prompt") is second
+    # The second prompt's cache does not prune the first one's namespace
+    assert first.directory.is_dir()
+    assert first.get("look") == {"tool": "look", "params": {}}
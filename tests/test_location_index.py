@@ -0,0 +1,32 @@
+from engine.events import Event
+
+
+def test_load_builds_the_index(world):
+    assert world.check_location_index() == []
+    assert world.find_npc_location("npc_sample") == "town_square"
+    assert world.find_npc_location("npc_enemy") == "town_square"
+    assert world.find_npc_location("npc_nobody") is None
+
+
+def test_move_and_death_keep_occupants_and_index_in_step(world):
+    world.apply_event(Event(event_type="move", tick=1, actor_id="npc_sample", target_ids=["market_square"]))
+    assert world.find_npc_location("npc_sample") == "market_square"
+    assert "npc_sample" in world.get_location_state("market_square").occupants
+    assert "npc_sample" not in world.get_location_state("town_square").occupants
+    assert world.check_location_index() == []
+
+    world.apply_event(Event(event_type="npc_died", tick=2, actor_id="npc_enemy"))
+    assert world.find_npc_location("npc_enemy") is None
+    assert "npc_enemy" not in world.get_location_state("town_square").occupants
+    assert world.check_location_index() == []
+
+
+def test_rebuild_repairs_an_index_that_drifted(world):
+    # Occupants edited behind the index's back, as a hand-written loader might
+    world.get_location_state("town_square").occupants.remove("npc_sample")
+    world.get_location_state("market_square").occupants.append("npc_sample")
+    assert world.check_location_index() == ["npc_sample is in market_square but indexed at town_square"]
+
+    world.rebuild_location_index()
+    assert world.check_location_index() == []
+    assert world.find_npc_location("npc_sample") == "market_square"
@@ -0,0 +1,70 @@
+import copy
+import pickle
+
+import pytest
+
+from engine.events import Event
+from engine.memory import Perception, ShortTermMemory
+from engine.simulator import Simulator
+
+
+def perception(tick):
+    return Perception(tick, "talk", "npc_sample")
+
+
+def perceptions(*ticks):
+    return [perception(tick) for tick in ticks]
+
+
+def ticks(entries):
+    return [entry.tick for entry in entries]
+
+
+def test_ring_buffer_wraps_around_oldest_first():
+    memory = ShortTermMemory(capacity=3)
+    for entry in perceptions(1, 2, 3, 4, 5):
+        memory.append(entry)
+    assert ticks(memory) == [3, 4, 5] and len(memory) == 3
+    assert (memory[0].tick, memory[-1].tick) == (3, 5)
+    with pytest.raises(IndexError):
+        memory[3]
+    assert ticks(memory.last(2)) == [4, 5] and ticks(memory.last(10)) == [3, 4, 5]
+    assert ticks(memory.since(4)) == [4, 5] and memory.since(6) == []
+    # Constructing from more entries than fit keeps the newest
+    assert ticks(ShortTermMemory(perceptions(1, 2, 3, 4), capacity=2)) == [3, 4]
+
+
+def test_resize_keeps_the_newest_entries_in_order():
+    memory = ShortTermMemory(perceptions(1, 2, 3), capacity=3)
+    memory.append(perception(4))
+    memory.resize(2)
+    assert ticks(memory) == [3, 4] and memory.capacity == 2
+    memory.resize(4)
+    memory.append(perception(5))
+    memory.append(perception(6))
+    memory.append(perception(7))
+    assert ticks(memory) == [4, 5, 6, 7]
+    memory.resize(0)
+    memory.append(perception(8))
+    assert len(memory) == 0
+
+
+def test_copies_keep_order_and_capacity():
+    memory = ShortTermMemory(perceptions(1, 2, 3), capacity=3)
+    memory.append(perception(4))
+    for copied in (copy.deepcopy(memory), pickle.loads(pickle.dumps(memory))):
+        assert copied == memory and copied.capacity == 3
+        copied.append(perception(5))
+        assert ticks(copied) == [3, 4, 5] and ticks(memory) == [2, 3, 4]
+
+
+def test_changing_an_event_payload_does_not_reach_memories(world):
+    sim = Simulator(world, player_id="npc_sample", output=None)
+    event = Event("talk", 0, "npc_sample", payload={"content": "hi", "mood": {"tone": "calm"}})
+    sim.handle_event(event)
+    event.payload["content"] = "bye"
+    event.payload["mood"]["tone"] = "angry"
+    (entry,) = world.get_npc("npc_enemy").short_term_memory.last(1)
+    assert entry.payload == {"content": "hi", "mood": {"tone": "calm"}}
+    with pytest.raises(TypeError):
+        entry.payload["content"] = "bye"
@@ -0,0 +1,87 @@
+import pytest
+
+from benchmarks.worldgen import generate_memories
+from engine.memory_index import MemoryIndex
+from engine.memory_vectors import MemoryVectors, np
+
+MEMORIES = [
+    {"text": "Bought bread from the baker at the market", "tick": 10, "priority": "normal"},
+    {"text": "The blacksmith sharpened my sword", "tick": 20, "priority": "normal"},
+    {"text": "A dragon was seen flying over the northern hills", "tick": 30, "priority": "high"},
+    {"text": "The baker's daughter sang in the market square", "tick": 900, "priority": "low"},
+    {"text": "Dragons hoard gold in mountain caves", "tick": 40, "priority": "normal"},
+]
+BACKENDS = [False, True] if np is not None else [False]
+
+
+def positions(ranked):
+    return [position for _, position in ranked]
+
+
+def test_bm25_ranks_matching_memories():
+    index = MemoryIndex.build(MEMORIES)
+    assert positions(index.search(MEMORIES, "blacksmith sword")) == [1]
+    # Both mention the baker and the market; the shorter memory about bread wins
+    assert positions(index.search(MEMORIES, "baker market", n=2)) == [0, 3]
+    assert index.search(MEMORIES, "unrelated words") == []
+
+
+def test_recency_and_priority_reorder_ties():
+    memories = [
+        {"text": "saw a wolf", "tick": 0, "priority": "low"},
+        {"text": "saw a wolf", "tick": 0, "priority": "core"},
+        {"text": "saw a wolf", "tick": 1000, "priority": "low"},
+    ]
+    index = MemoryIndex.build(memories)
+    assert positions(index.search(memories, "wolf")) == [1, 0, 2]
+    assert positions(index.search(memories, "wolf", now=1000, priority_weight=0)) == [2, 0, 1]
+
+
+def test_index_follows_removals_and_round_trips():
+    memories = list(MEMORIES)
+    index = MemoryIndex.build(memories)
+    del memories[1]
+    index.remove([1], memories)
+    assert index.matches(memories)
+    assert positions(index.search(memories, "dragon", n=1)) == [1]
+    loaded = MemoryIndex.from_dict(index.to_dict())
+    assert loaded.matches(memories)
+    assert loaded.search(memories, "baker market") == index.search(memories, "baker market")
+    # Checksummed only until verified, so check a stale list on a fresh load
+    assert not MemoryIndex.from_dict(index.to_dict()).matches(MEMORIES[:4])
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_vectors_rank_related_wordings_first(use_numpy):
+    bank = MemoryVectors.build(MEMORIES, use_numpy=use_numpy)
+    # "dragons" shares most of its trigrams with "dragon"
+    assert set(positions(bank.search("dragons", n=2))) == {2, 4}
+    assert positions(bank.search("the blacksmith sharpened my sword", n=1)) == [1]
+    scores = [score for score, _ in bank.search("baker", n=5)]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_vector_backends_agree(tmp_path):
+    memories = generate_memories(300, seed=2)
+    python = MemoryVectors.build(memories, use_numpy=False)
+    path = tmp_path / "bank.npy"
+    path.write_bytes(python.to_npy())
+    for use_numpy in BACKENDS:
+        for use_mmap in (False, True):
+            bank = MemoryVectors.open(path, python.meta(), use_mmap=use_mmap, use_numpy=use_numpy)
+            assert bank.matches(memories)
+            for query in ("word1 word2 word3", "word40 word7"):
+                expected = python.search(query, 5)
+                ranked = bank.search(query, 5)
+                assert positions(ranked) == positions(expected)
+                assert [score for score, _ in ranked] == pytest.approx([score for score, _ in expected], abs=1e-5)
+            del bank
+
+
+def test_vectors_follow_removals():
+    memories = list(MEMORIES)
+    bank = MemoryVectors.build(memories, use_numpy=False)
+    del memories[2]
+    bank.remove([2], memories)
+    assert len(bank) == 4 and bank.matches(memories)
+    assert positions(bank.search("dragons", n=1)) == [3]
@@ -0,0 +1,75 @@
+import pytest
+
+from benchmarks.worldgen import generate_world, write_world
+from engine.events import Event
+from engine.world_state import WorldState
+
+from tests.helpers import world_dump
+
+
+def json_files(directory):
+    return sorted(path.relative_to(directory) for path in directory.rglob("*.json"))
+
+
+def reload(world):
+    reloaded = WorldState(world.data_dir)
+    reloaded.load()
+    return reloaded
+
+
+def test_save_writes_back_to_loaded_files(world, data_dir):
+    # The shipped files are not named after the ids they hold
+    assert world.entity_file("npcs", "npc_sample").name == "sample_npc.json"
+    before = json_files(data_dir)
+    world.add_memory("npc_sample", "The market gate was locked at dawn", tick=3, priority="high")
+    world.apply_event(Event("move", 4, "npc_enemy", ["market_square"]))
+    assert world.save() == 4
+    assert json_files(data_dir) == before
+
+    reloaded = reload(world)
+    assert reloaded.get_npc("npc_sample").memories == world.get_npc("npc_sample").memories
+    assert reloaded.find_npc_location("npc_enemy") == "market_square"
+    assert world_dump(reloaded) == world_dump(world)
+
+
+def test_save_deletes_eaten_items(world, data_dir):
+    world.apply_event(Event("move", 1, "npc_sample", ["market_square"]))
+    world.apply_event(Event("grab", 2, "npc_sample", ["item_apple_1"]))
+    world.apply_event(Event("eat", 3, "npc_sample", ["item_apple_1"]))
+    world.save()
+    assert not (data_dir / "items" / "instances" / "item_apple_1.json").exists()
+    reloaded = reload(world)
+    assert "item_apple_1" not in reloaded.item_instances
+    assert reloaded.get_npc("npc_sample").last_meal_tick == 3
+    assert world_dump(reloaded) == world_dump(world)
+
+
+def test_background_save_matches_foreground(world):
+    world.add_memory("npc_enemy", "Lost a fight in the town square", tick=7)
+    world.save(background=True)
+    world.flush_saves()
+    world.close()
+    assert world_dump(reload(world)) == world_dump(world)
+
+
+def test_write_json_round_trip(world, tmp_path):
+    copy_dir = tmp_path / "copy"
+    world.write_json(copy_dir)
+    # Same file names as the source directory, not names built from ids
+    assert json_files(copy_dir) == json_files(world.data_dir)
+    copy = WorldState(copy_dir)
+    copy.load()
+    assert world_dump(copy) == world_dump(world)
+
+
+@pytest.mark.parametrize("workers, processes", [(1, 0), (4, 0), (0, 2), (3, 2)])
+def test_parallel_load_builds_the_sequential_world(tmp_path, workers, processes):
+    write_world(generate_world(20, 60, 80, seed=4), tmp_path)
+    sequential = WorldState(tmp_path)
+    sequential.load()
+    parallel = WorldState(tmp_path)
+    # Small batches so several are in flight at once
+    parallel.load(workers=workers, processes=processes, batch_size=8)
+    assert world_dump(parallel) == world_dump(sequential)
+    assert parallel.entity_files == sequential.entity_files
+    assert parallel.load_timings.keys() == sequential.load_timings.keys()
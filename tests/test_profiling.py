@@ -0,0 +1,38 @@
+from benchmarks.worldgen import default_tools, generate_world
+from engine.simulator import Simulator
+
+
+def new_simulator():
+    sim = Simulator(generate_world(30, 24, 40, seed=3), output=None, seed=3)
+    for tool in default_tools():
+        sim.register_tool(tool)
+    return sim
+
+
+def test_queue_timing_survives_rebuilt_schedules():
+    sim = new_simulator()
+    profiler = sim.enable_profiling()
+    sim.tick()
+    sim.rebuild_schedules()
+    sim.tick()
+    assert profiler.counts["pop_due_events"] == 2
+    assert profiler.counts["pop_ready_actors"] == 2
+    sim.disable_profiling()
+    assert "pop_due" not in sim.event_queue.__dict__
+
+
+def test_profile_range_skipped_by_advance_until_is_cleared():
+    sim = new_simulator()
+    profiler = sim.enable_profiling()
+    sim.advance_until(100)
+    profiler.profile_ticks(102, 103)
+    # Jump over the range the way advance_until does when nothing is due
+    sim.game_tick = 110
+    sim.tick()
+    assert profiler.profile_range is None and profiler.profile_stats is None
+    profiler.profile_ticks(112, 113)
+    sim.tick()
+    sim.tick()
+    sim.game_tick = 120
+    sim.tick()
+    assert profiler.profile_range is None and profiler.profile_stats is not None
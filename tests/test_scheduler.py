@@ -0,0 +1,68 @@
+from engine.events import Event
+from engine.scheduler import EventScheduler, ReadyQueue
+
+
+def event(tick, actor_id="npc_sample", event_type="wait"):
+    return Event(event_type, tick, actor_id)
+
+
+def test_same_tick_events_pop_in_insertion_order():
+    queue = EventScheduler()
+    first, later, second, third = event(5, "a"), event(9, "b"), event(5, "c"), event(5, "d")
+    queue.extend([first, later, second, third])
+    assert queue.peek_tick() == 5
+    assert queue.pop_due(4) == []
+    assert queue.pop_due(5) == [first, second, third]
+    assert queue.pop_due(100) == [later]
+    assert not queue and queue.peek_tick() is None
+
+
+def test_cancelled_events_are_skipped_when_they_surface():
+    queue = EventScheduler()
+    early = queue.schedule(event(1))
+    kept = event(2)
+    queue.schedule(kept)
+    late = queue.schedule(event(3, "npc_enemy"))
+    assert queue.cancel(early) and not queue.cancel(early)
+    # The cancelled entry stays in the heap until it reaches the top
+    assert len(queue) == 2 and len(queue._heap) == 3
+    assert queue.peek_tick() == 2 and len(queue._heap) == 2
+    assert queue.cancel_actor("npc_enemy", after_tick=3) == 0
+    assert queue.cancel_actor("npc_enemy", after_tick=2) == 1
+    assert not queue.cancel(late)
+    assert queue.pop_due(10) == [kept]
+    assert queue._by_actor == {} and queue._entries == {}
+
+
+def test_restore_rebuilds_the_pending_queue():
+    queue = EventScheduler()
+    handles = [queue.schedule(event(tick, actor_id)) for tick, actor_id in [(4, "a"), (2, "b"), (4, "c"), (7, "a")]]
+    queue.cancel(handles[1])
+    pending = queue.pending()
+    assert [handle for handle, _ in pending] == [handles[0], handles[2], handles[3]]
+
+    restored = EventScheduler.restore(pending, queue.next_handle)
+    assert restored.pending() == pending
+    # Handles keep counting from the original, and old handles still cancel
+    assert restored.schedule(event(4, "d")) == queue.next_handle
+    assert restored.cancel(handles[0]) and restored.cancel_actor("a") == 1
+    assert [e.actor_id for e in restored.pop_due(10)] == ["c", "d"]
+
+
+def test_ready_queue_skips_stale_entries():
+    queue = ReadyQueue()
+    queue.schedule("a", 5)
+    queue.schedule("b", 3)
+    queue.schedule("c", 3)
+    # Rescheduling leaves the old entries behind; only the latest tick counts
+    queue.schedule("a", 8)
+    queue.schedule("b", 3)
+    queue.discard("c")
+    assert len(queue) == 2 and "c" not in queue
+    assert queue.peek_tick() == 3
+    assert queue.pop_ready(5) == ["b"]
+    assert queue.peek_tick() == 8
+    # Same-tick actors come back in the order they were first scheduled
+    queue.schedule("c", 8)
+    assert queue.pop_ready(8) == ["a", "c"]
+    assert queue.peek_tick() is None and not queue._heap
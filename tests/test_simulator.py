@@ -0,0 +1,105 @@
+import pytest
+
+from engine import tools
+from engine.events import Event
+from engine.simulator import Simulator
+from engine.world_state import WorldState
+
+from tests.helpers import world_dump
+
+
+def new_simulator(world, player_id, seed=0):
+    sim = Simulator(world, seed=seed, player_id=player_id)
+    for name in tools.__all__:
+        sim.register_tool(getattr(tools, name)())
+    return sim
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("enemy_busy", [False, True])
+def test_advance_until_matches_ticking(data_dir, seed, enemy_busy):
+    runs = []
+    for skip in (False, True):
+        world = WorldState(data_dir)
+        world.load()
+        if enemy_busy:
+            # Leaves ticks on which nobody acts, so advance_until has something to skip
+            world.get_npc("npc_enemy").next_available_tick = 57
+        sim = new_simulator(world, "npc_sample", seed)
+        sim.process_command("npc_sample", {"tool": "rest", "params": {"ticks": 200}})
+        if skip:
+            sim.advance_until(300)
+        else:
+            for _ in range(300):
+                sim.tick()
+        runs.append((sim.game_tick, world_dump(world), list(sim.event_queue), sim.rng.getstate()))
+    assert runs[0] == runs[1]
+
+
+def lone_npc_world(data_dir):
+    """The shipped world with only npc_sample left in it."""
+    world = WorldState(data_dir)
+    world.load()
+    del world.npcs["npc_enemy"]
+    world.get_location_state("town_square").occupants.remove("npc_enemy")
+    world.rebuild_location_index()
+    return world
+
+
+def test_hunger_and_starvation_timeline(data_dir):
+    world = lone_npc_world(data_dir)
+    npc = world.get_npc("npc_sample")
+    npc.last_meal_tick = 0
+    npc.hp = 3
+    sim = new_simulator(world, "npc_sample")
+    changes = {}
+    last = None
+    for _ in range(60):
+        sim.tick()
+        state = (npc.hunger_stage, npc.hp, "dead" in npc.tags["dynamic"])
+        if state != last:
+            changes[sim.game_tick] = last = state
+    # Starvation bites every tick from STARVING_THRESHOLD; the death it causes is handled a tick later
+    assert changes == {
+        1: ("sated", 3, False),
+        20: ("hungry", 3, False),
+        40: ("starving", 2, False),
+        41: ("starving", 1, False),
+        42: ("starving", 0, False),
+        43: ("starving", 0, True),
+    }
+    assert not sim.hunger_events and not sim.event_queue
+
+
+def test_eating_resets_the_hunger_schedule(data_dir):
+    world = lone_npc_world(data_dir)
+    npc = world.get_npc("npc_sample")
+    npc.last_meal_tick = 0
+    sim = new_simulator(world, "npc_sample")
+    sim.advance_until(30)
+    assert npc.hunger_stage == "hungry"
+    npc.last_meal_tick = sim.game_tick
+    sim.schedule_hunger("npc_sample")
+    sim.advance_until(49)
+    assert npc.hunger_stage == "sated"
+    sim.advance_until(50)
+    assert npc.hunger_stage == "hungry"
+
+
+def test_registered_handlers_run_in_dispatch_order(world):
+    calls = []
+    shown = []
+    sim = Simulator(world, player_id="npc_sample", output=shown.append)
+    sim.register_event_handler(
+        "ring_bell",
+        apply=lambda event: calls.append("apply"),
+        narrate=lambda event: calls.append("narrate") or "The bell rings.",
+        react=lambda event: calls.append("react"),
+        perceive=lambda event: calls.append("perceive"),
+    )
+    sim.handle_event(Event("ring_bell", 0, "npc_sample"))
+    assert calls == ["apply", "react", "narrate", "perceive"] and shown == ["The bell rings."]
+    # Without handlers an event is still perceived; None in perceivers means nobody notices
+    sim.handle_event(Event("unheard_of", 0, "npc_sample"))
+    sim.handle_event(Event("wait", 0, "npc_sample", payload={"ticks": 1}))
+    assert [entry.event_type for entry in world.get_npc("npc_enemy").short_term_memory] == ["unheard_of"]
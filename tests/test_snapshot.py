@@ -0,0 +1,41 @@
+import pytest
+
+from benchmarks.worldgen import generate_world
+from engine.snapshot import SnapshotError, load_snapshot, save_snapshot
+
+from tests.helpers import world_dump
+
+
+def test_shipped_world_round_trip(world, tmp_path):
+    path = tmp_path / "world.snap"
+    save_snapshot(world, path)
+    loaded = load_snapshot(path, world.data_dir)
+    assert world_dump(loaded) == world_dump(world)
+    assert loaded.find_npc_location("npc_enemy") == "town_square"
+
+
+def test_generated_world_round_trip_shares_id_strings(tmp_path):
+    world = generate_world(40, 30, 60, seed=4)
+    path = tmp_path / "world.snap"
+    save_snapshot(world, path)
+    loaded = load_snapshot(path)
+    assert world_dump(loaded) == world_dump(world)
+    npc_id = next(iter(loaded.npcs))
+    location = loaded.locations_state[loaded.find_npc_location(npc_id)]
+    assert any(occupant is npc_id for occupant in location.occupants)
+
+
+def test_snapshot_to_json_and_back(world, tmp_path):
+    path = tmp_path / "world.snap"
+    save_snapshot(world, path)
+    loaded = load_snapshot(path)
+    loaded.write_json(tmp_path / "data")
+    save_snapshot(loaded, tmp_path / "again.snap")
+    assert (tmp_path / "again.snap").read_bytes() == path.read_bytes()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "world.snap"
+    path.write_bytes(b"not a snapshot at all")
+    with pytest.raises(SnapshotError):
+        load_snapshot(path)
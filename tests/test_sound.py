@@ -0,0 +1,84 @@
+import pytest
+
+from engine.data_models import NPC, LocationState, LocationStatic
+from engine.events import Event
+from engine.simulator import Simulator
+from engine.sound import NOISE_LEVELS, grade
+
+
+def add_room(world, loc_id, exits):
+    """Add ``loc_id`` joined to each room in ``exits`` (neighbour -> connection status)."""
+    world.locations_static[loc_id] = LocationStatic(loc_id, loc_id)
+    world.locations_state[loc_id] = LocationState(loc_id)
+    for direction, (neighbour, status) in zip(("n", "s", "e", "w"), exits.items()):
+        world.locations_static[loc_id].hex_connections[direction] = neighbour
+        world.locations_state[loc_id].connections_state[neighbour] = {"status": status}
+
+
+@pytest.fixture
+def rooms(world):
+    """The shipped world plus a few rooms joined by every kind of connection.
+
+    ``hall`` - ``room1`` - ``room2`` - ``room3`` in a line, ``hall`` - ``side``
+    through a closed door and ``hall`` - ``vault`` through a locked one.
+    """
+    add_room(world, "hall", {"room1": "open", "side": "closed", "vault": "locked"})
+    add_room(world, "room1", {"hall": "open", "room2": "open"})
+    add_room(world, "room2", {"room1": "open", "room3": "open"})
+    add_room(world, "room3", {"room2": "open"})
+    add_room(world, "side", {"hall": "closed"})
+    add_room(world, "vault", {"hall": "locked"})
+    return world
+
+
+def heard(world, loc_id, level):
+    return {loc: grade(intensity) for loc, intensity in world.sound.propagate(loc_id, NOISE_LEVELS[level])}
+
+
+def test_levels_carry_as_far_as_their_intensity(rooms):
+    assert heard(rooms, "hall", "normal") == {"hall": "normal"}
+    assert heard(rooms, "hall", "loud") == {"hall": "loud", "room1": "normal"}
+    # Two open hops, or one muffled hop through the closed door; never into the vault
+    assert heard(rooms, "hall", "scream") == {"hall": "loud", "room1": "loud", "room2": "normal", "side": "faint"}
+    assert heard(rooms, "vault", "scream") == {"vault": "loud"}
+
+
+def test_toggling_a_connection_drops_only_the_searches_that_reached_it(rooms):
+    # The door between room1 and room2 is worked from room1
+    rooms.get_location_state("town_square").occupants.remove("npc_sample")
+    rooms.get_location_state("room1").occupants.append("npc_sample")
+    rooms.rebuild_location_index()
+    keys = [("hall", "scream"), ("hall", "loud"), ("hall", "normal"), ("room3", "loud"), ("room3", "normal")]
+    before = {key: rooms.sound.propagate(key[0], NOISE_LEVELS[key[1]]) for key in keys}
+
+    rooms.apply_event(Event("close_connection", 1, "npc_sample", ["room2"]))
+    # Searches that reached room1 or room2 are recomputed, the others are still the cached tuples
+    kept = {key for key in keys if rooms.sound.propagate(key[0], NOISE_LEVELS[key[1]]) is before[key]}
+    assert kept == {("hall", "normal"), ("room3", "normal")}
+    assert heard(rooms, "hall", "scream") == {"hall": "loud", "room1": "loud", "side": "faint"}
+    assert heard(rooms, "room3", "loud") == {"room3": "loud", "room2": "normal"}
+
+    rooms.apply_event(Event("open_connection", 2, "npc_sample", ["room2"]))
+    assert heard(rooms, "hall", "scream") == {"hall": "loud", "room1": "loud", "room2": "normal", "side": "faint"}
+
+
+def test_listeners_at_one_level_share_a_perception(rooms):
+    placed = {"hall": ["npc_sample", "a", "b"], "room1": ["c"], "room2": ["d"], "side": ["e"], "vault": ["f"]}
+    rooms.get_location_state("town_square").occupants.clear()
+    for loc_id, npc_ids in placed.items():
+        for npc_id in npc_ids:
+            if npc_id not in rooms.npcs:
+                rooms.npcs[npc_id] = NPC(npc_id, npc_id, hp=10)
+            rooms.get_location_state(loc_id).occupants.append(npc_id)
+    rooms.rebuild_location_index()
+    sim = Simulator(rooms, output=None)
+    event = Event("scream", 1, "npc_sample", [], payload={"content": "help"})
+    sim.record_perception(event)
+    event.payload["content"] = "changed"
+
+    latest = {npc_id: rooms.get_npc(npc_id).short_term_memory.last(1) for npc_id in "abcdef"}
+    assert latest["f"] == [] and rooms.get_npc("npc_sample").short_term_memory.last(1) == []
+    (loud,), (normal,), (faint,) = latest["a"], latest["d"], latest["e"]
+    assert latest["b"][0] is loud and latest["c"][0] is loud
+    assert (loud.sound_level, normal.sound_level, faint.sound_level) == ("loud", "normal", "faint")
+    assert loud.payload is normal.payload and loud.payload == {"content": "help"}
@@ -0,0 +1,67 @@
+import pytest
+
+from engine import tools
+from engine.data_models import NPC
+from engine.simulator import Simulator
+from engine.vitals import VitalField, np
+from engine.world_state import WorldState
+
+from tests.helpers import world_dump
+
+BACKENDS = [False, True] if np is not None else [False]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_only_attached_npcs_read_the_table(data_dir, use_numpy):
+    world, other = WorldState(data_dir), WorldState(data_dir)
+    world.load()
+    other.load()
+    table = world.enable_vitals(use_numpy=use_numpy)
+    npc, twin = world.get_npc("npc_sample"), other.get_npc("npc_sample")
+    assert isinstance(type(npc).__dict__["hp"], VitalField) and isinstance(npc, NPC)
+    # The other world's NPCs and the class itself keep plain slots
+    assert type(twin) is NPC and not isinstance(NPC.__dict__["hp"], VitalField)
+    npc.hp = 3
+    assert table.columns["hp"][table.rows["npc_sample"]] == 3 and twin.hp == 10
+    other.enable_vitals(use_numpy=use_numpy)
+    other.disable_vitals()
+    assert npc.hp == 3 and npc._vitals is table
+    world.disable_vitals()
+    assert type(npc) is NPC and npc.hp == 3
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_table_answers_like_the_objects(world, use_numpy):
+    world.get_npc("npc_enemy").last_meal_tick = 15
+    world.get_npc("npc_sample").next_available_tick = 9
+    expected = (world.hunger_sweep(45), world.ready_actors(5))
+    world.enable_vitals(use_numpy=use_numpy)
+    try:
+        assert (world.hunger_sweep(45), world.ready_actors(5)) == expected
+        world.vitals.apply_damage(["npc_sample", "npc_sample"], [4, 4])
+        assert world.get_npc("npc_sample").hp == 2
+        world.vitals.heal(["npc_sample"], [100])
+        assert world.get_npc("npc_sample").hp == 10
+    finally:
+        world.disable_vitals()
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_simulation_runs_the_same_through_the_table(data_dir, use_numpy):
+    runs = []
+    for vitals in (False, True):
+        world = WorldState(data_dir)
+        world.load()
+        if vitals:
+            world.enable_vitals(use_numpy=use_numpy)
+        sim = Simulator(world, seed=1, player_id="npc_sample", output=None)
+        for name in tools.__all__:
+            sim.register_tool(getattr(tools, name)())
+        # Combat, starvation and resting all change hp through the apply handlers
+        sim.process_command("npc_sample", {"tool": "attack", "params": {"target_id": "npc_enemy"}})
+        sim.advance_until(10)
+        sim.process_command("npc_sample", {"tool": "rest", "params": {"ticks": 5}})
+        sim.advance_until(60)
+        world.disable_vitals()
+        runs.append(world_dump(world))
+    assert runs[0] == runs[1]